@@ -19,6 +19,16 @@ from music_streaming_client import (
     Playlist,
     create_music_client
 )
+from deadlines import DeadlineExceededError, run_with_deadline
+from response_cache import ResponseCache, CacheStats
+from client_metrics import ClientMetrics
+from bulk import BulkResult
+from protocol_router import ProtocolRouter
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from health_probe import ProbeResult
+from playlist_index import PlaylistIndex
+from library_graph import LibraryGraph, GraphDiff
+from latency_histogram import LatencyHistogram
 
 __version__ = "1.0.0"
 __author__ = "Music Manager Team"
@@ -29,4 +39,18 @@ __all__ = [
     "Music",
     "Playlist",
     "create_music_client",
+    "DeadlineExceededError",
+    "run_with_deadline",
+    "ResponseCache",
+    "CacheStats",
+    "ClientMetrics",
+    "BulkResult",
+    "ProtocolRouter",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ProbeResult",
+    "PlaylistIndex",
+    "LibraryGraph",
+    "GraphDiff",
+    "LatencyHistogram",
 ]
@@ -0,0 +1,66 @@
+"""
+Agendas de chegada para testes de carga em malha aberta
+Cada agenda gera os instantes (segundos desde o início) em que as
+requisições devem ser enviadas, independentemente das respostas
+"""
+
+import random
+from typing import Callable, Iterator, Optional, Sequence
+
+
+PATTERNS = ("fixed", "poisson", "step")
+
+
+def fixed_arrivals(rate: float, duration: float) -> Iterator[float]:
+    """Chegadas a intervalos constantes de ``1 / rate``"""
+    if rate <= 0:
+        return
+    interval = 1.0 / rate
+    count = int(duration * rate)
+    for index in range(count):
+        yield index * interval
+
+
+def poisson_arrivals(rate: float, duration: float, rng: Optional[random.Random] = None) -> Iterator[float]:
+    """Chegadas de Poisson: intervalos exponenciais com média ``1 / rate``"""
+    if rate <= 0:
+        return
+    expovariate = (rng or random).expovariate
+    offset = expovariate(rate)
+    while offset < duration:
+        yield offset
+        offset += expovariate(rate)
+
+
+def step_arrivals(
+    rates: Sequence[float],
+    step_duration: float,
+    arrivals: Callable[[float, float], Iterator[float]] = fixed_arrivals,
+) -> Iterator[float]:
+    """Degraus de taxa: ``rates[i]`` req/s durante ``step_duration`` segundos cada"""
+    for step, rate in enumerate(rates):
+        start = step * step_duration
+        for offset in arrivals(rate, step_duration):
+            yield start + offset
+
+
+def schedule(
+    pattern: str,
+    rate: float,
+    duration: float,
+    step_rates: Optional[Sequence[float]] = None,
+    rng: Optional[random.Random] = None,
+) -> Iterator[float]:
+    """Agenda do padrão ``pattern`` (fixed, poisson ou step)
+
+    No padrão ``step``, ``duration`` é dividida igualmente entre os degraus de
+    ``step_rates`` (padrão: 25%, 50%, 75% e 100% de ``rate``).
+    """
+    if pattern == "fixed":
+        return fixed_arrivals(rate, duration)
+    if pattern == "poisson":
+        return poisson_arrivals(rate, duration, rng)
+    if pattern == "step":
+        rates = list(step_rates or (rate * 0.25, rate * 0.5, rate * 0.75, rate))
+        return step_arrivals(rates, duration / len(rates))
+    raise ValueError(f"Padrão de chegada inválido: {pattern} (use {', '.join(PATTERNS)})")
@@ -0,0 +1,47 @@
+"""
+Benchmark de operações em lote: músicas de N playlists
+Compara o laço sequencial (um await por id) com list_musics_for_playlists
+"""
+import asyncio
+import sys
+import time
+
+from music_streaming_client import ClientConfig, MusicStreamingClient, STREAM_PROTOCOLS
+
+
+async def _measure(protocol: str, playlist_ids: range) -> None:
+    config = ClientConfig(soap_fast_path=True, coalesce_requests=False, graphql_batching=True)
+    async with MusicStreamingClient(config) as client:
+        await client.health_check(timeout=10)  # abrir as conexões antes da medição
+        method = getattr(client, {
+            "rest": "rest_list_playlist_musics",
+            "graphql": "graphql_list_playlist_musics",
+            "soap": "soap_list_musics_by_playlist",
+            "grpc": "grpc_list_playlist_musics",
+        }[protocol])
+
+        start = time.perf_counter()
+        for playlist_id in playlist_ids:
+            await method(playlist_id)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await client.list_musics_for_playlists(playlist_ids, protocol)
+        bulk = time.perf_counter() - start
+        errors = sum(not result.ok for result in results)
+
+    print(f"{protocol:<10} {sequential:>14.2f} {bulk:>10.2f} {sequential / bulk:>8.1f}x {errors:>7}")
+
+
+async def run_benchmark(playlists: int = 200) -> None:
+    print("\n" + "=" * 80)
+    print(f"🚀 BENCHMARK - OPERAÇÕES EM LOTE (músicas de {playlists} playlists)")
+    print("=" * 80)
+    print(f"\n{'Protocolo':<10} {'Sequencial (s)':>14} {'Lote (s)':>10} {'Ganho':>9} {'Erros':>7}")
+    print("-" * 54)
+    for protocol in STREAM_PROTOCOLS:
+        await _measure(protocol, range(1, playlists + 1))
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
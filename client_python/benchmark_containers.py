@@ -0,0 +1,83 @@
+"""
+Benchmark de contêineres de resultado: memória por linha e tempo de construção
+Compara dataclass com __dict__ (formato anterior), dataclass com __slots__ e colunar
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Iterator, Tuple
+
+import containers
+from music_streaming_client import Music
+
+
+@dataclass
+class DictMusic:
+    """Música no formato anterior (dataclass com __dict__)"""
+    id: int
+    name: str
+    artist: str
+
+
+def make_rows(count: int) -> Iterator[Tuple[int, str, str]]:
+    """Gerar linhas como chegariam do decodificador (strings novas a cada linha)"""
+    return ((i, f"Música {i}", "".join(("Artista ", str(i % 500)))) for i in range(count))
+
+
+def build_dict_dataclasses(rows):
+    return [DictMusic(*row) for row in rows]
+
+
+def build_slotted_dataclasses(rows):
+    sink = containers.ObjectRows(Music)
+    for row in rows:
+        sink.add(*row)
+    return sink.result()
+
+
+def build_columnar(rows):
+    sink = containers.MusicColumns(Music)
+    for row in rows:
+        sink.add(*row)
+    return sink.result()
+
+
+def measure(build: Callable, count: int) -> Tuple[float, float]:
+    """Retornar (bytes retidos por linha, incluindo strings, e µs por linha)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(make_rows(count))
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        build(make_rows(count))
+        best = min(best, time.perf_counter() - start)
+    return retained / count, best / count * 1e6
+
+
+def run_benchmark(count: int = 200_000) -> None:
+    print("\n" + "=" * 80)
+    print(f"🚀 BENCHMARK - CONTÊINERES DE RESULTADO ({count} músicas)")
+    print("=" * 80)
+
+    print(f"\n{'Formato':<28} {'Bytes/linha':>12} {'µs/linha':>10}")
+    print("-" * 52)
+    for name, build in (
+        ("dataclass (__dict__)", build_dict_dataclasses),
+        ("dataclass (__slots__)", build_slotted_dataclasses),
+        ("colunar", build_columnar),
+    ):
+        per_row, us = measure(build, count)
+        print(f"{name:<28} {per_row:>12.1f} {us:>10.3f}")
+    print("\nTempo inclui a geração das linhas de entrada, igual para os três formatos.")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,42 @@
+"""
+Benchmark de agrupamento GraphQL: playlists de N usuários buscadas em paralelo
+Compara uma requisição por id com o agrupamento em documentos com aliases
+"""
+import asyncio
+import sys
+import time
+from typing import Tuple
+
+from music_streaming_client import ClientConfig, MusicStreamingClient
+
+
+async def _measure(user_ids: range, batching: bool) -> Tuple[float, int]:
+    """Retornar (segundos, requisições HTTP) para buscar as playlists de todos os ids"""
+    config = ClientConfig(graphql_batching=batching, graphql_timeout=60000)
+    async with MusicStreamingClient(config) as client:
+        await client.graphql_list_all_users()  # abrir a conexão antes da medição
+        before = client.metrics.sent
+        start = time.perf_counter()
+        await asyncio.gather(*(client.graphql_list_user_playlists(user_id) for user_id in user_ids))
+        elapsed = time.perf_counter() - start
+        if batching:
+            requests = client.graphql_batcher.batches
+        else:
+            requests = client.metrics.sent - before
+    return elapsed, requests
+
+
+async def run_benchmark(users: int = 500) -> None:
+    print("\n" + "=" * 80)
+    print(f"🚀 BENCHMARK - AGRUPAMENTO GRAPHQL (playlists de {users} usuários)")
+    print("=" * 80)
+    print(f"\n{'Modo':<16} {'Requisições':>12} {'Tempo (s)':>10}")
+    print("-" * 40)
+    user_ids = range(1, users + 1)
+    for name, batching in (("uma por id", False), ("agrupado", True)):
+        elapsed, requests = await _measure(user_ids, batching)
+        print(f"{name:<16} {requests:>12} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
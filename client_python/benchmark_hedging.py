@@ -0,0 +1,51 @@
+"""
+Benchmark de hedge entre protocolos: latência de cauda de list_playlist_musics
+Compara o roteamento simples com o hedge disparado no p95 do protocolo principal
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+from music_streaming_client import ClientConfig, MusicStreamingClient
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _measure(calls: int, hedging: bool) -> None:
+    config = ClientConfig(soap_fast_path=True, coalesce_requests=False, hedging=hedging)
+    async with MusicStreamingClient(config) as client:
+        # Aquecer conexões e médias do roteador antes da medição
+        for playlist_id in range(1, 41):
+            await client.list_playlist_musics(playlist_id % 20 + 1)
+        client.metrics.reset()
+
+        latencies = []
+        for index in range(calls):
+            start = time.perf_counter()
+            await client.list_playlist_musics(index % 20 + 1)
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        metrics = client.metrics
+
+    name = "com hedge" if hedging else "sem hedge"
+    print(
+        f"{name:<10} {_percentile(latencies, 0.5):>8.1f} {_percentile(latencies, 0.95):>8.1f} "
+        f"{_percentile(latencies, 0.99):>8.1f} {latencies[-1]:>8.1f} {metrics.hedges_fired:>8} {metrics.hedges_won:>8}"
+    )
+
+
+async def run_benchmark(calls: int = 500) -> None:
+    print("\n" + "=" * 80)
+    print(f"🚀 BENCHMARK - HEDGE ENTRE PROTOCOLOS ({calls} chamadas de list_playlist_musics)")
+    print("=" * 80)
+    print(f"\n{'Modo':<10} {'p50 (ms)':>8} {'p95 (ms)':>8} {'p99 (ms)':>8} {'máx (ms)':>8} {'Hedges':>8} {'Venceu':>8}")
+    print("-" * 64)
+    for hedging in (False, True):
+        await _measure(calls, hedging)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
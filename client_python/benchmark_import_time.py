@@ -0,0 +1,78 @@
+"""
+Benchmark de tempo de importação por protocolo (python -X importtime)
+Mede o custo de importar o cliente e de carregar o transporte de cada protocolo
+"""
+import os
+import subprocess
+import sys
+from statistics import median
+from typing import Dict, List, Tuple
+
+
+# Código executado em um processo novo para cada cenário
+SCENARIOS: Dict[str, str] = {
+    "somente import": "import music_streaming_client",
+    "REST": (
+        "import asyncio, music_streaming_client as m\n"
+        "async def main():\n"
+        "    c = m.MusicStreamingClient(); c._get_rest_session(); await c.close()\n"
+        "asyncio.run(main())"
+    ),
+    "GraphQL": (
+        "import asyncio, music_streaming_client as m\n"
+        "async def main():\n"
+        "    c = m.MusicStreamingClient(); c._get_graphql_session(); await c.close()\n"
+        "asyncio.run(main())"
+    ),
+    "SOAP": (
+        "import asyncio, music_streaming_client as m\n"
+        "async def main():\n"
+        "    c = m.MusicStreamingClient(); c._get_soap_transport(); m.soap_fast.OPERATIONS; await c.close()\n"
+        "asyncio.run(main())"
+    ),
+    "gRPC": (
+        "import asyncio, music_streaming_client as m\n"
+        "async def main():\n"
+        "    c = m.MusicStreamingClient(); await c._initialize_grpc_clients(); await c.close()\n"
+        "asyncio.run(main())"
+    ),
+    "todos (eager)": "import aiohttp, httpx, zeep, lxml.etree, grpc, user_pb2_grpc, music_pb2_grpc, playlist_pb2_grpc",
+}
+
+
+def _run_importtime(code: str) -> Tuple[int, List[Tuple[int, str]]]:
+    """Executar código com -X importtime; retornar (total em µs, módulos por custo próprio)"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+    )
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules.append((int(self_us), name.strip()))
+    return sum(us for us, _ in modules), sorted(modules, reverse=True)
+
+
+def run_benchmark(repeat: int = 5, top: int = 5) -> None:
+    print("\n" + "=" * 80)
+    print("🚀 BENCHMARK - TEMPO DE IMPORTAÇÃO POR PROTOCOLO (-X importtime)")
+    print("=" * 80)
+    print(f"\n{'Cenário':<18} {'Mediana (ms)':>14} {'Módulos':>9}   Mais caros (self)")
+    print("-" * 80)
+
+    for name, code in SCENARIOS.items():
+        runs = [_run_importtime(code) for _ in range(repeat)]
+        total = median(us for us, _ in runs) / 1000
+        modules = runs[-1][1]
+        heaviest = ", ".join(f"{mod} {us / 1000:.1f}" for us, mod in modules[:top])
+        print(f"{name:<18} {total:>14.1f} {len(modules):>9}   {heaviest}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
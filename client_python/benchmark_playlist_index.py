@@ -0,0 +1,59 @@
+"""
+Benchmark do índice invertido música → playlists
+Compara a busca reversa no servidor (REST/GraphQL/SOAP) com a resposta local
+do índice montado pelo mesmo protocolo
+"""
+import asyncio
+import sys
+import time
+
+from music_streaming_client import ClientConfig, MusicStreamingClient
+
+
+_METHODS = {
+    "rest": "rest_list_playlists_by_music",
+    "graphql": "graphql_list_playlists_by_music",
+    "soap": "soap_list_playlists_by_music",
+}
+
+
+async def run_benchmark(musics: int = 50) -> None:
+    print("\n" + "=" * 80)
+    print(f"🚀 BENCHMARK - ÍNDICE MÚSICA → PLAYLISTS ({musics} buscas reversas)")
+    print("=" * 80)
+    config = ClientConfig(soap_fast_path=True, coalesce_requests=False, playlist_index_reads=True)
+    async with MusicStreamingClient(config) as client:
+        await client.health_check(timeout=10)  # abrir as conexões antes da medição
+        music_ids = range(1, musics + 1)
+
+        servidor = {}
+        for protocol, name in _METHODS.items():
+            method = getattr(client, name)
+            start = time.perf_counter()
+            try:
+                for music_id in music_ids:
+                    await method(music_id)
+            except Exception as error:
+                print(f"{protocol}: busca reversa indisponível no servidor ({error})")
+                continue
+            servidor[protocol] = (time.perf_counter() - start) / musics
+
+        print(f"\n{'Protocolo':<10} {'Montagem (ms)':>14} {'Servidor (µs)':>14} {'Índice (µs)':>12} {'Ganho':>10}")
+        print("-" * 65)
+        for protocol, remote in servidor.items():
+            # O índice só responde ao protocolo que o montou
+            start = time.perf_counter()
+            await client.build_playlist_index(protocol)
+            build = time.perf_counter() - start
+            method = getattr(client, _METHODS[protocol])
+            start = time.perf_counter()
+            for music_id in music_ids:
+                await method(music_id)
+            local = (time.perf_counter() - start) / musics
+            print(
+                f"{protocol:<10} {build * 1000:>14.1f} {remote * 1e6:>14.0f} {local * 1e6:>12.1f} {remote / local:>9.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
@@ -0,0 +1,146 @@
+"""
+Benchmark de decodificação SOAP: caminho zeep vs caminho rápido (iterparse)
+Decodifica respostas FindAll de músicas com 1k, 10k e 100k linhas
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+
+import httpx
+from zeep import Client as SoapClient
+from zeep.helpers import serialize_object
+
+import soap_fast
+from music_streaming_client import MusicStreamingClient, Music
+
+
+MUSIC_NS = "http://music.soap.manager/music"
+
+# WSDL tipado equivalente ao FindAll de músicas do servidor Go
+TYPED_WSDL = f"""<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://schemas.xmlsoap.org/wsdl/"
+             xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+             xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+             xmlns:tns="{MUSIC_NS}" targetNamespace="{MUSIC_NS}">
+  <types>
+    <xsd:schema targetNamespace="{MUSIC_NS}" elementFormDefault="qualified">
+      <xsd:complexType name="MusicSOAP">
+        <xsd:sequence>
+          <xsd:element name="id" type="xsd:int"/>
+          <xsd:element name="name" type="xsd:string"/>
+          <xsd:element name="artist" type="xsd:string"/>
+        </xsd:sequence>
+      </xsd:complexType>
+      <xsd:element name="FindAllMusicRequest"><xsd:complexType/></xsd:element>
+      <xsd:element name="FindAllMusicResponse">
+        <xsd:complexType>
+          <xsd:sequence>
+            <xsd:element name="musics" type="tns:MusicSOAP" minOccurs="0" maxOccurs="unbounded"/>
+          </xsd:sequence>
+        </xsd:complexType>
+      </xsd:element>
+    </xsd:schema>
+  </types>
+  <message name="FindAllMusicRequest"><part name="parameters" element="tns:FindAllMusicRequest"/></message>
+  <message name="FindAllMusicResponse"><part name="parameters" element="tns:FindAllMusicResponse"/></message>
+  <portType name="MusicServicePortType">
+    <operation name="FindAll">
+      <input message="tns:FindAllMusicRequest"/>
+      <output message="tns:FindAllMusicResponse"/>
+    </operation>
+  </portType>
+  <binding name="MusicServiceBinding" type="tns:MusicServicePortType">
+    <soap:binding transport="http://schemas.xmlsoap.org/soap/http"/>
+    <operation name="FindAll">
+      <soap:operation soapAction="FindAll"/>
+      <input><soap:body use="literal"/></input>
+      <output><soap:body use="literal"/></output>
+    </operation>
+  </binding>
+  <service name="MusicService">
+    <port name="MusicServicePort" binding="tns:MusicServiceBinding">
+      <soap:address location="http://localhost:8080/music"/>
+    </port>
+  </service>
+</definitions>"""
+
+
+def build_response(rows: int) -> bytes:
+    """Gerar resposta FindAll no formato do servidor Go"""
+    items = "".join(
+        f"<musics><id>{i}</id><name>Música {i}</name><artist>Artista {i % 500}</artist></musics>"
+        for i in range(1, rows + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"><soap:Body>'
+        f'<FindAllMusicResponse xmlns="{MUSIC_NS}">{items}</FindAllMusicResponse>'
+        "</soap:Body></soap:Envelope>"
+    ).encode()
+
+
+def make_zeep_decoder() -> Callable[[bytes], List[Music]]:
+    """Decodificador pelo caminho zeep: objeto genérico -> dicts -> dataclasses"""
+    with tempfile.NamedTemporaryFile("w", suffix=".wsdl", delete=False) as fh:
+        fh.write(TYPED_WSDL)
+    soap_client = SoapClient(fh.name)
+    os.unlink(fh.name)
+
+    binding = soap_client.service._binding
+    operation = binding.get("FindAll")
+    parser = MusicStreamingClient()
+
+    def decode(content: bytes) -> List[Music]:
+        response = httpx.Response(200, content=content, headers={"Content-Type": "text/xml; charset=utf-8"})
+        result = serialize_object(binding.process_reply(soap_client, operation, response), dict)
+        musics = []
+        for m in parser._parse_soap_response(result):
+            if isinstance(m, dict):
+                musics.append(Music(id=int(m.get("id", 0)), name=str(m.get("name", "")), artist=str(m.get("artist", ""))))
+        return musics
+
+    return decode
+
+
+def fast_decode(content: bytes) -> List[Music]:
+    """Decodificador pelo caminho rápido"""
+    return list(soap_fast.iter_rows(content, soap_fast.OPERATIONS[("music", "FindAll")], Music))
+
+
+def measure(decode: Callable[[bytes], List[Music]], content: bytes, repeat: int):
+    """Retornar (melhor tempo em ms, pico de memória em MB)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(content)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    decode(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024 / 1024
+
+
+def run_benchmark(sizes=(1_000, 10_000, 100_000)) -> None:
+    print("\n" + "=" * 80)
+    print("🚀 BENCHMARK - DECODIFICAÇÃO SOAP (FindAll de músicas)")
+    print("=" * 80)
+
+    zeep_decode = make_zeep_decoder()
+    print(f"\n{'Linhas':>8} {'zeep (ms)':>12} {'rápido (ms)':>12} {'Ganho':>8} {'zeep (MB)':>11} {'rápido (MB)':>12}")
+    print("-" * 70)
+    for rows in sizes:
+        content = build_response(rows)
+        assert zeep_decode(content) == fast_decode(content)
+        repeat = 5 if rows <= 10_000 else 2
+        zeep_ms, zeep_mb = measure(zeep_decode, content, repeat)
+        fast_ms, fast_mb = measure(fast_decode, content, repeat)
+        print(f"{rows:>8} {zeep_ms:>12.2f} {fast_ms:>12.2f} {zeep_ms / fast_ms:>7.1f}x {zeep_mb:>11.2f} {fast_mb:>12.2f}")
+
+
+if __name__ == "__main__":
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or (1_000, 10_000, 100_000)
+    run_benchmark(sizes)
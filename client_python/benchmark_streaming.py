@@ -0,0 +1,64 @@
+"""
+Benchmark de memória: listagem completa vs iteração incremental do catálogo
+Mede o pico de memória alocada (tracemalloc) ao percorrer todas as músicas
+"""
+import asyncio
+import sys
+import time
+import tracemalloc
+from typing import Tuple
+
+from music_streaming_client import ClientConfig, MusicStreamingClient, INCREMENTAL_PROTOCOLS, STREAM_PROTOCOLS
+
+
+def _config() -> ClientConfig:
+    # Catálogos grandes: timeouts folgados e SOAP pelo caminho rápido
+    return ClientConfig(
+        rest_timeout=120000,
+        graphql_timeout=120000,
+        soap_timeout=120000,
+        grpc_timeout=120000,
+        soap_fast_path=True,
+    )
+
+
+async def _measure(protocol: str, mode: str) -> Tuple[int, float, float]:
+    """Retornar (linhas, pico em MB, segundos) para um protocolo e modo"""
+    async with MusicStreamingClient(_config()) as client:
+        # Abrir as conexões antes da medição
+        await client.health_check(timeout=10)
+        tracemalloc.start()
+        start = time.perf_counter()
+        if mode == "lista":
+            count = len(await getattr(client, f"{protocol}_list_all_musics")())
+        else:
+            count = 0
+            async for _ in client.iter_all_musics(protocol):
+                count += 1
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return count, peak / 1e6, elapsed
+
+
+async def run_benchmark(protocols: Tuple[str, ...] = STREAM_PROTOCOLS) -> None:
+    print("\n" + "=" * 80)
+    print("🚀 BENCHMARK - LISTAGEM COMPLETA vs ITERAÇÃO INCREMENTAL (todas as músicas)")
+    print("=" * 80)
+    print(f"\n{'Protocolo':<10} {'Modo':<10} {'Linhas':>9} {'Pico (MB)':>11} {'Tempo (s)':>10}")
+    print("-" * 54)
+    for protocol in protocols:
+        for mode in ("lista", "iterador"):
+            count, peak, elapsed = await _measure(protocol, mode)
+            print(f"{protocol:<10} {mode:<10} {count:>9} {peak:>11.1f} {elapsed:>10.2f}")
+    print("\nTempos medidos com tracemalloc ativo (maiores que em uso normal).")
+    whole = [protocol for protocol in protocols if protocol not in INCREMENTAL_PROTOCOLS]
+    if whole:
+        print(
+            f"{', '.join(whole)}: sem RPC com streaming; o iterador recebe a resposta inteira "
+            "(o pico cresce com o catálogo) e só evita montar a lista."
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(tuple(sys.argv[1:]) or STREAM_PROTOCOLS))
@@ -0,0 +1,65 @@
+"""
+Benchmark de inicialização SOAP: cache de WSDL frio vs quente
+Mede o tempo para criar os três clientes SOAP (user, music, playlist)
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from statistics import mean, median
+from typing import List, Optional
+
+from music_streaming_client import MusicStreamingClient, ClientConfig
+
+
+async def _startup_time(cache_dir: Optional[str], offline: bool = False) -> float:
+    """Criar cliente novo, inicializar os três serviços SOAP e retornar o tempo (ms)"""
+    config = ClientConfig(
+        soap_wsdl_cache=cache_dir is not None,
+        soap_wsdl_cache_dir=cache_dir,
+        soap_wsdl_offline=offline,
+    )
+    client = MusicStreamingClient(config)
+    try:
+        start = time.perf_counter()
+        await client._initialize_soap_user_client()
+        await client._initialize_soap_music_client()
+        await client._initialize_soap_playlist_client()
+        return (time.perf_counter() - start) * 1000
+    finally:
+        await client.close()
+
+
+def _print_row(label: str, times: List[float]) -> None:
+    print(f"{label:<28} {mean(times):>10.2f} {median(times):>10.2f} {min(times):>10.2f} {max(times):>10.2f}")
+
+
+async def run_benchmark(iterations: int = 20) -> None:
+    print("\n" + "=" * 80)
+    print("🚀 BENCHMARK - INICIALIZAÇÃO SOAP (CACHE DE WSDL)")
+    print("=" * 80)
+
+    no_cache = [await _startup_time(None) for _ in range(iterations)]
+
+    cold = []
+    for _ in range(iterations):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(await _startup_time(cache_dir))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        await _startup_time(cache_dir)  # Popular o cache
+        warm = [await _startup_time(cache_dir) for _ in range(iterations)]
+        offline = [await _startup_time(cache_dir, offline=True) for _ in range(iterations)]
+
+    print(f"\n{'Cenário':<28} {'Média (ms)':>10} {'Mediana':>10} {'Min':>10} {'Max':>10}")
+    print("-" * 72)
+    _print_row("Sem cache", no_cache)
+    _print_row("Cache frio", cold)
+    _print_row("Cache quente", warm)
+    _print_row("Cache quente (offline)", offline)
+    print("-" * 72)
+    print(f"Ganho quente vs frio: {mean(cold) / mean(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
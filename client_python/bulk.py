@@ -0,0 +1,51 @@
+"""
+Operações em lote (fan-out) sobre listas de ids
+Executa uma busca por id com concorrência limitada, preservando a ordem dos
+ids e capturando o erro de cada um sem interromper os demais
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+
+@dataclass
+class BulkResult:
+    """Resultado de um id em uma operação em lote"""
+    __slots__ = ("id", "value", "error")
+
+    id: int
+    value: Any
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def fan_out(
+    ids: Sequence[int],
+    fetch: Callable[[int], Awaitable[Any]],
+    concurrency: int,
+) -> List[BulkResult]:
+    """Executar ``fetch(id)`` para cada id com no máximo ``concurrency`` chamadas em andamento
+
+    O resultado segue a ordem de ``ids``. Erros de um id ficam em
+    ``BulkResult.error``; cancelamento interrompe o lote inteiro.
+    """
+    if concurrency < 1:
+        raise ValueError("A concorrência do lote precisa ser pelo menos 1")
+    results: List[Optional[BulkResult]] = [None] * len(ids)
+    positions = iter(range(len(ids)))
+
+    async def worker() -> None:
+        # Os trabalhadores compartilham o iterador: cada posição é tomada uma vez
+        for index in positions:
+            ident = ids[index]
+            try:
+                results[index] = BulkResult(ident, await fetch(ident), None)
+            except Exception as error:
+                results[index] = BulkResult(ident, None, error)
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(ids)))))
+    return results
@@ -0,0 +1,156 @@
+"""
+Disjuntores (circuit breakers) por protocolo ou operação
+Com muitas falhas (ou chamadas lentas) recentes, o disjuntor abre e as
+chamadas falham na hora, sem esperar timeouts de um servidor fora do ar;
+depois de um tempo, algumas chamadas de teste decidem se ele fecha de novo
+"""
+
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ConnectionError):
+    """Chamada recusada sem ir ao servidor: disjuntor aberto"""
+
+    def __init__(self, message: str, name: str, retry_after: float):
+        super().__init__(message)
+        self.name = name
+        self.retry_after = retry_after  # segundos até o disjuntor aceitar chamadas de teste
+
+
+class CircuitBreaker:
+    """Disjuntor com janela deslizante das últimas ``window`` chamadas
+
+    - fechado: abre quando a janela tem pelo menos ``min_calls`` chamadas e a
+      fração de falhas chega a ``failure_ratio``. Com ``slow_call_threshold``,
+      chamadas mais lentas que ele (segundos) contam como falha;
+    - aberto: recusa tudo por ``open_seconds``;
+    - meio-aberto: deixa passar até ``half_open_calls`` chamadas de teste;
+      todas bem-sucedidas fecham o disjuntor, uma falha o reabre.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_ratio: float = 0.5,
+        min_calls: int = 10,
+        window: int = 20,
+        slow_call_threshold: Optional[float] = None,
+        open_seconds: float = 5.0,
+        half_open_calls: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < failure_ratio <= 1:
+            raise ValueError("failure_ratio deve estar em (0, 1]")
+        if window < 1 or min_calls < 1 or half_open_calls < 1:
+            raise ValueError("window, min_calls e half_open_calls precisam ser pelo menos 1")
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.min_calls = min(min_calls, window)
+        self.slow_call_threshold = slow_call_threshold
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._clock = clock
+        self._outcomes: deque = deque(maxlen=window)  # True = falha
+        self._failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0  # chamadas de teste liberadas no estado meio-aberto
+        self._trial_successes = 0
+        self.rejected = 0  # chamadas recusadas desde a criação
+        self.opened = 0  # vezes que o disjuntor abriu
+
+    @property
+    def state(self) -> str:
+        """Estado atual (um disjuntor aberto passa a meio-aberto após ``open_seconds``)"""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._half_open()
+        return self._state
+
+    def before_call(self) -> None:
+        """Liberar a chamada ou lançar CircuitOpenError"""
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._trials < self.half_open_calls:
+            self._trials += 1
+            return
+        self.rejected += 1
+        retry_after = max(0.0, self.open_seconds - (self._clock() - self._opened_at)) if state == OPEN else 0.0
+        raise CircuitOpenError(f"Disjuntor {self.name} aberto", self.name, retry_after)
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Registrar o resultado de uma chamada liberada por ``before_call``"""
+        failed = not ok or (self.slow_call_threshold is not None and latency > self.slow_call_threshold)
+        if self._state == HALF_OPEN:
+            if failed:
+                self._open()
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self.half_open_calls:
+                self._close()
+            return
+        if self._state == OPEN:
+            return  # chamada iniciada antes de abrir
+
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failed)
+        self._failures += failed
+        if len(self._outcomes) >= self.min_calls and self._failures >= self.failure_ratio * len(self._outcomes):
+            self._open()
+
+    def record_probe(self, ok: bool) -> None:
+        """Considerar o resultado de uma sondagem de saúde do servidor
+
+        Uma sondagem com sucesso antecipa o estado meio-aberto (as chamadas de
+        teste ainda decidem se o disjuntor fecha); uma falha conta como falha
+        da janela, reabre o meio-aberto e prolonga o aberto.
+        """
+        state = self.state
+        if ok:
+            if state == OPEN:
+                self._half_open()
+        elif state == OPEN:
+            self._opened_at = self._clock()
+        else:
+            self.record(0.0, False)
+
+    def release(self) -> None:
+        """Devolver a vaga de uma chamada liberada que não terminou (cancelada)"""
+        if self._state == HALF_OPEN and self._trials > self._trial_successes:
+            self._trials -= 1
+
+    def reset(self) -> None:
+        """Fechar o disjuntor e esquecer o histórico"""
+        self._close()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.opened += 1
+
+    def _half_open(self) -> None:
+        self._state = HALF_OPEN
+        self._trials = 0
+        self._trial_successes = 0
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._failures = 0
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "state": self.state,
+            "failure_ratio": self._failures / len(self._outcomes) if self._outcomes else 0.0,
+            "calls": len(self._outcomes),
+            "rejected": self.rejected,
+            "opened": self.opened,
+        }
@@ -280,7 +280,10 @@ class MusicStreamingCLI:
 async def main():
     """Função principal"""
     cli = MusicStreamingCLI()
-    await cli.run()
+    try:
+        await cli.run()
+    finally:
+        await cli.client.close()
 
 
 if __name__ == "__main__":
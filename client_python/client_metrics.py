@@ -0,0 +1,32 @@
+"""
+Métricas do cliente
+Contadores de como as leituras foram atendidas (servidor, cache,
+requisição idêntica já em andamento ou hedge entre protocolos)
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict
+
+
+@dataclass
+class ClientMetrics:
+    """Contadores acumulados desde a criação do cliente"""
+    reads: int = 0  # chamadas de leitura recebidas
+    sent: int = 0  # leituras enviadas ao servidor
+    cache_hits: int = 0  # leituras atendidas pelo cache de respostas
+    coalesced: int = 0  # leituras que aguardaram uma requisição idêntica em andamento
+    coalesced_retries: int = 0  # refeitas após o prazo do chamador original esgotar
+    max_coalesced: int = 0  # maior número de chamadores em uma mesma requisição
+    hedges_fired: int = 0  # chamadas roteadas que dispararam um segundo protocolo
+    hedges_won: int = 0  # hedges em que o segundo protocolo respondeu primeiro
+    breaker_rejected: int = 0  # chamadas recusadas por disjuntor aberto
+    index_hits: int = 0  # buscas reversas respondidas pelo índice de playlists
+    graph_hits: int = 0  # leituras respondidas pelo grafo da biblioteca
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+    def reset(self) -> None:
+        """Zerar todos os contadores"""
+        for name in self.__dataclass_fields__:
+            setattr(self, name, 0)
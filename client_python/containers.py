@@ -0,0 +1,159 @@
+"""
+Contêineres de resultado para operações de listagem
+ObjectRows gera uma lista de dataclasses; os tipos colunares guardam ids em
+array e strings em listas, sem um objeto por linha. Só colunas com valores
+repetidos (artista) são internadas; internar nomes únicos custa mais do que economiza
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from operator import attrgetter, itemgetter
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+
+_intern = sys.intern
+
+
+class _RowSink(ABC):
+    """Interface comum: ``add`` por linha e atalhos para dicts/mensagens"""
+
+    __slots__ = ("row_type", "_field_names")
+
+    def __init__(self, row_type: type):
+        self.row_type = row_type
+        self._field_names = tuple(row_type.__dataclass_fields__)
+
+    @abstractmethod
+    def add(self, *values: Any) -> None:
+        """Adicionar uma linha com os valores na ordem dos campos"""
+
+    def add_dicts(self, items: Iterable[dict]) -> None:
+        """Adicionar linhas a partir de dicts (JSON REST/GraphQL)"""
+        add = self.add
+        get = itemgetter(*self._field_names)
+        for item in items:
+            add(*get(item))
+
+    def add_objects(self, items: Iterable[Any]) -> None:
+        """Adicionar linhas a partir de objetos com atributos (mensagens protobuf)"""
+        add = self.add
+        get = attrgetter(*self._field_names)
+        for item in items:
+            add(*get(item))
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Resultado entregue ao chamador"""
+
+
+class ObjectRows(_RowSink):
+    """Resultado como lista de dataclasses (formato padrão)"""
+
+    __slots__ = ("rows",)
+
+    def __init__(self, row_type: type):
+        super().__init__(row_type)
+        self.rows: List[Any] = []
+
+    def add(self, *values: Any) -> None:
+        self.rows.append(self.row_type(*values))
+
+    def result(self) -> List[Any]:
+        return self.rows
+
+
+class ColumnarRows(_RowSink):
+    """Base dos resultados colunares
+
+    Comporta-se como uma sequência somente leitura: indexar, iterar ou fatiar
+    materializa as linhas como dataclasses sob demanda.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def columns(self) -> Sequence[Sequence[Any]]:
+        """Colunas na ordem dos campos do dataclass"""
+
+    def result(self) -> "ColumnarRows":
+        return self
+
+    def __len__(self) -> int:
+        return len(self.columns()[0])
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.row_type, *self.columns())
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.row_type(*values) for values in zip(*(column[index] for column in self.columns()))]
+        return self.row_type(*(column[index] for column in self.columns()))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ColumnarRows):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} linhas)"
+
+
+class UserColumns(ColumnarRows):
+    """Usuários em colunas: ids/ages em array, nomes em lista"""
+
+    __slots__ = ("ids", "names", "ages")
+
+    def __init__(self, row_type: type):
+        super().__init__(row_type)
+        self.ids = array("q")
+        self.names: List[str] = []
+        self.ages = array("q")
+
+    def add(self, id: int, name: str, age: int) -> None:
+        self.ids.append(id)
+        self.names.append(name)
+        self.ages.append(age)
+
+    def columns(self) -> Sequence[Sequence[Any]]:
+        return (self.ids, self.names, self.ages)
+
+
+class MusicColumns(ColumnarRows):
+    """Músicas em colunas: ids em array, nomes em lista, artistas internados"""
+
+    __slots__ = ("ids", "names", "artists")
+
+    def __init__(self, row_type: type):
+        super().__init__(row_type)
+        self.ids = array("q")
+        self.names: List[str] = []
+        self.artists: List[Optional[str]] = []
+
+    def add(self, id: int, name: str, artist: Optional[str]) -> None:
+        self.ids.append(id)
+        self.names.append(name)
+        self.artists.append(_intern(artist) if artist is not None else None)
+
+    def columns(self) -> Sequence[Sequence[Any]]:
+        return (self.ids, self.names, self.artists)
+
+
+class PlaylistColumns(ColumnarRows):
+    """Playlists em colunas: ids em array, nomes em lista"""
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self, row_type: type):
+        super().__init__(row_type)
+        self.ids = array("q")
+        self.names: List[str] = []
+
+    def add(self, id: int, name: str) -> None:
+        self.ids.append(id)
+        self.names.append(name)
+
+    def columns(self) -> Sequence[Sequence[Any]]:
+        return (self.ids, self.names)
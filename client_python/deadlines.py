@@ -0,0 +1,68 @@
+"""
+Prazos (deadlines) para chamadas do cliente
+Um prazo global, definido para uma operação composta, limita o timeout de
+cada sub-chamada feita dentro dela, em qualquer protocolo
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# Instante absoluto (time.monotonic) em que o prazo atual expira
+_deadline: ContextVar[Optional[float]] = ContextVar("music_client_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Prazo esgotado antes da resposta (distinto das demais falhas)"""
+
+    def __init__(self, message: str, protocol: Optional[str] = None, operation: Optional[str] = None):
+        super().__init__(message)
+        self.protocol = protocol
+        self.operation = operation
+
+
+def remaining() -> Optional[float]:
+    """Segundos restantes do prazo atual (None se não houver prazo)"""
+    absolute = _deadline.get()
+    if absolute is None:
+        return None
+    return absolute - time.monotonic()
+
+
+def share(steps_left: int) -> Optional[float]:
+    """Parcela do prazo restante para o próximo de ``steps_left`` passos sequenciais"""
+    left = remaining()
+    if left is None:
+        return None
+    return max(left, 0.0) / max(steps_left, 1)
+
+
+async def run_with_deadline(awaitable: Awaitable[T], seconds: Optional[float], operation: str = "operação") -> T:
+    """Executar ``awaitable`` com prazo global de ``seconds``
+
+    O prazo vale para todas as sub-chamadas (inclusive aninhadas, que nunca
+    ultrapassam o prazo externo). Ao expirar, o trabalho pendente é cancelado
+    e ``DeadlineExceededError`` é lançado.
+    """
+    if seconds is None:
+        return await awaitable
+
+    now = time.monotonic()
+    absolute = now + seconds
+    parent = _deadline.get()
+    if parent is not None:
+        absolute = min(absolute, parent)
+
+    token = _deadline.set(absolute)
+    try:
+        return await asyncio.wait_for(awaitable, max(absolute - now, 0.0))
+    except DeadlineExceededError:
+        raise
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError(f"Prazo de {seconds:.3f}s esgotado em {operation}", operation=operation) from None
+    finally:
+        _deadline.reset(token)
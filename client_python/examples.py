@@ -36,6 +36,8 @@ async def example_rest():
 
     except Exception as error:
         print(f"   ❌ Erro: {error}")
+    finally:
+        await client.close()
 
 
 async def example_graphql():
@@ -67,6 +69,8 @@ async def example_graphql():
 
     except Exception as error:
         print(f"   ❌ Erro: {error}")
+    finally:
+        await client.close()
 
 
 async def example_soap():
@@ -98,6 +102,8 @@ async def example_soap():
 
     except Exception as error:
         print(f"   ❌ Erro: {error}")
+    finally:
+        await client.close()
 
 
 async def example_grpc():
@@ -129,6 +135,8 @@ async def example_grpc():
 
     except Exception as error:
         print(f"   ❌ Erro: {error}")
+    finally:
+        await client.close()
 
 
 async def example_health_check():
@@ -151,6 +159,8 @@ async def example_health_check():
 
     except Exception as error:
         print(f"\n❌ Erro ao verificar saúde dos endpoints: {error}")
+    finally:
+        await client.close()
 
 
 async def example_complete_workflow():
@@ -189,6 +199,8 @@ async def example_complete_workflow():
 
     except Exception as error:
         print(f"\n❌ Erro durante fluxo: {error}")
+    finally:
+        await client.close()
 
 
 async def main():
@@ -0,0 +1,117 @@
+"""
+Agrupamento de buscas GraphQL por id (estilo DataLoader)
+Buscas feitas em uma mesma iteração do event loop são enviadas como um único
+documento, com um campo com alias por id (``b0: user(id: $b0) { ... }``)
+"""
+
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+# (campo raiz, seleção, id)
+_Key = Tuple[str, str, int]
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    # Quem desistiu de esperar (prazo) não lê o erro; evitar aviso do asyncio
+    if not future.cancelled():
+        future.exception()
+
+
+class GraphQLBatcher:
+    """Agrupador de buscas ``campo(id:)``
+
+    ``execute(query, variables)`` envia o documento e retorna a resposta
+    completa (``data`` e ``errors``). Erros com ``path`` afetam só o alias
+    correspondente; os demais falham o lote inteiro.
+    """
+
+    def __init__(self, execute: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]], max_batch_size: int = 100):
+        if max_batch_size < 1:
+            raise ValueError("O lote GraphQL precisa de pelo menos uma busca")
+        self._execute = execute
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[_Key, asyncio.Future] = {}
+        self._scheduled = False
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0  # documentos enviados
+        self.lookups = 0  # buscas distintas enviadas nos lotes
+
+    def load(self, field: str, ident: int, selection: str) -> asyncio.Future:
+        """Agendar a busca e retornar o future com o objeto (ou None)
+
+        Buscas iguais na mesma iteração compartilham o future.
+        """
+        key = (field, selection, int(ident))
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            future.add_done_callback(_consume_exception)
+            self._pending[key] = future
+            if not self._scheduled:
+                self._scheduled = True
+                # Contexto vazio: o lote não herda o prazo de quem chegou primeiro
+                loop.call_soon(self._dispatch, context=contextvars.Context())
+        return future
+
+    def _dispatch(self) -> None:
+        """Enviar as buscas acumuladas, em lotes de até ``max_batch_size``"""
+        pending = list(self._pending.items())
+        self._pending = {}
+        self._scheduled = False
+        for start in range(0, len(pending), self.max_batch_size):
+            task = asyncio.ensure_future(self._run(pending[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def build_document(keys: List[_Key]) -> Tuple[str, Dict[str, Any]]:
+        """Montar o documento com aliases ``b0..bN`` e suas variáveis"""
+        params = []
+        fields = []
+        variables = {}
+        for index, (field, selection, ident) in enumerate(keys):
+            alias = f"b{index}"
+            params.append(f"${alias}: Int!")
+            fields.append(f"{alias}: {field}(id: ${alias}) {{ {selection} }}")
+            variables[alias] = ident
+        return f"query Batch({', '.join(params)}) {{ {' '.join(fields)} }}", variables
+
+    async def _run(self, batch: List[Tuple[_Key, asyncio.Future]]) -> None:
+        query, variables = self.build_document([key for key, _ in batch])
+        self.batches += 1
+        self.lookups += len(batch)
+        try:
+            response = await self._execute(query, variables)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        failed: Dict[str, Exception] = {}
+        batch_error: Optional[Exception] = None
+        for error in response.get("errors") or []:
+            exception = Exception(f"GraphQL error: {error.get('message')}")
+            path = error.get("path") or []
+            if path:
+                failed.setdefault(str(path[0]), exception)
+            elif batch_error is None:
+                batch_error = exception
+
+        data = response.get("data") or {}
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            alias = f"b{index}"
+            error = failed.get(alias) or batch_error
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(data.get(alias))
@@ -0,0 +1,128 @@
+"""
+Pool de canais gRPC assíncronos
+Distribui as chamadas entre N conexões HTTP/2 para contornar o limite de
+streams concorrentes e o controle de fluxo por conexão
+"""
+
+import asyncio
+import itertools
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import grpc
+import grpc.aio
+
+
+STRATEGIES = ("round_robin", "least_outstanding")
+
+
+def build_channel_options(
+    keepalive_time_ms: Optional[int] = None,
+    keepalive_timeout_ms: Optional[int] = None,
+    max_message_bytes: Optional[int] = None,
+    initial_window_size: Optional[int] = None,
+) -> List[Tuple[str, Any]]:
+    """Montar opções de canal gRPC a partir da configuração"""
+    # Cada canal usa seu próprio pool de subcanais; sem isso canais com os
+    # mesmos argumentos compartilham a mesma conexão TCP
+    options: List[Tuple[str, Any]] = [("grpc.use_local_subchannel_pool", 1)]
+    if keepalive_time_ms:
+        options.append(("grpc.keepalive_time_ms", keepalive_time_ms))
+        options.append(("grpc.keepalive_permit_without_calls", 1))
+        options.append(("grpc.http2.max_pings_without_data", 0))
+    if keepalive_timeout_ms:
+        options.append(("grpc.keepalive_timeout_ms", keepalive_timeout_ms))
+    if max_message_bytes:
+        options.append(("grpc.max_receive_message_length", max_message_bytes))
+        options.append(("grpc.max_send_message_length", max_message_bytes))
+    if initial_window_size:
+        # Janela fixa: desativar o BDP probe, que redimensionaria a janela
+        options.append(("grpc.http2.lookahead_bytes", initial_window_size))
+        options.append(("grpc.http2.bdp_probe", 0))
+    return options
+
+
+class _PooledChannel:
+    """Canal do pool com seus stubs e contador de chamadas em andamento"""
+
+    __slots__ = ("channel", "stubs", "raw_methods", "outstanding")
+
+    def __init__(self, channel: grpc.aio.Channel, stub_factories: Dict[str, Callable[[Any], Any]]):
+        self.channel = channel
+        self.stubs = {name: factory(channel) for name, factory in stub_factories.items()}
+        self.raw_methods: Dict[str, Any] = {}
+        self.outstanding = 0
+
+    def raw_method(self, path: str, request_serializer: Callable[[Any], bytes]) -> Any:
+        """RPC unária cuja resposta chega como bytes (sem desserializar)"""
+        method = self.raw_methods.get(path)
+        if method is None:
+            method = self.channel.unary_unary(path, request_serializer=request_serializer)
+            self.raw_methods[path] = method
+        return method
+
+
+class GrpcChannelPool:
+    """Pool de N canais grpc.aio com seleção round-robin ou por menor carga"""
+
+    def __init__(
+        self,
+        target: str,
+        stub_factories: Dict[str, Callable[[Any], Any]],
+        size: int = 1,
+        strategy: str = "round_robin",
+        options: Optional[Sequence[Tuple[str, Any]]] = None,
+    ):
+        """Criar os canais do pool"""
+        if size < 1:
+            raise ValueError("O pool gRPC precisa de pelo menos um canal")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estratégia de pool gRPC inválida: {strategy} (use {', '.join(STRATEGIES)})")
+
+        self.target = target
+        self.strategy = strategy
+        self.channels = [
+            _PooledChannel(grpc.aio.insecure_channel(target, options=list(options or [])), stub_factories)
+            for _ in range(size)
+        ]
+        self._round_robin = itertools.cycle(self.channels)
+
+    def _select(self) -> _PooledChannel:
+        """Escolher canal conforme a estratégia"""
+        if self.strategy == "least_outstanding":
+            return min(self.channels, key=lambda pooled: pooled.outstanding)
+        return next(self._round_robin)
+
+    @contextmanager
+    def acquire(self, service: str) -> Iterator[Any]:
+        """Obter stub de um serviço, contabilizando a chamada no canal escolhido"""
+        pooled = self._select()
+        pooled.outstanding += 1
+        try:
+            yield pooled.stubs[service]
+        finally:
+            pooled.outstanding -= 1
+
+    @contextmanager
+    def acquire_raw(self, path: str, request_serializer: Callable[[Any], bytes]) -> Iterator[Any]:
+        """Como ``acquire``, mas para a RPC ``path`` com resposta em bytes brutos"""
+        pooled = self._select()
+        pooled.outstanding += 1
+        try:
+            yield pooled.raw_method(path, request_serializer)
+        finally:
+            pooled.outstanding -= 1
+
+    async def ready(self) -> None:
+        """Aguardar todos os canais ficarem prontos (conectados)"""
+        await asyncio.gather(*(pooled.channel.channel_ready() for pooled in self.channels))
+
+    @property
+    def outstanding(self) -> List[int]:
+        """Chamadas em andamento por canal"""
+        return [pooled.outstanding for pooled in self.channels]
+
+    async def close(self) -> None:
+        """Fechar todos os canais"""
+        for pooled in self.channels:
+            await pooled.channel.close()
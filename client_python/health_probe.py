@@ -0,0 +1,74 @@
+"""
+Sondagens leves de saúde dos protocolos
+Resultado de cada sondagem (com latência) e execução periódica em segundo
+plano
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+
+@dataclass
+class ProbeResult:
+    """Resultado da sondagem de um protocolo"""
+    __slots__ = ("protocol", "ok", "latency", "error")
+
+    protocol: str
+    ok: bool
+    latency: float  # segundos até a resposta (ou até a falha)
+    error: Optional[str]
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "ok": self.ok,
+            "latency_ms": self.latency * 1000,
+            "error": self.error,
+        }
+
+
+class PeriodicProber:
+    """Executar ``probe()`` a cada ``interval`` segundos em uma tarefa própria
+
+    O último resultado fica em ``last``. Erros de uma rodada não interrompem
+    as seguintes.
+    """
+
+    def __init__(self, probe: Callable[[], Awaitable[Dict[str, ProbeResult]]], interval: float):
+        if interval <= 0:
+            raise ValueError("O intervalo de sondagem precisa ser positivo")
+        self._probe = probe
+        self.interval = interval
+        self.last: Dict[str, ProbeResult] = {}
+        self.rounds = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Iniciar as sondagens (sem efeito se já estiverem rodando)"""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Parar as sondagens e aguardar a tarefa terminar"""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            try:
+                self.last = await self._probe()
+                self.rounds += 1
+            except Exception as error:
+                print(f"Erro na sondagem periódica: {error}")
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
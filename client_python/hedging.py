@@ -0,0 +1,84 @@
+"""
+Requisições com hedge entre protocolos
+Se a chamada principal não termina até o atraso (ex.: p95 observado), a mesma
+operação é enviada por um segundo protocolo; vale o primeiro resultado e a
+outra chamada é cancelada
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class HedgeBudget:
+    """Limite de hedges como fração das chamadas elegíveis
+
+    Cada chamada acumula ``ratio`` de crédito (até ``burst``); cada hedge
+    gasta um crédito. Com ``ratio=0.1``, no máximo ~10% das chamadas duplicam
+    a carga nos servidores.
+    """
+
+    def __init__(self, ratio: float = 0.1, burst: float = 10.0):
+        if ratio < 0 or burst < 1:
+            raise ValueError("Orçamento de hedge inválido (ratio >= 0 e burst >= 1)")
+        self.ratio = ratio
+        self.burst = burst
+        self._credit = burst
+
+    def deposit(self) -> None:
+        """Creditar uma chamada elegível"""
+        self._credit = min(self.burst, self._credit + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Consumir um crédito, se houver"""
+        if self._credit < 1:
+            return False
+        self._credit -= 1
+        return True
+
+
+async def _cancel(task: asyncio.Future) -> None:
+    if not task.done():
+        task.cancel()
+        try:
+            await task
+        except BaseException:
+            pass
+
+
+async def hedge(
+    primary: Callable[[], Awaitable[T]],
+    secondary: Callable[[], Awaitable[T]],
+    delay: float,
+    budget: Optional[HedgeBudget] = None,
+) -> Tuple[T, bool]:
+    """Executar ``primary()`` e, se passar de ``delay`` segundos, também ``secondary()``
+
+    Retorna ``(resultado, hedge_venceu)``. Se a principal falhar antes do
+    atraso, o erro propaga sem disparar o hedge; depois de disparado, um erro
+    só propaga se as duas chamadas falharem.
+    """
+    first = asyncio.ensure_future(primary())
+    try:
+        done, _ = await asyncio.wait((first,), timeout=delay)
+        if done or (budget is not None and not budget.withdraw()):
+            return await first, False
+
+        second = asyncio.ensure_future(secondary())
+        try:
+            pending = {first, second}
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Preferir o sucesso; com as duas prontas ao mesmo tempo, a principal
+                for task in sorted(done, key=lambda task: task is second):
+                    if task.exception() is None:
+                        return task.result(), task is second
+                    error = task.exception()
+            raise error
+        finally:
+            await _cancel(second)
+    finally:
+        await _cancel(first)
@@ -0,0 +1,204 @@
+"""
+Histograma de latências com baldes logarítmicos (estilo HdrHistogram)
+Memória limitada independente do número de amostras (só os baldes usados
+são guardados), precisão relativa configurável (dígitos significativos),
+mesclável entre processos e serializável em poucos bytes
+"""
+
+import math
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterator, Tuple
+
+
+_HEADER = struct.Struct("<4sBQQQqqQ")
+_MAGIC = b"MHL1"
+
+
+class LatencyHistogram:
+    """Contagens de valores inteiros (ex.: nanossegundos de ``perf_counter_ns``)
+
+    Valores entre ``lowest`` e ``highest`` são registrados com erro relativo
+    de no máximo ``10 ** -significant_digits``; valores maiores caem no
+    último balde (e continuam exatos em ``max``). Mínimo, máximo e soma são
+    exatos. As contagens ficam em um dict por índice de balde: o número de
+    baldes é fixo (``bucket_limit``), mas só os usados ocupam memória, o que
+    permite um histograma por usuário virtual.
+    """
+
+    def __init__(self, lowest: int = 1, highest: int = 3_600_000_000_000, significant_digits: int = 3):
+        if lowest < 1 or highest < 2 * lowest:
+            raise ValueError("Faixa do histograma inválida (lowest >= 1 e highest >= 2 * lowest)")
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits deve estar entre 1 e 5")
+        self.lowest = lowest
+        self.highest = highest
+        self.significant_digits = significant_digits
+
+        self._unit_magnitude = int(math.floor(math.log2(lowest)))
+        sub_bucket_count_magnitude = int(math.ceil(math.log2(2 * 10 ** significant_digits)))
+        self._sub_bucket_half_count_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self._sub_bucket_count = 1 << (self._sub_bucket_half_count_magnitude + 1)
+        self._sub_bucket_half_count = self._sub_bucket_count // 2
+        self._sub_bucket_mask = (self._sub_bucket_count - 1) << self._unit_magnitude
+
+        smallest_untrackable = self._sub_bucket_count << self._unit_magnitude
+        bucket_count = 1
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self.bucket_limit = (bucket_count + 1) * self._sub_bucket_half_count
+        self._counts: Dict[int, int] = {}
+
+        self.count = 0
+        self.total = 0  # soma exata dos valores registrados
+        self.min = 0
+        self.max = 0
+
+    # ==================== Registro ====================
+
+    def _index(self, value: int) -> int:
+        pow2_ceiling = (value | self._sub_bucket_mask).bit_length()
+        bucket_index = pow2_ceiling - self._unit_magnitude - (self._sub_bucket_half_count_magnitude + 1)
+        sub_bucket_index = value >> (bucket_index + self._unit_magnitude)
+        return ((bucket_index + 1) << self._sub_bucket_half_count_magnitude) + sub_bucket_index - self._sub_bucket_half_count
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Registrar ``count`` ocorrências do valor"""
+        value = int(value)
+        if value < 0:
+            value = 0
+        index = min(self._index(value), self.bucket_limit - 1)
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + count
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += count
+        self.total += value * count
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Somar as contagens de outro histograma com a mesma configuração"""
+        if (other.lowest, other.highest, other.significant_digits) != (
+            self.lowest, self.highest, self.significant_digits
+        ):
+            raise ValueError("Só é possível mesclar histogramas com a mesma faixa e precisão")
+        if other.count == 0:
+            return self
+        counts = self._counts
+        for index, count in other._counts.items():
+            counts[index] = counts.get(index, 0) + count
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+        return self
+
+    def reset(self) -> None:
+        """Zerar contagens"""
+        self._counts = {}
+        self.count = self.total = self.min = self.max = 0
+
+    # ==================== Consulta ====================
+
+    def _value_from_index(self, index: int) -> int:
+        bucket_index = (index >> self._sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self._sub_bucket_half_count
+            bucket_index = 0
+        return sub_bucket_index << (bucket_index + self._unit_magnitude)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Maior valor que cai no mesmo balde do índice"""
+        bucket_index = max(0, (index >> self._sub_bucket_half_count_magnitude) - 1)
+        return self._value_from_index(index) + (1 << (bucket_index + self._unit_magnitude)) - 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Valor no percentil (0-100): o menor valor com ao menos essa fração das amostras até ele"""
+        if self.count == 0:
+            return 0
+        if percentile >= 100:
+            return self.max
+        target = max(1, math.ceil(percentile / 100 * self.count))
+        cumulative = 0
+        for index in sorted(self._counts):
+            cumulative += self._counts[index]
+            if cumulative >= target:
+                return max(self.min, min(self._highest_equivalent(index), self.max))
+        return self.max
+
+    def percentiles(self, *percentiles: float) -> Dict[float, int]:
+        """Vários percentis em uma passada pelas contagens"""
+        result: Dict[float, int] = {}
+        if self.count == 0:
+            return {percentile: 0 for percentile in percentiles}
+        targets = sorted((max(1, math.ceil(p / 100 * self.count)), p) for p in percentiles if p < 100)
+        for percentile in percentiles:
+            if percentile >= 100:
+                result[percentile] = self.max
+        position = 0
+        cumulative = 0
+        for index in sorted(self._counts):
+            cumulative += self._counts[index]
+            while position < len(targets) and cumulative >= targets[position][0]:
+                result[targets[position][1]] = max(self.min, min(self._highest_equivalent(index), self.max))
+                position += 1
+            if position == len(targets):
+                break
+        return result
+
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        """Pares (maior valor equivalente do balde, contagem) dos baldes não vazios"""
+        for index in sorted(self._counts):
+            yield self._highest_equivalent(index), self._counts[index]
+
+    def __len__(self) -> int:
+        """Baldes em uso"""
+        return len(self._counts)
+
+    # ==================== Serialização ====================
+
+    def to_bytes(self) -> bytes:
+        """Serializar (cabeçalho + pares índice/contagem comprimidos)"""
+        header = _HEADER.pack(
+            _MAGIC, self.significant_digits, self.lowest, self.highest, self.count, self.min, self.max, self.total
+        )
+        pairs = array("Q")
+        for index in sorted(self._counts):
+            pairs.append(index)
+            pairs.append(self._counts[index])
+        if sys.byteorder != "little":
+            pairs.byteswap()
+        return header + zlib.compress(pairs.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LatencyHistogram":
+        """Reconstruir um histograma serializado com ``to_bytes``"""
+        magic, digits, lowest, highest, count, minimum, maximum, total = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Dados não são um histograma serializado")
+        histogram = cls(lowest, highest, digits)
+        pairs = array("Q")
+        pairs.frombytes(zlib.decompress(data[_HEADER.size:]))
+        if sys.byteorder != "little":
+            pairs.byteswap()
+        if any(index >= histogram.bucket_limit for index in pairs[::2]):
+            raise ValueError("Contagens incompatíveis com a configuração do histograma")
+        histogram._counts = dict(zip(pairs[::2], pairs[1::2]))
+        histogram.count, histogram.min, histogram.max, histogram.total = count, minimum, maximum, total
+        return histogram
+
+    def __reduce__(self):
+        # pickle (ex.: entre processos) usa a forma comprimida
+        return (LatencyHistogram.from_bytes, (self.to_bytes(),))
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, min={self.min}, max={self.max})"
@@ -0,0 +1,258 @@
+"""
+Grafo da biblioteca (usuários, playlists e músicas) mantido no cliente
+As relações usuário → playlists e playlist → músicas (e as inversas) ficam em
+listas de adjacência compactas (CSR): índices densos em ``array('i')``, sem
+um objeto por aresta. Atualizações por diferença só trocam as linhas dos nós
+buscados de novo
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+class _Adjacency:
+    """Vizinhos do nó ``i`` em ``targets[offsets[i]:offsets[i + 1]]``"""
+
+    __slots__ = ("offsets", "targets")
+
+    def __init__(self, offsets: array, targets: array):
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def build(cls, rows: Iterable[Iterable[int]]) -> "_Adjacency":
+        offsets = array("i", [0])
+        targets = array("i")
+        for row in rows:
+            targets.extend(row)
+            offsets.append(len(targets))
+        return cls(offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def reverse(self, size: int) -> "_Adjacency":
+        """Adjacência inversa para ``size`` nós de destino (linhas ordenadas)"""
+        counts = array("i", bytes(4 * (size + 1)))
+        for target in self.targets:
+            counts[target + 1] += 1
+        for node in range(size):
+            counts[node + 1] += counts[node]
+        offsets = array("i", counts)
+        targets = array("i", bytes(4 * len(self.targets)))
+        fill = array("i", counts[:-1])
+        offs = self.offsets
+        for source in range(len(self)):
+            for position in range(offs[source], offs[source + 1]):
+                target = self.targets[position]
+                targets[fill[target]] = source
+                fill[target] += 1
+        return _Adjacency(offsets, targets)
+
+
+class _Nodes:
+    """Entidades de um tipo em ordem densa, com o mapa id → índice"""
+
+    __slots__ = ("items", "index")
+
+    def __init__(self, items: Sequence[Any]):
+        self.items = list(items)
+        self.index = {item.id: position for position, item in enumerate(self.items)}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+@dataclass
+class GraphDiff:
+    """Mudanças aplicadas por uma sincronização"""
+    users: Tuple[int, int] = (0, 0)  # (adicionados, removidos)
+    musics: Tuple[int, int] = (0, 0)
+    playlists: Tuple[int, int] = (0, 0)
+    user_playlists: Tuple[int, int] = (0, 0)  # arestas (adicionadas, removidas)
+    playlist_musics: Tuple[int, int] = (0, 0)
+
+    @property
+    def changed(self) -> bool:
+        return any(any(pair) for pair in (
+            self.users, self.musics, self.playlists, self.user_playlists, self.playlist_musics
+        ))
+
+
+def _node_diff(old: _Nodes, new: _Nodes) -> Tuple[int, int]:
+    return len(new.index.keys() - old.index.keys()), len(old.index.keys() - new.index.keys())
+
+
+class LibraryGraph:
+    """Grafo usuários → playlists → músicas com consultas locais
+
+    Escritas do cliente chegam por ``invalidate`` (etiquetas do cache de
+    respostas): ``user:N``/``playlist:N`` marcam o nó para nova busca das
+    suas arestas e ``users``/``musics``/``playlists`` pedem nova listagem.
+    """
+
+    def __init__(self) -> None:
+        self._users = _Nodes(())
+        self._musics = _Nodes(())
+        self._playlists = _Nodes(())
+        self._user_playlists = _Adjacency.build(())
+        self._playlist_musics = _Adjacency.build(())
+        self._playlist_users = _Adjacency.build(())
+        self._music_playlists = _Adjacency.build(())
+        self.stale_users: Set[int] = set()
+        self.stale_playlists: Set[int] = set()
+        self.needs_listing = True
+        self.syncs = 0
+
+    @property
+    def ready(self) -> bool:
+        """Grafo sincronizado ao menos uma vez"""
+        return self.syncs > 0
+
+    @property
+    def dirty(self) -> bool:
+        """Há nós a buscar de novo ou listagem pendente"""
+        return self.needs_listing or bool(self.stale_users) or bool(self.stale_playlists)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "users": len(self._users),
+            "musics": len(self._musics),
+            "playlists": len(self._playlists),
+            "user_playlists": len(self._user_playlists.targets),
+            "playlist_musics": len(self._playlist_musics.targets),
+        }
+
+    def memory_bytes(self) -> int:
+        """Bytes ocupados pelos arrays de adjacência"""
+        return sum(
+            adjacency.offsets.itemsize * len(adjacency.offsets) + adjacency.targets.itemsize * len(adjacency.targets)
+            for adjacency in (self._user_playlists, self._playlist_musics, self._playlist_users, self._music_playlists)
+        )
+
+    # ==================== Consultas ====================
+
+    def user_playlists(self, user_id: int) -> List[Any]:
+        """Playlists do usuário (vazia se o usuário não existir)"""
+        return self._lookup(self._users, self._user_playlists, self._playlists, user_id)
+
+    def playlist_musics(self, playlist_id: int) -> List[Any]:
+        """Músicas da playlist"""
+        return self._lookup(self._playlists, self._playlist_musics, self._musics, playlist_id)
+
+    def playlists_by_music(self, music_id: int) -> List[Any]:
+        """Playlists que contêm a música"""
+        return self._lookup(self._musics, self._music_playlists, self._playlists, music_id)
+
+    def playlist_users(self, playlist_id: int) -> List[Any]:
+        """Usuários que têm a playlist"""
+        return self._lookup(self._playlists, self._playlist_users, self._users, playlist_id)
+
+    @staticmethod
+    def _lookup(source: _Nodes, adjacency: _Adjacency, target: _Nodes, ident: int) -> List[Any]:
+        node = source.index.get(ident)
+        if node is None:
+            return []
+        items = target.items
+        return [items[position] for position in adjacency.row(node)]
+
+    # ==================== Sincronização ====================
+
+    def stale_ids(self, user_ids: Iterable[int], playlist_ids: Iterable[int]) -> Tuple[List[int], List[int]]:
+        """Ids cujas arestas precisam ser buscadas: novos no grafo ou marcados"""
+        users = sorted(ident for ident in user_ids if ident in self.stale_users or ident not in self._users.index)
+        playlists = sorted(
+            ident for ident in playlist_ids if ident in self.stale_playlists or ident not in self._playlists.index
+        )
+        return users, playlists
+
+    def apply(
+        self,
+        users: Optional[Sequence[Any]],
+        musics: Optional[Sequence[Any]],
+        playlists: Optional[Sequence[Any]],
+        user_playlists: Mapping[int, Iterable[int]],
+        playlist_musics: Mapping[int, Iterable[int]],
+    ) -> GraphDiff:
+        """Aplicar uma sincronização e retornar as diferenças
+
+        ``users``/``musics``/``playlists`` são listagens completas (``None``
+        mantém as atuais). As arestas só precisam trazer os nós buscados de
+        novo; os demais mantêm as linhas atuais, descartando destinos que
+        deixaram de existir.
+        """
+        old_users, old_musics, old_playlists = self._users, self._musics, self._playlists
+        new_users = _Nodes(users) if users is not None else old_users
+        new_musics = _Nodes(musics) if musics is not None else old_musics
+        new_playlists = _Nodes(playlists) if playlists is not None else old_playlists
+
+        user_rows, user_edges = self._rows(
+            old_users, new_users, old_playlists, new_playlists, self._user_playlists, user_playlists
+        )
+        playlist_rows, playlist_edges = self._rows(
+            old_playlists, new_playlists, old_musics, new_musics, self._playlist_musics, playlist_musics
+        )
+
+        self._users, self._musics, self._playlists = new_users, new_musics, new_playlists
+        self._user_playlists = _Adjacency.build(user_rows)
+        self._playlist_musics = _Adjacency.build(playlist_rows)
+        self._playlist_users = self._user_playlists.reverse(len(new_playlists))
+        self._music_playlists = self._playlist_musics.reverse(len(new_musics))
+
+        self.stale_users.difference_update(user_playlists)
+        self.stale_playlists.difference_update(playlist_musics)
+        if users is not None and musics is not None and playlists is not None:
+            self.needs_listing = False
+        self.syncs += 1
+        return GraphDiff(
+            _node_diff(old_users, new_users),
+            _node_diff(old_musics, new_musics),
+            _node_diff(old_playlists, new_playlists),
+            user_edges,
+            playlist_edges,
+        )
+
+    @staticmethod
+    def _rows(
+        old_sources: _Nodes,
+        new_sources: _Nodes,
+        old_targets: _Nodes,
+        new_targets: _Nodes,
+        adjacency: _Adjacency,
+        fetched: Mapping[int, Iterable[int]],
+    ) -> Tuple[List[List[int]], Tuple[int, int]]:
+        """Linhas (índices densos novos) por nó de origem e arestas (adicionadas, removidas)"""
+        old_ids = [item.id for item in old_targets.items]
+        target_index = new_targets.index
+        rows: List[List[int]] = []
+        added = removed = 0
+        for item in new_sources.items:
+            old_node = old_sources.index.get(item.id)
+            previous = set()
+            if old_node is not None:
+                previous = {old_ids[position] for position in adjacency.row(old_node)}
+            if item.id in fetched:
+                current = {ident for ident in fetched[item.id] if ident in target_index}
+            else:
+                current = {ident for ident in previous if ident in target_index}
+            added += len(current - previous)
+            removed += len(previous - current)
+            rows.append(sorted(target_index[ident] for ident in current))
+        for item in old_sources.items:
+            if item.id not in new_sources.index:
+                removed += len(adjacency.row(old_sources.index[item.id]))
+        return rows, (added, removed)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Marcar o que uma escrita pode ter alterado"""
+        for tag in tags:
+            if tag in ("users", "musics", "playlists"):
+                self.needs_listing = True
+            elif tag.startswith("user:"):
+                self.stale_users.add(int(tag[len("user:"):]))
+            elif tag.startswith("playlist:"):
+                self.stale_playlists.add(int(tag[len("playlist:"):]))
@@ -3,12 +3,295 @@ Tester de carga para comparar tecnologias de música streaming
 """
 
 import asyncio
+import math
 import time
-from typing import List, Dict, Callable, Any
-from dataclasses import dataclass
+from typing import List, Dict, Callable, Any, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from statistics import mean, median, stdev
 import sys
-from music_streaming_client import MusicStreamingClient
+from music_streaming_client import ClientConfig, MusicStreamingClient
+from deadlines import DeadlineExceededError
+from latency_histogram import LatencyHistogram
+import arrivals
+
+
+TECHNOLOGIES = ("REST", "GraphQL", "SOAP", "gRPC")
+
+# Operações testadas: (nome, {tecnologia: (método do cliente, argumentos)})
+OPERATIONS: List[Tuple[str, Dict[str, Tuple[str, tuple]]]] = [
+    ("Listar Usuários", {
+        "REST": ("rest_list_all_users", ()),
+        "GraphQL": ("graphql_list_all_users", ()),
+        "SOAP": ("soap_list_all_users", ()),
+        "gRPC": ("grpc_list_all_users", ()),
+    }),
+    ("Listar Músicas", {
+        "REST": ("rest_list_all_musics", ()),
+        "GraphQL": ("graphql_list_all_musics", ()),
+        "SOAP": ("soap_list_all_musics", ()),
+        "gRPC": ("grpc_list_all_musics", ()),
+    }),
+    ("Playlists do Usuário (ID=1)", {
+        "REST": ("rest_list_user_playlists", (1,)),
+        "GraphQL": ("graphql_list_user_playlists", (1,)),
+        "SOAP": ("soap_list_playlists_by_user", (1,)),
+        "gRPC": ("grpc_list_user_playlists", (1,)),
+    }),
+    ("Músicas da Playlist (ID=1)", {
+        "REST": ("rest_list_playlist_musics", (1,)),
+        "GraphQL": ("graphql_list_playlist_musics", (1,)),
+        "SOAP": ("soap_list_musics_by_playlist", (1,)),
+        "gRPC": ("grpc_list_playlist_musics", (1,)),
+    }),
+    ("Playlists com Música (ID=1)", {
+        "REST": ("rest_list_playlists_by_music", (1,)),
+        "GraphQL": ("graphql_list_playlists_by_music", (1,)),
+        "SOAP": ("soap_list_playlists_by_music", (1,)),
+        "gRPC": ("grpc_list_playlists_by_music", (1,)),
+    }),
+]
+
+
+def load_test_config() -> ClientConfig:
+    """Configuração do cliente para testes de carga
+
+    Sem coalescência, agrupamento GraphQL nem respostas pelo índice de
+    playlists: usuários simultâneos fazendo a mesma chamada precisam gerar uma
+    requisição cada, senão o teste mede o cliente e não o servidor.
+    """
+    return ClientConfig(coalesce_requests=False, graphql_batching=False, playlist_index_reads=False)
+
+
+_NS_PER_MS = 1_000_000
+
+
+def _split(total: int, parts: int) -> List[int]:
+    """Repartir ``total`` em ``parts`` cotas quase iguais (as maiores primeiro)"""
+    base, extra = divmod(total, parts)
+    return [base + (1 if index < extra else 0) for index in range(parts)]
+
+
+def operation_fn(client: MusicStreamingClient, technology: str, operation: str) -> Callable:
+    """Função sem argumentos que executa a operação na tecnologia"""
+    for name, methods in OPERATIONS:
+        if name == operation:
+            method_name, args = methods[technology]
+            method = getattr(client, method_name)
+            return lambda: method(*args)
+    raise ValueError(f"Operação desconhecida: {operation}")
+
+
+@dataclass
+class LoadMeasurement:
+    """Medidas brutas de uma execução (de um processo ou mescladas)"""
+    histogram: LatencyHistogram  # latências em ns
+    requests: int = 0  # requisições feitas (malha fechada) ou agendadas (malha aberta)
+    successful: int = 0
+    failed: int = 0
+    deadline_exceeded: int = 0
+    concurrency: int = 0  # usuários virtuais
+    max_in_flight: int = 0
+    elapsed: float = 0.0  # segundos
+    dropped: int = 0
+    max_send_lag: float = 0.0  # segundos
+    backlog: int = 0
+    in_flight_timeline: List[int] = field(default_factory=list)
+    schedule_time: float = 0.0
+
+    def merge(self, other: "LoadMeasurement") -> "LoadMeasurement":
+        """Somar as medidas de outro processo que rodou ao mesmo tempo
+
+        Máximos de requisições em andamento são somados: os picos de cada
+        processo podem não coincidir, então o resultado é um limite superior.
+        """
+        self.histogram.merge(other.histogram)
+        self.requests += other.requests
+        self.successful += other.successful
+        self.failed += other.failed
+        self.deadline_exceeded += other.deadline_exceeded
+        self.concurrency += other.concurrency
+        self.max_in_flight += other.max_in_flight
+        self.elapsed = max(self.elapsed, other.elapsed)
+        self.dropped += other.dropped
+        self.max_send_lag = max(self.max_send_lag, other.max_send_lag)
+        self.backlog += other.backlog
+        timeline, others = self.in_flight_timeline, other.in_flight_timeline
+        self.in_flight_timeline = [
+            (timeline[second] if second < len(timeline) else 0) + (others[second] if second < len(others) else 0)
+            for second in range(max(len(timeline), len(others)))
+        ]
+        self.schedule_time = max(self.schedule_time, other.schedule_time)
+        return self
+
+
+async def measure_closed_loop(
+    operation_fn: Callable, number_of_requests: int, concurrency: int, progress: bool = True
+) -> LoadMeasurement:
+    """Malha fechada: ``concurrency`` usuários virtuais (corrotinas que
+    compartilham o cliente) repartem as ``number_of_requests`` requisições;
+    cada um só envia a próxima depois da resposta anterior
+    """
+    concurrency = max(0, min(concurrency, number_of_requests))
+    measurement = LoadMeasurement(LatencyHistogram(), requests=number_of_requests, concurrency=concurrency)
+    if concurrency == 0:
+        return measurement
+
+    # Latências (ns) registradas por cada usuário virtual
+    user_histograms = [LatencyHistogram() for _ in range(concurrency)]
+    in_flight = 0
+    completed = 0
+    progress_step = max(1, number_of_requests // 20)
+    pending = iter(range(number_of_requests))
+
+    async def virtual_user(histogram: LatencyHistogram) -> None:
+        nonlocal in_flight, completed
+        # Os usuários compartilham o iterador: cada requisição é feita uma vez
+        for _ in pending:
+            in_flight += 1
+            measurement.max_in_flight = max(measurement.max_in_flight, in_flight)
+            req_start = time.perf_counter_ns()
+            try:
+                await operation_fn()
+                measurement.successful += 1
+            except DeadlineExceededError:
+                measurement.failed += 1
+                measurement.deadline_exceeded += 1
+            except Exception as error:
+                measurement.failed += 1
+            histogram.record(time.perf_counter_ns() - req_start)
+            in_flight -= 1
+
+            # Mostrar progresso
+            completed += 1
+            if progress and completed % progress_step == 0:
+                sys.stdout.write(".")
+                sys.stdout.flush()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(virtual_user(histogram) for histogram in user_histograms))
+    measurement.elapsed = time.perf_counter() - start_time
+
+    for user_histogram in user_histograms:
+        measurement.histogram.merge(user_histogram)
+    return measurement
+
+
+async def measure_open_loop(
+    operation_fn: Callable, offsets: Sequence[float], duration: float, max_in_flight: int = 10000
+) -> LoadMeasurement:
+    """Malha aberta: enviar nos instantes ``offsets`` (segundos desde o início)
+    sem esperar respostas
+
+    A latência é medida a partir do instante agendado, então atrasos de fila
+    (inclusive do próprio agendador) entram na medida. Com ``max_in_flight``
+    requisições em andamento, novos envios são descartados e contados.
+    """
+    measurement = LoadMeasurement(LatencyHistogram(), requests=len(offsets))  # ns desde o instante agendado
+    histogram = measurement.histogram
+    in_flight = 0
+    max_lag = 0.0
+    timeline = [0] * max(1, math.ceil(duration))
+    tasks = set()
+
+    async def request(intended: int) -> None:
+        nonlocal in_flight
+        try:
+            await operation_fn()
+            measurement.successful += 1
+        except DeadlineExceededError:
+            measurement.failed += 1
+            measurement.deadline_exceeded += 1
+        except Exception as error:
+            measurement.failed += 1
+        histogram.record(time.perf_counter_ns() - intended)
+        in_flight -= 1
+
+    start_ns = time.perf_counter_ns()
+    start_time = start_ns / 1e9
+    for offset in offsets:
+        intended = start_ns + int(offset * 1e9)
+        delay = (intended - time.perf_counter_ns()) / 1e9
+        if delay > 0:
+            await asyncio.sleep(delay)
+        max_lag = max(max_lag, (time.perf_counter_ns() - intended) / 1e9)
+        if in_flight >= max_in_flight:
+            measurement.dropped += 1
+            continue
+        in_flight += 1
+        second = min(int(offset), len(timeline) - 1)
+        timeline[second] = max(timeline[second], in_flight)
+        task = asyncio.ensure_future(request(intended))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    measurement.schedule_time = time.perf_counter_ns() / 1e9 - start_time
+    measurement.backlog = in_flight
+    if tasks:
+        await asyncio.gather(*tasks)
+    measurement.elapsed = time.perf_counter_ns() / 1e9 - start_time
+
+    measurement.max_in_flight = max(timeline)
+    measurement.max_send_lag = max_lag
+    measurement.in_flight_timeline = timeline
+    return measurement
+
+
+@dataclass
+class LoadJob:
+    """Teste de uma operação em uma tecnologia, repartível entre processos"""
+    technology: str
+    operation: str
+    mode: str = "closed"  # "closed" ou "open"
+    requests: int = 100  # malha fechada
+    concurrency: int = 1  # malha fechada
+    rate: float = 0.0  # malha aberta (req/s no total)
+    duration: float = 10.0  # malha aberta
+    pattern: str = "fixed"  # malha aberta
+    step_rates: Optional[Sequence[float]] = None  # malha aberta, padrão "step"
+    max_in_flight: int = 10000  # malha aberta (no total)
+
+    async def measure(self, operation_fn: Callable, index: int = 0, processes: int = 1) -> LoadMeasurement:
+        """Executar a cota do processo ``index`` de ``processes``
+
+        Malha fechada: os usuários virtuais são repartidos entre os processos
+        e as requisições entre os processos com usuários. Malha aberta: cada
+        processo recebe ``rate / processes``; no padrão fixed as agendas são
+        defasadas para que a soma continue com intervalos iguais.
+        """
+        if self.mode == "closed":
+            active = min(processes, self.concurrency, self.requests)
+            users = _split(self.concurrency, processes)[index]
+            requests = _split(self.requests, active)[index] if index < active else 0
+            return await measure_closed_loop(operation_fn, requests, users, progress=index == 0)
+        if self.mode != "open":
+            raise ValueError(f"Modo de teste inválido: {self.mode} (use closed ou open)")
+        step_rates = [rate / processes for rate in self.step_rates] if self.step_rates else None
+        offsets = list(arrivals.schedule(self.pattern, self.rate / processes, self.duration, step_rates))
+        if self.pattern == "fixed" and self.rate > 0:
+            phase = index / self.rate
+            offsets = [offset + phase for offset in offsets]
+        max_in_flight = math.ceil(self.max_in_flight / processes)
+        return await measure_open_loop(operation_fn, offsets, self.duration, max_in_flight)
+
+
+def _latency_fields(histogram: LatencyHistogram) -> Dict[str, Any]:
+    """Estatísticas de latência (ms) no formato dos campos de LoadTestResult
+
+    O histograma guarda nanossegundos; percentis têm o erro relativo do
+    histograma (0,1% com 3 dígitos significativos), mínimo, máximo e média
+    são exatos.
+    """
+    percentiles = histogram.percentiles(50, 90, 95, 99, 99.9)
+    return {
+        "average_time": histogram.mean / _NS_PER_MS,
+        "min_time": histogram.min / _NS_PER_MS,
+        "max_time": histogram.max / _NS_PER_MS,
+        "median_time": percentiles[50] / _NS_PER_MS,
+        "p90_time": percentiles[90] / _NS_PER_MS,
+        "p95_time": percentiles[95] / _NS_PER_MS,
+        "p99_time": percentiles[99] / _NS_PER_MS,
+        "p999_time": percentiles[99.9] / _NS_PER_MS,
+        "histogram": histogram,
+    }
 
 
 @dataclass
@@ -27,71 +310,128 @@ class LoadTestResult:
     p99_time: float
     requests_per_second: float
     error_rate: float
+    deadline_exceeded: int = 0
+    concurrency: int = 1  # usuários virtuais simultâneos
+    max_in_flight: int = 0  # maior número de requisições em andamento
+    avg_in_flight: float = 0.0  # média de requisições em andamento (soma das latências / duração)
+    mode: str = "closed"  # "closed" (usuários virtuais) ou "open" (taxa de chegada)
+    offered_rate: float = 0.0  # malha aberta: req/s agendadas
+    dropped_requests: int = 0  # malha aberta: envios descartados pelo limite de requisições em andamento
+    max_send_lag: float = 0.0  # malha aberta: maior atraso (ms) do envio em relação ao instante agendado
+    backlog_at_end: int = 0  # malha aberta: requisições ainda em andamento ao fim da agenda
+    in_flight_timeline: List[int] = field(default_factory=list)  # maior número em andamento a cada segundo
+    p90_time: float = 0.0
+    p999_time: float = 0.0
+    histogram: Optional[LatencyHistogram] = field(default=None, repr=False)  # latências em ns
+
+
+@dataclass
+class SaturationResult:
+    """Vazão máxima sustentável de uma operação dentro do SLO"""
+    technology: str
+    operation: str
+    slo_p99: float  # ms
+    max_error_rate: float  # %
+    max_sustainable_rate: float  # req/s oferecidas: maior taxa testada que cumpriu o SLO (0 se nenhuma)
+    first_failing_rate: Optional[float]  # menor taxa oferecida que violou o SLO (None: não atingida)
+    knee: Optional[LoadTestResult]  # resultado na taxa máxima sustentável
+    steps: List[LoadTestResult] = field(default_factory=list, repr=False)  # todos os degraus, em ordem
+
+
+def _slo_error_rate(result: LoadTestResult) -> float:
+    """Taxa de erros (%) contando envios descartados como erros"""
+    errors = result.failed_requests + result.dropped_requests
+    return errors / result.total_requests * 100 if result.total_requests else 0.0
+
+
+def _within_slo(result: LoadTestResult, slo_p99: float, max_error_rate: float) -> bool:
+    """p99 dentro do SLO e erros abaixo do limite"""
+    return result.p99_time <= slo_p99 and _slo_error_rate(result) <= max_error_rate
 
 
 class LoadTester:
-    """Tester de carga para comparar tecnologias"""
+    """Tester de carga para comparar tecnologias
+
+    Com ``processes`` > 1, cada teste é repartido entre processos de carga
+    (``load_workers.WorkerPool``), cada um com seu cliente e event loop, e as
+    medidas são mescladas em um único resultado por operação. O número de
+    processos é independente do número de usuários virtuais.
+    """
 
-    def __init__(self):
+    def __init__(self, config: Optional[ClientConfig] = None, processes: int = 1):
         """Inicializar tester"""
-        self.client = MusicStreamingClient()
+        self.config = config or load_test_config()
+        self.client = MusicStreamingClient(self.config)
+        self.processes = max(1, processes)
+        self._pool = None
         self.results: List[LoadTestResult] = []
 
+    def operation_fn(self, technology: str, operation: str) -> Callable:
+        """Função sem argumentos que executa a operação na tecnologia"""
+        return operation_fn(self.client, technology, operation)
+
+    async def close(self) -> None:
+        """Fechar o cliente e encerrar os processos de carga"""
+        await self.client.close()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    async def _measure(self, job: LoadJob, operation_fn: Callable) -> LoadMeasurement:
+        """Executar o teste neste processo ou repartido entre os processos de carga
+
+        Os processos de carga resolvem a operação pelo nome (``OPERATIONS``)
+        no próprio cliente; ``operation_fn`` só é usada neste processo.
+        """
+        if self.processes == 1:
+            return await job.measure(operation_fn)
+        if self._pool is None:
+            from load_workers import WorkerPool
+            self._pool = WorkerPool(self.processes, self.config)
+        return await asyncio.get_running_loop().run_in_executor(None, self._pool.run, job)
+
+    def _processes_label(self) -> str:
+        return f", {self.processes} processos" if self.processes > 1 else ""
+
     async def _run_load_test(
         self,
         technology: str,
         operation: str,
         operation_fn: Callable,
         number_of_requests: int = 100,
+        concurrency: int = 1,
     ) -> LoadTestResult:
-        """Executar teste de carga para uma operação"""
-        print(f"\n⏱️  Testando {technology:10} - {operation:30} ({number_of_requests} req)")
-
-        times: List[float] = []
-        successful = 0
-        failed = 0
-
-        start_time = time.time()
-
-        for i in range(number_of_requests):
-            req_start = time.time()
-            try:
-                await operation_fn()
-                successful += 1
-            except Exception as error:
-                failed += 1
-            times.append((time.time() - req_start) * 1000)  # Converter para ms
+        """Executar teste de carga para uma operação
 
-            # Mostrar progresso
-            if (i + 1) % max(1, number_of_requests // 20) == 0:
-                sys.stdout.write(".")
-                sys.stdout.flush()
+        ``concurrency`` usuários virtuais repartem as ``number_of_requests``
+        requisições; cada um só envia a próxima depois da resposta anterior.
+        """
+        concurrency = max(1, min(concurrency, number_of_requests))
+        print(
+            f"\n⏱️  Testando {technology:10} - {operation:30} ({number_of_requests} req, {concurrency} usuários"
+            f"{self._processes_label()})"
+        )
 
-        total_time = time.time() - start_time
+        job = LoadJob(technology, operation, "closed", number_of_requests, concurrency)
+        measurement = await self._measure(job, operation_fn)
+        histogram = measurement.histogram
+        total_time = measurement.elapsed
 
         # Calcular estatísticas
-        times.sort()
-        avg_time = mean(times)
-        min_time = min(times)
-        max_time = max(times)
-        median_time = median(times)
-        p95_time = times[int(len(times) * 0.95)]
-        p99_time = times[int(len(times) * 0.99)]
-
         result = LoadTestResult(
             technology=technology,
             operation=operation,
             total_requests=number_of_requests,
-            successful_requests=successful,
-            failed_requests=failed,
-            average_time=avg_time,
-            min_time=min_time,
-            max_time=max_time,
-            median_time=median_time,
-            p95_time=p95_time,
-            p99_time=p99_time,
-            requests_per_second=number_of_requests / total_time,
-            error_rate=(failed / number_of_requests) * 100,
+            successful_requests=measurement.successful,
+            failed_requests=measurement.failed,
+            **_latency_fields(histogram),
+            requests_per_second=number_of_requests / total_time if total_time else 0.0,
+            error_rate=(measurement.failed / number_of_requests) * 100,
+            deadline_exceeded=measurement.deadline_exceeded,
+            concurrency=concurrency,
+            max_in_flight=measurement.max_in_flight,
+            # Lei de Little: média em andamento = tempo total em requisições / duração
+            avg_in_flight=histogram.total / 1e9 / total_time if total_time else 0.0,
         )
 
         print(" ✅")
@@ -100,35 +440,277 @@ class LoadTester:
         )
         print(
             f"   Min: {result.min_time:.2f}ms | Max: {result.max_time:.2f}ms | P95: {result.p95_time:.2f}ms"
+            f" | P99: {result.p99_time:.2f}ms | P99.9: {result.p999_time:.2f}ms"
         )
+        if concurrency > 1:
+            print(f"   Em andamento: média {result.avg_in_flight:.1f} | máx {result.max_in_flight}")
+        if result.deadline_exceeded:
+            print(f"   Prazos esgotados: {result.deadline_exceeded} de {result.failed_requests} falhas")
 
         self.results.append(result)
         return result
 
-    async def run_full_load_test(self, requests_per_operation: int = 100) -> None:
-        """Executar teste completo com todas as tecnologias"""
+    async def _run_open_loop_test(
+        self,
+        technology: str,
+        operation: str,
+        operation_fn: Callable,
+        rate: float,
+        duration: float = 10.0,
+        pattern: str = "fixed",
+        step_rates: Optional[Sequence[float]] = None,
+        max_in_flight: int = 10000,
+    ) -> LoadTestResult:
+        """Executar teste de carga em malha aberta (taxa de chegada)
+
+        Um agendador independente envia as requisições nos instantes da
+        agenda (``arrivals.schedule``) sem esperar respostas; veja
+        ``measure_open_loop``.
+        """
+        job = LoadJob(
+            technology, operation, "open",
+            rate=rate, duration=duration, pattern=pattern, step_rates=step_rates, max_in_flight=max_in_flight,
+        )
+        print(
+            f"\n⏱️  Testando {technology:10} - {operation:30} (malha aberta {pattern}, "
+            f"{rate:.1f} req/s por {duration:.0f}s{self._processes_label()})"
+        )
+
+        measurement = await self._measure(job, operation_fn)
+        histogram = measurement.histogram
+        total_time = measurement.elapsed
+
+        sent = measurement.requests - measurement.dropped
+        result = LoadTestResult(
+            technology=technology,
+            operation=operation,
+            total_requests=measurement.requests,
+            successful_requests=measurement.successful,
+            failed_requests=measurement.failed,
+            **_latency_fields(histogram),
+            requests_per_second=measurement.successful / total_time if total_time else 0.0,
+            error_rate=(measurement.failed / sent) * 100 if sent else 0.0,
+            deadline_exceeded=measurement.deadline_exceeded,
+            max_in_flight=measurement.max_in_flight,
+            avg_in_flight=histogram.total / 1e9 / total_time if total_time else 0.0,
+            mode="open",
+            offered_rate=measurement.requests / duration,
+            dropped_requests=measurement.dropped,
+            max_send_lag=measurement.max_send_lag * 1000,
+            backlog_at_end=measurement.backlog,
+            in_flight_timeline=measurement.in_flight_timeline,
+        )
+
+        print(" ✅")
+        print(
+            f"   Oferecido: {result.offered_rate:.1f} req/s | Atendido: {result.requests_per_second:.1f} req/s"
+            f" | Agenda cumprida em {measurement.schedule_time:.2f}s"
+        )
+        print(
+            f"   P50: {result.median_time:.2f}ms | P95: {result.p95_time:.2f}ms | P99: {result.p99_time:.2f}ms"
+            f" | P99.9: {result.p999_time:.2f}ms | Max: {result.max_time:.2f}ms"
+        )
+        print(
+            f"   Em andamento: máx {result.max_in_flight} | ao fim da agenda {result.backlog_at_end}"
+            f" | Atraso máx. do agendador: {result.max_send_lag:.2f}ms"
+        )
+        print(
+            f"   Em andamento por segundo: {result.in_flight_timeline} | Envios descartados: {result.dropped_requests}"
+        )
+        if result.deadline_exceeded:
+            print(f"   Prazos esgotados: {result.deadline_exceeded} de {result.failed_requests} falhas")
+
+        self.results.append(result)
+        return result
+
+    async def run_open_loop_test(
+        self,
+        rate: float,
+        duration: float = 10.0,
+        pattern: str = "fixed",
+        technologies: Sequence[str] = TECHNOLOGIES,
+        operation: str = "Músicas da Playlist (ID=1)",
+        max_in_flight: int = 10000,
+    ) -> List[LoadTestResult]:
+        """Comparar tecnologias sob a mesma taxa de chegada"""
         print("\n" + "=" * 80)
-        print("🚀 TESTE DE CARGA COMPLETO - COMPARAÇÃO DE TECNOLOGIAS")
+        print(f"🚀 TESTE EM MALHA ABERTA - {operation} ({pattern}, {rate:.0f} req/s)")
         print("=" * 80)
 
-        # Operações a testar
-        operations = [
-            ("Listar Usuários", lambda: self.client.rest_list_all_users(), lambda: self.client.graphql_list_all_users(), lambda: self.client.soap_list_all_users(), lambda: self.client.grpc_list_all_users()),
-            ("Listar Músicas", lambda: self.client.rest_list_all_musics(), lambda: self.client.graphql_list_all_musics(), lambda: self.client.soap_list_all_musics(), lambda: self.client.grpc_list_all_musics()),
-            ("Playlists do Usuário (ID=1)", lambda: self.client.rest_list_user_playlists(1), lambda: self.client.graphql_list_user_playlists(1), lambda: self.client.soap_list_user_playlists(1), lambda: self.client.grpc_list_user_playlists(1)),
-            ("Músicas da Playlist (ID=1)", lambda: self.client.rest_list_playlist_musics(1), lambda: self.client.graphql_list_playlist_musics(1), lambda: self.client.soap_list_playlist_musics(1), lambda: self.client.grpc_list_playlist_musics(1)),
-            ("Playlists com Música (ID=1)", lambda: self.client.rest_list_playlists_by_music(1), lambda: self.client.graphql_list_playlists_by_music(1), lambda: self.client.soap_list_playlists_by_music(1), lambda: self.client.grpc_list_playlists_by_music(1)),
+        results = [
+            await self._run_open_loop_test(
+                technology, operation, self.operation_fn(technology, operation),
+                rate, duration, pattern, max_in_flight=max_in_flight,
+            )
+            for technology in technologies
         ]
 
+        print(f"\n{'Tecnologia':<10} {'Oferecido':>10} {'Atendido':>10} {'P50 (ms)':>10} {'P99 (ms)':>10} "
+              f"{'Fila fim':>9} {'Descart.':>9} {'Erros':>7}")
+        print("-" * 82)
+        for result in results:
+            print(
+                f"{result.technology:<10} {result.offered_rate:>10.1f} {result.requests_per_second:>10.1f} "
+                f"{result.median_time:>10.2f} {result.p99_time:>10.2f} {result.backlog_at_end:>9} "
+                f"{result.dropped_requests:>9} {result.failed_requests:>7}"
+            )
+        return results
+
+    async def run_full_load_test(self, requests_per_operation: int = 100, concurrency: int = 1) -> None:
+        """Executar teste completo com todas as tecnologias"""
+        print("\n" + "=" * 80)
+        print("🚀 TESTE DE CARGA COMPLETO - COMPARAÇÃO DE TECNOLOGIAS")
+        print("=" * 80)
+
         # Testar cada tecnologia
-        for op_name, rest_fn, graphql_fn, soap_fn, grpc_fn in operations:
-            await self._run_load_test("REST", op_name, rest_fn, requests_per_operation)
-            await self._run_load_test("GraphQL", op_name, graphql_fn, requests_per_operation)
-            await self._run_load_test("SOAP", op_name, soap_fn, requests_per_operation)
-            await self._run_load_test("gRPC", op_name, grpc_fn, requests_per_operation)
+        for op_name, _ in OPERATIONS:
+            for technology in TECHNOLOGIES:
+                await self._run_load_test(
+                    technology, op_name, self.operation_fn(technology, op_name), requests_per_operation, concurrency
+                )
 
         self._print_summary()
 
+    async def run_concurrency_sweep(
+        self,
+        levels: Sequence[int] = (1, 10, 100, 1000),
+        technologies: Sequence[str] = ("REST", "gRPC"),
+        operation: str = "Músicas da Playlist (ID=1)",
+        requests_per_user: int = 10,
+        min_requests: int = 100,
+    ) -> List[LoadTestResult]:
+        """Comparar tecnologias em vários níveis de usuários simultâneos"""
+        print("\n" + "=" * 80)
+        print(f"🚀 VARREDURA DE CONCORRÊNCIA - {operation}")
+        print("=" * 80)
+
+        results = []
+        for level in levels:
+            for technology in technologies:
+                requests = max(min_requests, level * requests_per_user)
+                results.append(await self._run_load_test(
+                    technology, operation, self.operation_fn(technology, operation), requests, level
+                ))
+
+        print(f"\n{'Usuários':>8} {'Tecnologia':<10} {'Req/s':>10} {'P50 (ms)':>10} {'P95 (ms)':>10} "
+              f"{'P99 (ms)':>10} {'Andamento':>10} {'Máx':>6} {'Erros':>7}")
+        print("-" * 90)
+        for result in results:
+            print(
+                f"{result.concurrency:>8} {result.technology:<10} {result.requests_per_second:>10.1f} "
+                f"{result.median_time:>10.2f} {result.p95_time:>10.2f} {result.p99_time:>10.2f} "
+                f"{result.avg_in_flight:>10.1f} {result.max_in_flight:>6} {result.failed_requests:>7}"
+            )
+        return results
+
+    async def run_saturation_search(
+        self,
+        slo_p99: float = 100.0,
+        max_error_rate: float = 1.0,
+        technologies: Sequence[str] = TECHNOLOGIES,
+        operations: Optional[Sequence[str]] = None,
+        start_rate: float = 10.0,
+        growth: float = 2.0,
+        max_rate: float = 10000.0,
+        step_duration: float = 5.0,
+        refine_steps: int = 4,
+        tolerance: float = 0.05,
+        pattern: str = "poisson",
+        warmup_requests: int = 20,
+    ) -> List[SaturationResult]:
+        """Encontrar a vazão máxima sustentável de cada operação com p99 ≤ ``slo_p99`` (ms)
+
+        Para cada tecnologia e operação, a taxa oferecida em malha aberta
+        começa em ``start_rate`` e é multiplicada por ``growth`` a cada degrau
+        de ``step_duration`` segundos, até o p99 passar do SLO, a taxa de
+        erros (com envios descartados) passar de ``max_error_rate`` % ou a
+        taxa chegar a ``max_rate``. Depois, até ``refine_steps`` degraus de
+        busca binária refinam o joelho entre a última taxa aprovada e a
+        primeira reprovada (param quando a distância fica abaixo de
+        ``tolerance`` da taxa aprovada). Antes da rampa, ``warmup_requests``
+        requisições não medidas abrem as conexões (e carregam o WSDL).
+        """
+        operations = list(operations or [name for name, _ in OPERATIONS])
+        print("\n" + "=" * 80)
+        print(f"🚀 BUSCA DE SATURAÇÃO - p99 ≤ {slo_p99:.0f}ms, erros ≤ {max_error_rate:.1f}%")
+        print("=" * 80)
+
+        saturation: List[SaturationResult] = []
+        for operation in operations:
+            for technology in technologies:
+                fn = self.operation_fn(technology, operation)
+                if warmup_requests:
+                    await self._measure(
+                        LoadJob(technology, operation, "closed", warmup_requests, max(1, self.processes)), fn
+                    )
+                steps: List[LoadTestResult] = []
+                passed: Optional[LoadTestResult] = None
+                passed_rate = 0.0
+                failing: Optional[float] = None
+
+                async def step(rate: float) -> bool:
+                    result = await self._run_open_loop_test(technology, operation, fn, rate, step_duration, pattern)
+                    steps.append(result)
+                    ok = _within_slo(result, slo_p99, max_error_rate)
+                    print(
+                        f"   {'✔ dentro do SLO' if ok else '✘ fora do SLO'}"
+                        f" (p99 {result.p99_time:.2f}ms, erros {_slo_error_rate(result):.1f}%)"
+                    )
+                    return ok
+
+                # Rampa geométrica até violar o SLO
+                rate = start_rate
+                while True:
+                    if not await step(rate):
+                        failing = rate
+                        break
+                    passed, passed_rate = steps[-1], rate
+                    if rate >= max_rate:
+                        break
+                    rate = min(rate * growth, max_rate)
+
+                # Busca binária entre a última taxa aprovada e a primeira reprovada
+                if failing is not None:
+                    low = passed_rate
+                    high = failing
+                    for _ in range(refine_steps):
+                        if high - low <= max(low * tolerance, 1.0):
+                            break
+                        middle = (low + high) / 2
+                        if await step(middle):
+                            passed, passed_rate, low = steps[-1], middle, middle
+                        else:
+                            high = failing = middle
+
+                saturation.append(SaturationResult(
+                    technology=technology,
+                    operation=operation,
+                    slo_p99=slo_p99,
+                    max_error_rate=max_error_rate,
+                    max_sustainable_rate=passed_rate,
+                    first_failing_rate=failing,
+                    knee=passed,
+                    steps=steps,
+                ))
+
+        print(f"\n📈 Máx. req/s sustentável com p99 ≤ {slo_p99:.0f}ms\n")
+        print(f"{'Operação':<32} {'Tecnologia':<10} {'Máx. req/s':>11} {'P99 (ms)':>10} {'Reprovada':>10} "
+              f"{'Degraus':>8}")
+        print("-" * 86)
+        for result in saturation:
+            if result.first_failing_rate is None:
+                sustainable = f"≥{result.max_sustainable_rate:.1f}"
+                failing_label = "-"
+            else:
+                sustainable = f"{result.max_sustainable_rate:.1f}"
+                failing_label = f"{result.first_failing_rate:.1f}"
+            p99 = f"{result.knee.p99_time:.2f}" if result.knee else "-"
+            print(
+                f"{result.operation:<32} {result.technology:<10} {sustainable:>11} {p99:>10} {failing_label:>10} "
+                f"{len(result.steps):>8}"
+            )
+        return saturation
+
     def _print_summary(self) -> None:
         """Imprimir sumário dos testes"""
         print("\n" + "=" * 80)
@@ -219,6 +801,7 @@ class LoadTester:
         print(f"Total de requisições: {total_requests}")
         print(f"Total de sucessos: {total_successful}")
         print(f"Total de falhas: {total_requests - total_successful}")
+        print(f"Prazos esgotados: {sum(r.deadline_exceeded for r in self.results)}")
         print(f"Tempo médio geral: {avg_time_general:.2f}ms")
         print(f"Req/s médio geral: {avg_req_per_sec_general:.2f}")
 
@@ -229,10 +812,16 @@ class LoadTester:
 
 async def main():
     """Função principal"""
-    tester = LoadTester()
+    tester = LoadTester(processes=int(sys.argv[3]) if len(sys.argv) > 3 else 1)
     
     # Executar teste de carga completo
-    await tester.run_full_load_test(requests_per_operation=100)
+    try:
+        await tester.run_full_load_test(
+            requests_per_operation=int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+            concurrency=int(sys.argv[2]) if len(sys.argv) > 2 else 1,
+        )
+    finally:
+        await tester.close()
     
     # Gerar gráficos automaticamente
     try:
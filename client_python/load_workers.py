@@ -0,0 +1,126 @@
+"""
+Processos de carga para testes que um único processo não consegue gerar
+Um processo asyncio satura um núcleo decodificando JSON/XML antes de os
+servidores saturarem; aqui cada processo tem seu próprio cliente e event
+loop, todos começam juntos (barreira) e as medidas são mescladas
+"""
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, List, Optional
+
+from music_streaming_client import ClientConfig, MusicStreamingClient
+from load_test import LoadJob, LoadMeasurement, operation_fn
+
+
+def _worker(index: int, processes: int, config: ClientConfig, jobs: Any, barrier: Any, results: Any) -> None:
+    """Ponto de entrada de um processo de carga"""
+    asyncio.run(_serve(index, processes, config, jobs, barrier, results))
+
+
+async def _serve(index: int, processes: int, config: ClientConfig, jobs: Any, barrier: Any, results: Any) -> None:
+    """Executar a cota deste processo de cada teste recebido até receber ``None``"""
+    client = MusicStreamingClient(config)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            job: Optional[LoadJob] = await loop.run_in_executor(None, jobs.get)
+            if job is None:
+                break
+            try:
+                await loop.run_in_executor(None, barrier.wait)
+                measurement = await job.measure(operation_fn(client, job.technology, job.operation), index, processes)
+                results.put((index, measurement, None))
+            except Exception as error:
+                results.put((index, None, f"{type(error).__name__}: {error}"))
+    finally:
+        await client.close()
+
+
+class WorkerPool:
+    """``processes`` processos de carga reutilizados entre testes
+
+    ``run`` envia o teste a todos, libera a barreira quando todos estão
+    prontos (o coordenador é a última parte) e mescla as medidas. Os
+    processos são iniciados com ``spawn``: um fork do coordenador herdaria
+    event loop, sessões e canais gRPC que não podem ser compartilhados.
+    """
+
+    def __init__(self, processes: int, config: ClientConfig, start_timeout: float = 60.0):
+        if processes < 1:
+            raise ValueError("processes precisa ser pelo menos 1")
+        self.processes = processes
+        self.start_timeout = start_timeout
+        context = multiprocessing.get_context("spawn")
+        self._barrier = context.Barrier(processes + 1)
+        self._results = context.Queue()
+        self._jobs = [context.Queue() for _ in range(processes)]
+        self._workers = [
+            context.Process(
+                target=_worker,
+                args=(index, processes, config, self._jobs[index], self._barrier, self._results),
+                name=f"load-worker-{index}",
+                daemon=True,
+            )
+            for index in range(processes)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def run(self, job: LoadJob) -> LoadMeasurement:
+        """Executar o teste em todos os processos e mesclar as medidas (bloqueante)"""
+        for jobs in self._jobs:
+            jobs.put(job)
+        # Esperar todos chegarem à barreira sem travar se algum processo morrer
+        deadline = time.monotonic() + self.start_timeout
+        while self._barrier.n_waiting < self.processes:
+            self._check_alive()
+            if time.monotonic() > deadline:
+                self.close()
+                raise RuntimeError(f"Processos de carga não ficaram prontos em {self.start_timeout:.0f}s")
+            time.sleep(0.01)
+        try:
+            self._barrier.wait(self.start_timeout)
+        except threading.BrokenBarrierError:
+            self.close()
+            raise RuntimeError("Barreira dos processos de carga rompida")
+
+        measurements: List[Optional[LoadMeasurement]] = [None] * self.processes
+        errors: List[str] = []
+        for _ in range(self.processes):
+            while True:
+                try:
+                    index, measurement, error = self._results.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    self._check_alive()
+            if error is not None:
+                errors.append(f"processo {index}: {error}")
+            measurements[index] = measurement
+        if errors:
+            raise RuntimeError("Falha nos processos de carga: " + "; ".join(errors))
+
+        merged = measurements[0]
+        for measurement in measurements[1:]:
+            merged.merge(measurement)
+        return merged
+
+    def _check_alive(self) -> None:
+        if not all(worker.is_alive() for worker in self._workers):
+            self.close()
+            raise RuntimeError("Um processo de carga terminou inesperadamente")
+
+    def close(self) -> None:
+        """Encerrar os processos (os que não saírem em alguns segundos são terminados)"""
+        for jobs, worker in zip(self._jobs, self._workers):
+            if worker.is_alive():
+                jobs.put(None)
+        for worker in self._workers:
+            worker.join(5.0)
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = []
+        self._jobs = []
@@ -3,20 +3,81 @@ Cliente unificado para o serviço de streaming de músicas
 Suporta: REST, GraphQL, SOAP e gRPC
 """
 
-import requests
+from __future__ import annotations
+
+import functools
+import importlib
+import importlib.util
+import inspect
 import json
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import attrgetter, itemgetter
+from types import ModuleType
+from typing import List, Dict, Optional, Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterator, Sequence, Tuple, TypeVar
+from dataclasses import dataclass, field
 import asyncio
-from zeep import Client as SoapClient
+import deadlines
+import containers
+import response_cache
+from bulk import BulkResult, fan_out
+from client_metrics import ClientMetrics
+from protocol_router import ProtocolRouter
+from hedging import HedgeBudget, hedge
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from health_probe import PeriodicProber, ProbeResult
+from playlist_index import PlaylistIndex
+from library_graph import GraphDiff, LibraryGraph
+from singleflight import SingleFlight
+from deadlines import DeadlineExceededError, run_with_deadline
 import sys
 import os
+import time
+
+
+def _lazy_import(name: str) -> Optional[ModuleType]:
+    """Registrar módulo para importação no primeiro acesso (None se ausente)
+
+    Os transportes só são carregados quando o protocolo é usado pela
+    primeira vez; depois disso o acesso a atributos tem custo normal.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except ModuleNotFoundError:
+        return None
+    if spec is None or spec.loader is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Transportes (carregados sob demanda)
+aiohttp = _lazy_import("aiohttp")
+httpx = _lazy_import("httpx")
+zeep = _lazy_import("zeep")
+wsdl_cache = _lazy_import("wsdl_cache")
+soap_fast = _lazy_import("soap_fast")
+graphql_batch = _lazy_import("graphql_batch")
+streaming = _lazy_import("streaming")
+grpc = _lazy_import("grpc")
 
-try:
-    import grpc
-    import grpc.aio
-except ImportError:
-    grpc = None
+# Proto files compilados e Empty do protobuf (carregados sob demanda)
+empty_pb2 = _lazy_import("google.protobuf.empty_pb2")
+user_pb2 = _lazy_import("user_pb2")
+user_pb2_grpc = _lazy_import("user_pb2_grpc")
+music_pb2 = _lazy_import("music_pb2")
+music_pb2_grpc = _lazy_import("music_pb2_grpc")
+playlist_pb2 = _lazy_import("playlist_pb2")
+playlist_pb2_grpc = _lazy_import("playlist_pb2_grpc")
+
+T = TypeVar("T")
 
 # Importar proto files (se necessário compilar primeiro)
 # python -m grpc_tools.protoc -I../../proto --python_out=. --pyi_out=. --grpc_python_out=. ../../proto/*.proto
@@ -27,20 +88,74 @@ class ClientConfig:
     """Configuração do cliente"""
     rest_base_url: str = "http://localhost:3000"
     rest_timeout: int = 5000
+    rest_pool_size: int = 100
+    rest_keepalive_timeout: float = 30.0
     graphql_url: str = "http://localhost:3000/graphql"
     graphql_timeout: int = 5000
+    graphql_pool_size: int = 100
+    graphql_keepalive_timeout: float = 30.0
+    graphql_batching: bool = False  # buscas por id simultâneas viram um documento com aliases
+    graphql_max_batch_size: int = 100
     soap_url: str = "http://localhost:8080/soap"
     soap_user_wsdl_url: str = "http://localhost:8080/user/wsdl"
     soap_music_wsdl_url: str = "http://localhost:8080/music/wsdl"
     soap_playlist_wsdl_url: str = "http://localhost:8080/playlist/wsdl"
     soap_timeout: int = 5000
+    soap_async: bool = True
+    soap_pool_size: int = 50  # conexões por pool SOAP (httpx do zeep e aiohttp do caminho rápido)
+    soap_keepalive_timeout: float = 30.0
+    soap_wsdl_cache: bool = True
+    soap_wsdl_cache_dir: Optional[str] = None
+    soap_wsdl_cache_ttl: Optional[float] = 3600
+    soap_wsdl_offline: bool = False
+    soap_fast_path: bool = False
+    columnar_results: bool = False
+    cache_enabled: bool = False
+    cache_max_entries: int = 1024
+    cache_ttl: float = 30.0
+    cache_ttls: Dict[str, float] = field(default_factory=dict)  # ex.: {"list_all_musics": 300}
+    coalesce_requests: bool = False  # chamadas iguais simultâneas compartilham a requisição e o objeto resultante
+    bulk_concurrency: Optional[int] = None  # padrão conforme o protocolo
+    router_pins: Dict[str, str] = field(default_factory=dict)  # ex.: {"list_all_musics": "grpc"}
+    router_alpha: float = 0.2
+    router_error_threshold: float = 0.5
+    router_explore_ratio: float = 0.05
+    router_cooldown: float = 5.0
+    router_max_attempts: int = 2
+    hedging: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20  # amostras do protocolo principal antes de começar a disparar
+    hedge_budget_ratio: float = 0.1  # fração máxima das chamadas roteadas com hedge
+    hedge_budget_burst: float = 10.0
+    circuit_breakers: bool = False
+    breaker_per_operation: bool = False  # um disjuntor por operação em vez de um por protocolo
+    breaker_failure_ratio: float = 0.5
+    breaker_min_calls: int = 10
+    breaker_window: int = 20
+    breaker_slow_call_threshold: Optional[float] = None  # segundos; chamadas mais lentas contam como falha
+    breaker_open_seconds: float = 5.0
+    breaker_half_open_calls: int = 3
+    playlist_index_protocol: str = "grpc"  # protocolo usado para montar o índice música → playlists
+    playlist_index_reads: bool = False  # responder *_list_playlists_by_music pelo índice (só no protocolo que o montou)
+    playlist_index_ttl: Optional[float] = 60.0  # segundos até o índice ser refeito por completo (None: sem expiração)
+    library_graph_protocol: str = "grpc"  # protocolo usado para sincronizar o grafo da biblioteca
+    library_sync_interval: float = 60.0  # segundos entre sincronizações em segundo plano (start_library_sync)
+    probe_interval: float = 10.0  # segundos entre sondagens em segundo plano (start_probing)
     grpc_url: str = "localhost:4000"
     grpc_timeout: int = 5000
+    grpc_pool_size: int = 4
+    grpc_pool_strategy: str = "round_robin"  # ou "least_outstanding"
+    grpc_keepalive_time_ms: Optional[int] = 30000
+    grpc_keepalive_timeout_ms: Optional[int] = 10000
+    grpc_max_message_bytes: Optional[int] = 64 * 1024 * 1024
+    grpc_initial_window_size: Optional[int] = None
 
 
 @dataclass
 class User:
     """Usuário"""
+    __slots__ = ("id", "name", "age")
+
     id: int
     name: str
     age: int
@@ -49,6 +164,8 @@ class User:
 @dataclass
 class Music:
     """Música"""
+    __slots__ = ("id", "name", "artist")
+
     id: int
     name: str
     artist: str
@@ -57,10 +174,173 @@ class Music:
 @dataclass
 class Playlist:
     """Playlist"""
+    __slots__ = ("id", "name")
+
     id: int
     name: str
 
 
+_COLUMNAR_TYPES = {
+    User: containers.UserColumns,
+    Music: containers.MusicColumns,
+    Playlist: containers.PlaylistColumns,
+}
+
+
+@dataclass(frozen=True)
+class _Listing:
+    """Listagem completa de um tipo em cada protocolo"""
+    rest_path: str
+    field: str  # campo GraphQL e campo repetido da resposta gRPC
+    service: str  # serviço SOAP/gRPC
+    proto: Optional[ModuleType]
+
+
+_LISTINGS = {
+    User: _Listing("/user", "users", "user", user_pb2),
+    Music: _Listing("/music", "musics", "music", music_pb2),
+    Playlist: _Listing("/playlist", "playlists", "playlist", playlist_pb2),
+}
+
+STREAM_PROTOCOLS = ("rest", "graphql", "soap", "grpc")
+# Protocolos em que iter_all_* decodifica a resposta em blocos; no gRPC (só
+# RPCs unárias) a resposta inteira chega antes da primeira linha
+INCREMENTAL_PROTOCOLS = ("rest", "graphql", "soap")
+
+# Tamanho dos blocos lidos do corpo HTTP pelos iteradores
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Métodos por id usados pelas operações em lote, por protocolo
+_BULK_METHODS = {
+    "playlists_for_users": {
+        "rest": "rest_list_user_playlists",
+        "graphql": "graphql_list_user_playlists",
+        "soap": "soap_list_playlists_by_user",
+        "grpc": "grpc_list_user_playlists",
+        "auto": "list_user_playlists",
+    },
+    "musics_for_playlists": {
+        "rest": "rest_list_playlist_musics",
+        "graphql": "graphql_list_playlist_musics",
+        "soap": "soap_list_musics_by_playlist",
+        "grpc": "grpc_list_playlist_musics",
+        "auto": "list_playlist_musics",
+    },
+    "playlists_for_musics": {
+        "rest": "rest_list_playlists_by_music",
+        "graphql": "graphql_list_playlists_by_music",
+        "soap": "soap_list_playlists_by_music",
+        "grpc": "grpc_list_playlists_by_music",
+        "auto": "list_playlists_by_music",
+    },
+}
+
+# Leituras respondidas pelo grafo da biblioteca: operação → (tipo, consulta do grafo)
+_GRAPH_READS = {
+    "list_user_playlists": (Playlist, "user_playlists"),
+    "list_playlist_musics": (Music, "playlist_musics"),
+    "list_playlists_by_music": (Playlist, "playlists_by_music"),
+}
+
+# Ativo nas operações em lote: erros propagam mesmo em métodos com ``fallback``
+_strict_errors: ContextVar[bool] = ContextVar("music_client_strict_errors", default=False)
+
+
+class _HedgeFailed(Exception):
+    """As duas chamadas de um hedge falharam (``error`` é o último erro)"""
+
+    def __init__(self, error: Exception):
+        super().__init__(str(error))
+        self.error = error
+
+
+class _ReadSpec:
+    """Metadados de um método de leitura marcado com ``_read_operation``"""
+
+    __slots__ = ("operation", "protocol", "method", "signature", "tags", "routable")
+
+    def __init__(self, operation: str, method: Callable[..., Awaitable[Any]], tags: Tuple[str, ...], routable: bool):
+        self.operation = operation
+        self.protocol = method.__name__.split("_", 1)[0]
+        self.method = method
+        self.signature = inspect.signature(method)
+        self.tags = tags
+        self.routable = routable
+
+
+def _read_operation(
+    operation: str,
+    *tags: str,
+    fallback: Optional[Callable[[], Any]] = None,
+    routable: bool = True,
+):
+    """Marcar método de leitura, que passa a ser atendido pelo cache (se ativo)
+
+    ``operation`` é o nome comum aos quatro protocolos (define o TTL e o
+    método neutro correspondente) e ``tags`` são etiquetas formatadas com os
+    argumentos do método (ex.: ``"user:{user_id}"``). Com ``fallback``, erros
+    que não sejam prazo esgotado retornam ``fallback()`` em vez de propagar.
+    Métodos com ``routable=False`` não são escolhidos pelo roteador.
+    """
+    def decorate(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        spec = _ReadSpec(operation, method, tags, routable)
+
+        @functools.wraps(method)
+        async def wrapper(self: "MusicStreamingClient", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await self._execute_read(spec, args, kwargs)
+            except DeadlineExceededError:
+                raise
+            except Exception:
+                if fallback is None or _strict_errors.get():
+                    raise
+                return fallback()
+
+        wrapper.read_spec = spec
+        return wrapper
+
+    return decorate
+
+
+def _mutation(*tags: str):
+    """Marcar método de escrita, que invalida as entradas com ``tags`` no cache,
+    no índice de playlists e no grafo da biblioteca
+
+    A invalidação ocorre mesmo em caso de erro: a escrita pode ter sido
+    aplicada no servidor antes da falha.
+    """
+    def decorate(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self: "MusicStreamingClient", *args: Any, **kwargs: Any) -> Any:
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                stores = [
+                    store for store in (self.response_cache, self.playlist_index, self.library_graph)
+                    if store is not None
+                ]
+                if stores:
+                    arguments = _bound_arguments(signature, self, args, kwargs)
+                    formatted = [tag.format(**arguments) for tag in tags]
+                    for store in stores:
+                        store.invalidate(formatted)
+
+        return wrapper
+
+    return decorate
+
+
+def _bound_arguments(signature: inspect.Signature, client: Any, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Argumentos nomeados da chamada (com valores padrão), sem ``self``"""
+    bound = signature.bind(client, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    del arguments["self"]
+    return arguments
+
+
 class MusicStreamingClient:
     """Cliente unificado para música streaming"""
 
@@ -70,29 +350,349 @@ class MusicStreamingClient:
         self.soap_user_client = None
         self.soap_music_client = None
         self.soap_playlist_client = None
-        self.grpc_clients = {}
-        self.rest_session = requests.Session()
-        self.rest_session.timeout = self.config.rest_timeout / 1000
+        self.soap_transport: Optional[zeep.transports.AsyncTransport] = None
+        self.wsdl_cache: Optional[wsdl_cache.WsdlCache] = None
+        self._soap_init_lock = asyncio.Lock()
+        self.grpc_pool = None
+        self._grpc_empty = None
+        # Sessão aiohttp criada sob demanda (precisa de um event loop ativo)
+        self.rest_session: Optional[aiohttp.ClientSession] = None
+        self.graphql_session: Optional[aiohttp.ClientSession] = None
+        self.soap_session: Optional[aiohttp.ClientSession] = None
+        self.graphql_batcher: Optional[graphql_batch.GraphQLBatcher] = None
+        self.response_cache: Optional[response_cache.ResponseCache] = None
+        if self.config.cache_enabled:
+            self.response_cache = response_cache.ResponseCache(
+                max_entries=self.config.cache_max_entries,
+                default_ttl=self.config.cache_ttl,
+                ttls=self.config.cache_ttls,
+            )
+        self.metrics = ClientMetrics()
+        self._flights = SingleFlight()
+        self.router = ProtocolRouter(
+            alpha=self.config.router_alpha,
+            error_threshold=self.config.router_error_threshold,
+            explore_ratio=self.config.router_explore_ratio,
+            cooldown=self.config.router_cooldown,
+            pins=self.config.router_pins,
+            routes={operation: list(routes) for operation, routes in _ROUTES.items()},
+        )
+        self.hedge_budget: Optional[HedgeBudget] = None
+        if self.config.hedging:
+            self.hedge_budget = HedgeBudget(self.config.hedge_budget_ratio, self.config.hedge_budget_burst)
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.prober: Optional[PeriodicProber] = None
+        self.playlist_index: Optional[PlaylistIndex] = None
+        self.library_graph: Optional[LibraryGraph] = None
+        self._library_sync_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "MusicStreamingClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Fechar conexões abertas pelo cliente"""
+        await self.stop_probing()
+        await self.stop_library_sync()
+        for session in (self.rest_session, self.graphql_session, self.soap_session):
+            if session and not session.closed:
+                await session.close()
+        self.rest_session = None
+        self.graphql_session = None
+        self.soap_session = None
+        if self.soap_transport:
+            await self.soap_transport.aclose()
+            self.soap_transport.wsdl_client.close()
+            self.soap_transport = None
+            self.soap_user_client = None
+            self.soap_music_client = None
+            self.soap_playlist_client = None
+        if self.grpc_pool:
+            await self.grpc_pool.close()
+            self.grpc_pool = None
+
+    # ==================== Prazos ====================
+
+    def _call_timeout(self, protocol: str, operation: str) -> float:
+        """Timeout efetivo da chamada: timeout do protocolo limitado pelo prazo global"""
+        timeout = getattr(self.config, f"{protocol}_timeout") / 1000
+        left = deadlines.remaining()
+        if left is not None:
+            if left <= 0:
+                raise DeadlineExceededError(f"Prazo esgotado antes de {protocol}:{operation}", protocol, operation)
+            timeout = min(timeout, left)
+        return timeout
+
+    async def _with_deadline(
+        self,
+        protocol: str,
+        operation: str,
+        call: Callable[[float], Awaitable[T]],
+        native_timeout: bool = True,
+    ) -> T:
+        """Executar chamada com o timeout efetivo, cancelando-a ao expirar
+
+        ``call`` recebe o timeout em segundos. Transportes que aplicam o
+        timeout por conta própria (aiohttp, httpx, gRPC) são aguardados
+        diretamente; os demais são cancelados via ``asyncio.wait_for``.
+        Com ``circuit_breakers``, passa antes pelo disjuntor do protocolo.
+        """
+        timeout = self._call_timeout(protocol, operation)
+        breaker = self._breaker(protocol, operation)
+        if breaker is None:
+            return await self._call_with_timeout(protocol, operation, call, timeout, native_timeout)
+
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            self.metrics.breaker_rejected += 1
+            raise
+        start = time.perf_counter()
+        try:
+            result = await self._call_with_timeout(protocol, operation, call, timeout, native_timeout)
+        except BaseException as error:
+            self._breaker_outcome(breaker, protocol, timeout, start, error)
+            raise
+        self._breaker_outcome(breaker, protocol, timeout, start, None)
+        return result
+
+    def _breaker_outcome(
+        self,
+        breaker: CircuitBreaker,
+        protocol: str,
+        timeout: float,
+        start: float,
+        error: Optional[BaseException],
+    ) -> None:
+        """Registrar no disjuntor o fim de uma chamada liberada por ``before_call``"""
+        latency = time.perf_counter() - start
+        if error is None:
+            breaker.record(latency, True)
+        elif not isinstance(error, Exception):
+            # Cancelada ou interrompida (ex.: iteração abandonada): sem resultado
+            breaker.release()
+        elif isinstance(error, DeadlineExceededError):
+            # Só conta o timeout do próprio protocolo, não um prazo global curto
+            protocol_timeout = getattr(self.config, f"{protocol}_timeout") / 1000
+            if timeout < protocol_timeout:
+                breaker.release()
+            else:
+                breaker.record(latency, False)
+        else:
+            breaker.record(latency, not self._is_backend_failure(protocol, error))
+
+    async def _call_with_timeout(
+        self,
+        protocol: str,
+        operation: str,
+        call: Callable[[float], Awaitable[T]],
+        timeout: float,
+        native_timeout: bool,
+    ) -> T:
+        try:
+            if native_timeout:
+                return await call(timeout)
+            return await asyncio.wait_for(call(timeout), timeout)
+        except DeadlineExceededError:
+            raise
+        except Exception as error:
+            if self._is_timeout(protocol, error):
+                raise DeadlineExceededError(
+                    f"Timeout de {timeout:.3f}s em {protocol}:{operation}", protocol, operation
+                ) from error
+            raise
+
+    @staticmethod
+    def _is_timeout(protocol: str, error: Exception) -> bool:
+        """Verificar se o erro é um timeout do transporte do protocolo"""
+        if isinstance(error, asyncio.TimeoutError):
+            return True
+        # Só consultar o módulo do protocolo em uso (evita importá-lo à toa)
+        if protocol == "soap":
+            return isinstance(error, httpx.TimeoutException)
+        if protocol == "grpc":
+            return isinstance(error, grpc.aio.AioRpcError) and error.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+        return False
+
+    # ==================== Disjuntores ====================
+
+    def _breaker(self, protocol: str, operation: str) -> Optional[CircuitBreaker]:
+        """Disjuntor da chamada (None com ``circuit_breakers`` desativado)"""
+        if not self.config.circuit_breakers:
+            return None
+        name = protocol
+        if self.config.breaker_per_operation:
+            # Ids no caminho REST não criam disjuntores separados
+            name = f"{protocol}:{re.sub(r'/[0-9]+', '/{id}', operation)}"
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            config = self.config
+            breaker = self.breakers[name] = CircuitBreaker(
+                name,
+                failure_ratio=config.breaker_failure_ratio,
+                min_calls=config.breaker_min_calls,
+                window=config.breaker_window,
+                slow_call_threshold=config.breaker_slow_call_threshold,
+                open_seconds=config.breaker_open_seconds,
+                half_open_calls=config.breaker_half_open_calls,
+            )
+        return breaker
+
+    def _is_backend_failure(self, protocol: str, error: Exception) -> bool:
+        """Erro que indica servidor indisponível (não um erro da aplicação, como 404 ou Fault)
+
+        Como em ``_is_timeout``, só consulta os módulos de transporte do
+        protocolo em uso; no SOAP, o aiohttp só se a sessão do caminho rápido
+        já tiver sido criada.
+        """
+        if protocol in ("rest", "graphql"):
+            return not isinstance(error, aiohttp.ClientResponseError) or error.status >= 500
+        if protocol == "soap":
+            if isinstance(error, zeep.exceptions.Fault):
+                return False
+            if isinstance(error, zeep.exceptions.TransportError):
+                return error.status_code >= 500
+            if self.soap_session is not None and isinstance(error, aiohttp.ClientResponseError):
+                return error.status >= 500
+            return True
+        if protocol == "grpc" and isinstance(error, grpc.aio.AioRpcError):
+            return error.code() in (
+                grpc.StatusCode.UNAVAILABLE,
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+                grpc.StatusCode.INTERNAL,
+                grpc.StatusCode.UNKNOWN,
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+            )
+        return True
+
+    # ==================== Cache e coalescência ====================
+
+    async def _execute_read(self, spec: _ReadSpec, args: tuple, kwargs: dict) -> Any:
+        """Executar método de leitura via cache de respostas e single-flight
+
+        Com ``coalesce_requests``, chamadas concorrentes com o mesmo método e
+        argumentos compartilham uma requisição (e o objeto resultante, que não
+        deve ser alterado por quem o recebe). A requisição compartilhada usa o
+        prazo de quem a iniciou; se ele esgotar, quem ainda tem prazo refaz a
+        chamada por conta própria.
+        """
+        self.metrics.reads += 1
+        bypassed = response_cache.bypassed()
+        if not bypassed:
+            # Grafo e índice são caches locais: ignorados, como o cache, sob bypass()
+            # (o que também evita que a própria sincronização consulte o grafo)
+            graph = self.library_graph
+            if graph is not None and graph.ready and spec.operation in _GRAPH_READS:
+                # As três leituras recebem só o id (o nome do parâmetro varia por método)
+                return await self._graph_read(spec.operation, args[0] if args else next(iter(kwargs.values())))
+            index = self.playlist_index
+            if (
+                self.config.playlist_index_reads
+                and spec.operation == "list_playlists_by_music"
+                and index is not None
+                and index.ready
+                and index.protocol == spec.protocol
+            ):
+                return await self._indexed_playlists_by_music(*args, **kwargs)
+        cache = None if bypassed else self.response_cache
+        if cache is None and not self.config.coalesce_requests:
+            return await self._send_read(spec, args, kwargs)
+
+        arguments = _bound_arguments(spec.signature, self, args, kwargs)
+        key = (spec.method.__name__, tuple(arguments.values()))
+        if cache is not None:
+            value = cache.get(key)
+            if value is not response_cache.MISSING:
+                self.metrics.cache_hits += 1
+                return value
+
+        async def fetch() -> Any:
+            generation = cache.generation if cache is not None else None
+            value = await self._send_read(spec, args, kwargs)
+            if cache is not None:
+                tags = [tag.format(**arguments) for tag in spec.tags]
+                cache.put(key, value, spec.operation, tags, generation)
+            return value
+
+        if not self.config.coalesce_requests:
+            return await fetch()
+
+        shared = self._flights.in_flight(key)
+        if shared:
+            self.metrics.coalesced += 1
+            self.metrics.max_coalesced = max(self.metrics.max_coalesced, self._flights.waiters(key) + 1)
+        try:
+            return await self._flights.do(key, fetch)
+        except DeadlineExceededError:
+            left = deadlines.remaining()
+            if not shared or (left is not None and left <= 0):
+                raise
+            self.metrics.coalesced_retries += 1
+            return await fetch()
+
+    async def _send_read(self, spec: _ReadSpec, args: tuple, kwargs: dict) -> Any:
+        """Enviar a leitura ao servidor, registrando latência e erro no roteador"""
+        self.metrics.sent += 1
+        start = time.perf_counter()
+        try:
+            value = await spec.method(self, *args, **kwargs)
+        except asyncio.CancelledError:
+            self.router.observe(spec.operation, spec.protocol, time.perf_counter() - start)
+            raise
+        except Exception:
+            self.router.record(spec.operation, spec.protocol, time.perf_counter() - start, False)
+            raise
+        self.router.record(spec.operation, spec.protocol, time.perf_counter() - start, True)
+        return value
+
+    # ==================== Resultados ====================
+
+    def _new_rows(self, row_type: type) -> containers._RowSink:
+        """Criar contêiner de resultado (dataclasses ou colunar, conforme configuração)"""
+        if self.config.columnar_results:
+            return _COLUMNAR_TYPES[row_type](row_type)
+        return containers.ObjectRows(row_type)
 
     # ==================== GraphQL ====================
 
-    def _graphql_query(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+    def _get_graphql_session(self) -> aiohttp.ClientSession:
+        """Obter sessão GraphQL com pool de conexões keep-alive próprio"""
+        if self.graphql_session is None or self.graphql_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.graphql_pool_size,
+                keepalive_timeout=self.config.graphql_keepalive_timeout,
+            )
+            self.graphql_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.graphql_timeout / 1000),
+                headers={"Content-Type": "application/json"},
+            )
+        return self.graphql_session
+
+    async def _graphql_post(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        """Enviar documento GraphQL e retornar a resposta completa (data e errors)"""
+        payload = {
+            "query": query,
+            "variables": variables or {}
+        }
+
+        session = self._get_graphql_session()
+
+        async def call(timeout: float) -> Dict[str, Any]:
+            async with session.post(
+                self.config.graphql_url, json=payload, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        return await self._with_deadline("graphql", "query", call)
+
+    async def _graphql_query(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
         """Fazer query GraphQL"""
         try:
-            payload = {
-                "query": query,
-                "variables": variables or {}
-            }
-            
-            response = requests.post(
-                self.config.graphql_url,
-                json=payload,
-                timeout=self.config.graphql_timeout / 1000,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            response.raise_for_status()
-            data = response.json()
+            data = await self._graphql_post(query, variables)
             
             if "errors" in data:
                 raise Exception(f"GraphQL error: {data['errors'][0]['message']}")
@@ -102,75 +702,123 @@ class MusicStreamingClient:
             print(f"Erro ao fazer query GraphQL: {error}")
             raise
 
+    def _get_graphql_batcher(self) -> graphql_batch.GraphQLBatcher:
+        """Obter agrupador de buscas GraphQL por id"""
+        if self.graphql_batcher is None:
+            self.graphql_batcher = graphql_batch.GraphQLBatcher(
+                self._graphql_post, max_batch_size=self.config.graphql_max_batch_size
+            )
+        return self.graphql_batcher
+
+    async def _graphql_lookup(self, field: str, ident: int, selection: str) -> Optional[Dict[str, Any]]:
+        """Buscar ``field(id:)``, agrupando com as demais buscas da mesma iteração
+
+        O lote usa o timeout GraphQL da configuração; cada chamador espera
+        apenas o quanto seu próprio prazo permitir.
+        """
+        future = self._get_graphql_batcher().load(field, ident, selection)
+        timeout = self._call_timeout("graphql", field)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(f"Timeout de {timeout:.3f}s em graphql:{field}", "graphql", field) from None
+
     # ==================== REST API ====================
 
+    def _get_rest_session(self) -> aiohttp.ClientSession:
+        """Obter sessão REST com pool de conexões keep-alive limitado"""
+        if self.rest_session is None or self.rest_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.rest_pool_size,
+                keepalive_timeout=self.config.rest_keepalive_timeout,
+            )
+            self.rest_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.rest_timeout / 1000),
+            )
+        return self.rest_session
+
+    async def _rest_get(self, path: str) -> Any:
+        """Fazer GET REST e retornar o JSON decodificado"""
+        session = self._get_rest_session()
+
+        async def call(timeout: float) -> Any:
+            async with session.get(
+                f"{self.config.rest_base_url}{path}", timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        return await self._with_deadline("rest", path, call)
+
+    @_read_operation("list_all_users", "users")
     async def rest_list_all_users(self) -> List[User]:
         """REST: Listar todos os usuários"""
         try:
-            response = self.rest_session.get(
-                f"{self.config.rest_base_url}/user"
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [User(**u) for u in data] if isinstance(data, list) else []
+            data = await self._rest_get("/user")
+            rows = self._new_rows(User)
+            if isinstance(data, list):
+                rows.add_dicts(data)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar usuários (REST): {error}")
             raise
 
+    @_read_operation("list_all_musics", "musics")
     async def rest_list_all_musics(self) -> List[Music]:
         """REST: Listar todas as músicas"""
         try:
-            response = self.rest_session.get(
-                f"{self.config.rest_base_url}/music"
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [Music(**m) for m in data] if isinstance(data, list) else []
+            data = await self._rest_get("/music")
+            rows = self._new_rows(Music)
+            if isinstance(data, list):
+                rows.add_dicts(data)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas (REST): {error}")
             raise
 
+    @_read_operation("list_user_playlists", "playlists", "user:{user_id}")
     async def rest_list_user_playlists(self, user_id: int) -> List[Playlist]:
         """REST: Listar playlists de um usuário"""
         try:
-            response = self.rest_session.get(
-                f"{self.config.rest_base_url}/user/{user_id}/playlists"
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [Playlist(**p) for p in data] if isinstance(data, list) else []
+            data = await self._rest_get(f"/user/{user_id}/playlists")
+            rows = self._new_rows(Playlist)
+            if isinstance(data, list):
+                rows.add_dicts(data)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar playlists do usuário {user_id} (REST): {error}")
             raise
 
+    @_read_operation("list_playlist_musics", "musics", "playlist:{playlist_id}")
     async def rest_list_playlist_musics(self, playlist_id: int) -> List[Music]:
         """REST: Listar músicas de uma playlist"""
         try:
-            response = self.rest_session.get(
-                f"{self.config.rest_base_url}/playlist/{playlist_id}/musics"
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [Music(**m) for m in data] if isinstance(data, list) else []
+            data = await self._rest_get(f"/playlist/{playlist_id}/musics")
+            rows = self._new_rows(Music)
+            if isinstance(data, list):
+                rows.add_dicts(data)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas da playlist {playlist_id} (REST): {error}")
             raise
 
+    @_read_operation("list_playlists_by_music", "playlists", "music:{music_id}")
     async def rest_list_playlists_by_music(self, music_id: int) -> List[Playlist]:
         """REST: Listar playlists que contêm uma música"""
         try:
-            response = self.rest_session.get(
-                f"{self.config.rest_base_url}/music/{music_id}/playlists"
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [Playlist(**p) for p in data] if isinstance(data, list) else []
+            data = await self._rest_get(f"/music/{music_id}/playlists")
+            rows = self._new_rows(Playlist)
+            if isinstance(data, list):
+                rows.add_dicts(data)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar playlists com música {music_id} (REST): {error}")
             raise
 
     # ==================== GraphQL ====================
 
+    @_read_operation("list_all_users", "users")
     async def graphql_list_all_users(self) -> List[User]:
         """GraphQL: Listar todos os usuários"""
         try:
@@ -183,13 +831,16 @@ class MusicStreamingClient:
                 }
             }
             """
-            data = self._graphql_query(query)
+            data = await self._graphql_query(query)
             users = data.get("users", [])
-            return [User(**u) for u in users]
+            rows = self._new_rows(User)
+            rows.add_dicts(users)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar usuários (GraphQL): {error}")
             raise
 
+    @_read_operation("list_all_musics", "musics")
     async def graphql_list_all_musics(self) -> List[Music]:
         """GraphQL: Listar todas as músicas"""
         try:
@@ -202,13 +853,16 @@ class MusicStreamingClient:
                 }
             }
             """
-            data = self._graphql_query(query)
+            data = await self._graphql_query(query)
             musics = data.get("musics", [])
-            return [Music(**m) for m in musics]
+            rows = self._new_rows(Music)
+            rows.add_dicts(musics)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas (GraphQL): {error}")
             raise
 
+    @_read_operation("list_user_playlists", "playlists", "user:{user_id}")
     async def graphql_list_user_playlists(self, user_id: int) -> List[Playlist]:
         """GraphQL: Listar playlists de um usuário"""
         try:
@@ -224,14 +878,20 @@ class MusicStreamingClient:
                 }
             }
             """
-            data = self._graphql_query(query, {"userId": user_id})
-            user = data.get("user", {})
+            if self.config.graphql_batching:
+                user = await self._graphql_lookup("user", user_id, "playlists { id name }") or {}
+            else:
+                data = await self._graphql_query(query, {"userId": user_id})
+                user = data.get("user") or {}
             playlists = user.get("playlists", [])
-            return [Playlist(**p) for p in playlists]
+            rows = self._new_rows(Playlist)
+            rows.add_dicts(playlists)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar playlists do usuário {user_id} (GraphQL): {error}")
             raise
 
+    @_read_operation("list_playlist_musics", "musics", "playlist:{playlist_id}")
     async def graphql_list_playlist_musics(self, playlist_id: int) -> List[Music]:
         """GraphQL: Listar músicas de uma playlist"""
         try:
@@ -248,14 +908,20 @@ class MusicStreamingClient:
                 }
             }
             """
-            data = self._graphql_query(query, {"playlistId": playlist_id})
-            playlist = data.get("playlist", {})
+            if self.config.graphql_batching:
+                playlist = await self._graphql_lookup("playlist", playlist_id, "musics { id name artist }") or {}
+            else:
+                data = await self._graphql_query(query, {"playlistId": playlist_id})
+                playlist = data.get("playlist") or {}
             musics = playlist.get("musics", [])
-            return [Music(**m) for m in musics]
+            rows = self._new_rows(Music)
+            rows.add_dicts(musics)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas da playlist {playlist_id} (GraphQL): {error}")
             raise
 
+    @_read_operation("list_playlists_by_music", "playlists", "music:{music_id}")
     async def graphql_list_playlists_by_music(self, music_id: int) -> List[Playlist]:
         """GraphQL: Listar playlists que contêm uma música"""
         try:
@@ -272,45 +938,155 @@ class MusicStreamingClient:
                 }
             }
             """
-            data = self._graphql_query(query, {"musicId": music_id})
-            music = data.get("music", {})
+            if self.config.graphql_batching:
+                music = await self._graphql_lookup("music", music_id, "playlists { id name }") or {}
+            else:
+                data = await self._graphql_query(query, {"musicId": music_id})
+                music = data.get("music") or {}
             playlists = music.get("playlists", [])
-            return [Playlist(**p) for p in playlists]
+            rows = self._new_rows(Playlist)
+            rows.add_dicts(playlists)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar playlists com música {music_id} (GraphQL): {error}")
             raise
 
     # ==================== SOAP ====================
 
+    def _get_wsdl_cache(self) -> Optional[wsdl_cache.WsdlCache]:
+        """Obter cache persistente de WSDL (None se desativado)"""
+        if self.wsdl_cache is None and (self.config.soap_wsdl_cache or self.config.soap_wsdl_offline):
+            self.wsdl_cache = wsdl_cache.WsdlCache(
+                self.config.soap_wsdl_cache_dir,
+                ttl=self.config.soap_wsdl_cache_ttl,
+                offline=self.config.soap_wsdl_offline,
+                fetch=self._fetch_wsdl,
+            )
+        return self.wsdl_cache
+
+    def _fetch_wsdl(self, url: str) -> bytes:
+        """Baixar WSDL/XSD para revalidar o cache (síncrono, como o carregamento do zeep)"""
+        response = httpx.get(url, timeout=self.config.soap_timeout / 1000)
+        if response.status_code != 200:
+            raise zeep.exceptions.TransportError(status_code=response.status_code)
+        return response.content
+
+    def _get_soap_transport(self) -> zeep.transports.AsyncTransport:
+        """Obter transporte SOAP assíncrono compartilhado pelos três serviços"""
+        if self.soap_transport is None:
+            timeout = self.config.soap_timeout / 1000
+            limits = httpx.Limits(
+                max_connections=self.config.soap_pool_size,
+                max_keepalive_connections=self.config.soap_pool_size,
+                keepalive_expiry=self.config.soap_keepalive_timeout,
+            )
+            self.soap_transport = zeep.transports.AsyncTransport(
+                client=httpx.AsyncClient(limits=limits, timeout=timeout),
+                wsdl_client=httpx.Client(timeout=timeout),
+                cache=self._get_wsdl_cache(),
+            )
+        return self.soap_transport
+
+    async def _create_soap_client(self, wsdl_url: str) -> Any:
+        """Criar cliente zeep (assíncrono ou síncrono, conforme configuração)"""
+        # O carregamento do WSDL é síncrono no zeep; executar fora do event loop
+        if self.config.soap_async:
+            return await asyncio.to_thread(
+                zeep.AsyncClient, wsdl=wsdl_url, transport=self._get_soap_transport()
+            )
+        transport = zeep.Transport(cache=self._get_wsdl_cache(), timeout=self.config.soap_timeout / 1000)
+        return await asyncio.to_thread(zeep.Client, wsdl=wsdl_url, transport=transport)
+
     async def _initialize_soap_user_client(self) -> None:
         """Inicializar cliente SOAP de usuários"""
-        if self.soap_user_client:
-            return
-        try:
-            self.soap_user_client = SoapClient(wsdl=self.config.soap_user_wsdl_url)
-        except Exception as error:
-            print(f"Erro ao inicializar cliente SOAP de usuários: {error}")
-            raise
+        async with self._soap_init_lock:
+            if self.soap_user_client:
+                return
+            try:
+                self.soap_user_client = await self._create_soap_client(self.config.soap_user_wsdl_url)
+            except Exception as error:
+                print(f"Erro ao inicializar cliente SOAP de usuários: {error}")
+                raise
 
     async def _initialize_soap_music_client(self) -> None:
         """Inicializar cliente SOAP de músicas"""
-        if self.soap_music_client:
-            return
-        try:
-            self.soap_music_client = SoapClient(wsdl=self.config.soap_music_wsdl_url)
-        except Exception as error:
-            print(f"Erro ao inicializar cliente SOAP de músicas: {error}")
-            raise
+        async with self._soap_init_lock:
+            if self.soap_music_client:
+                return
+            try:
+                self.soap_music_client = await self._create_soap_client(self.config.soap_music_wsdl_url)
+            except Exception as error:
+                print(f"Erro ao inicializar cliente SOAP de músicas: {error}")
+                raise
 
     async def _initialize_soap_playlist_client(self) -> None:
         """Inicializar cliente SOAP de playlists"""
-        if self.soap_playlist_client:
-            return
-        try:
-            self.soap_playlist_client = SoapClient(wsdl=self.config.soap_playlist_wsdl_url)
-        except Exception as error:
-            print(f"Erro ao inicializar cliente SOAP de playlists: {error}")
-            raise
+        async with self._soap_init_lock:
+            if self.soap_playlist_client:
+                return
+            try:
+                self.soap_playlist_client = await self._create_soap_client(self.config.soap_playlist_wsdl_url)
+            except Exception as error:
+                print(f"Erro ao inicializar cliente SOAP de playlists: {error}")
+                raise
+
+    async def _soap_call(self, client: Any, operation: str, *args, **kwargs) -> Any:
+        """Executar operação SOAP sem bloquear o event loop"""
+        method = getattr(client.service, operation)
+        if self.config.soap_async:
+            call = lambda timeout: method(*args, **kwargs)
+        else:
+            call = lambda timeout: asyncio.to_thread(method, *args, **kwargs)
+        return await self._with_deadline("soap", operation, call, native_timeout=False)
+
+    def _soap_service_url(self, service: str) -> str:
+        """Endpoint do serviço SOAP (URL do WSDL sem o sufixo /wsdl)"""
+        wsdl_url = getattr(self.config, f"soap_{service}_wsdl_url")
+        return wsdl_url[: -len("/wsdl")] if wsdl_url.endswith("/wsdl") else wsdl_url
+
+    def _get_soap_session(self) -> aiohttp.ClientSession:
+        """Obter sessão aiohttp do caminho rápido SOAP
+
+        O caminho rápido só faz POSTs de envelopes prontos; o pool do aiohttp
+        escala melhor com muitas requisições simultâneas que o do httpx, que
+        continua sendo usado pelo zeep. É um segundo pool SOAP, limitado
+        também a ``soap_pool_size``: com zeep e caminho rápido em uso ao mesmo
+        tempo, o servidor pode ver até o dobro de conexões.
+        """
+        if self.soap_session is None or self.soap_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.soap_pool_size,
+                keepalive_timeout=self.config.soap_keepalive_timeout,
+            )
+            self.soap_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.soap_timeout / 1000),
+            )
+        return self.soap_session
+
+    async def _soap_fast_call(self, service: str, action: str, row_type: type, ident: Optional[int] = None) -> Any:
+        """Caminho rápido: envelope pré-serializado + decodificação em uma passada"""
+        operation = soap_fast.OPERATIONS[(service, action)]
+        session = self._get_soap_session()
+
+        async def call(timeout: float) -> bytes:
+            async with session.post(
+                self._soap_service_url(service),
+                data=operation.build_request(ident),
+                headers=soap_fast.request_headers(operation),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                content = await response.read()
+                # Falhas SOAP chegam com status 500 e corpo XML com <soap:Fault>
+                if response.status == 500:
+                    soap_fast.raise_for_fault(content)
+                response.raise_for_status()
+                return content
+
+        content = await self._with_deadline("soap", action, call)
+        rows = self._new_rows(row_type)
+        soap_fast.decode_into(content, operation, rows.add)
+        return rows.result()
 
     def _parse_soap_response(self, response: Any) -> List[Dict]:
         """Parse de resposta SOAP para lista de dicionários"""
@@ -326,130 +1102,147 @@ class MusicStreamingClient:
             return response
         return []
 
+    @_read_operation("list_all_users", "users")
     async def soap_list_all_users(self) -> List[User]:
         """SOAP: Listar todos os usuários"""
         try:
+            if self.config.soap_fast_path:
+                return await self._soap_fast_call("user", "FindAll", User)
+
             if not self.soap_user_client:
                 await self._initialize_soap_user_client()
             
-            result = self.soap_user_client.service.FindAll()
+            result = await self._soap_call(self.soap_user_client, "FindAll")
             users_data = self._parse_soap_response(result)
             
-            users = []
+            rows = self._new_rows(User)
             for u in users_data:
                 if isinstance(u, dict):
                     try:
-                        users.append(User(
-                            id=int(u.get('id', 0)),
-                            name=str(u.get('name', '')),
-                            age=int(u.get('age', 0))
-                        ))
+                        rows.add(
+                            int(u.get('id', 0)),
+                            str(u.get('name', '')),
+                            int(u.get('age', 0))
+                        )
                     except (ValueError, TypeError):
                         continue
             
-            return users
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar usuários (SOAP): {error}")
             raise
 
+    @_read_operation("list_all_musics", "musics")
     async def soap_list_all_musics(self) -> List[Music]:
         """SOAP: Listar todas as músicas"""
         try:
+            if self.config.soap_fast_path:
+                return await self._soap_fast_call("music", "FindAll", Music)
+
             if not self.soap_music_client:
                 await self._initialize_soap_music_client()
             
-            result = self.soap_music_client.service.FindAll()
+            result = await self._soap_call(self.soap_music_client, "FindAll")
             musics_data = self._parse_soap_response(result)
             
-            musics = []
+            rows = self._new_rows(Music)
             for m in musics_data:
                 if isinstance(m, dict):
                     try:
-                        musics.append(Music(
-                            id=int(m.get('id', 0)),
-                            name=str(m.get('name', '')),
-                            artist=str(m.get('artist', ''))
-                        ))
+                        rows.add(
+                            int(m.get('id', 0)),
+                            str(m.get('name', '')),
+                            str(m.get('artist', ''))
+                        )
                     except (ValueError, TypeError):
                         continue
             
-            return musics
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas (SOAP): {error}")
             raise
 
+    @_read_operation("list_user_playlists", "playlists", "user:{user_id}")
     async def soap_list_playlists_by_user(self, user_id: int) -> List[Playlist]:
         """SOAP: Listar playlists de um usuário"""
         try:
+            if self.config.soap_fast_path:
+                return await self._soap_fast_call("user", "FindPlaylists", Playlist, user_id)
+
             if not self.soap_user_client:
                 await self._initialize_soap_user_client()
             
-            result = self.soap_user_client.service.FindPlaylists(user_id)
+            result = await self._soap_call(self.soap_user_client, "FindPlaylists", user_id)
             playlists_data = self._parse_soap_response(result)
             
-            playlists = []
+            rows = self._new_rows(Playlist)
             for p in playlists_data:
                 if isinstance(p, dict):
                     try:
-                        playlists.append(Playlist(
-                            id=int(p.get('id', 0)),
-                            name=str(p.get('name', ''))
-                        ))
+                        rows.add(
+                            int(p.get('id', 0)),
+                            str(p.get('name', ''))
+                        )
                     except (ValueError, TypeError):
                         continue
             
-            return playlists
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar playlists do usuário {user_id} (SOAP): {error}")
             raise
 
+    @_read_operation("list_playlist_musics", "musics", "playlist:{playlist_id}")
     async def soap_list_musics_by_playlist(self, playlist_id: int) -> List[Music]:
         """SOAP: Listar músicas de uma playlist"""
         try:
+            if self.config.soap_fast_path:
+                return await self._soap_fast_call("playlist", "FindMusics", Music, playlist_id)
+
             if not self.soap_playlist_client:
                 await self._initialize_soap_playlist_client()
             
-            result = self.soap_playlist_client.service.FindMusics(playlist_id)
+            result = await self._soap_call(self.soap_playlist_client, "FindMusics", playlist_id)
             musics_data = self._parse_soap_response(result)
             
-            musics = []
+            rows = self._new_rows(Music)
             for m in musics_data:
                 if isinstance(m, dict):
                     try:
-                        musics.append(Music(
-                            id=int(m.get('id', 0)),
-                            name=str(m.get('name', '')),
-                            artist=str(m.get('artist', ''))
-                        ))
+                        rows.add(
+                            int(m.get('id', 0)),
+                            str(m.get('name', '')),
+                            str(m.get('artist', ''))
+                        )
                     except (ValueError, TypeError):
                         continue
             
-            return musics
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas da playlist {playlist_id} (SOAP): {error}")
             raise
 
+    @_read_operation("list_playlists_by_music", "playlists", "music:{music_id}")
     async def soap_list_playlists_by_music(self, music_id: int) -> List[Playlist]:
         """SOAP: Listar playlists que contêm uma música"""
         try:
             if not self.soap_music_client:
                 await self._initialize_soap_music_client()
             
-            result = self.soap_music_client.service.FindPlaylists(musicId=music_id)
+            result = await self._soap_call(self.soap_music_client, "FindPlaylists", musicId=music_id)
             playlists_data = self._parse_soap_response(result)
             
-            playlists = []
+            rows = self._new_rows(Playlist)
             for p in playlists_data:
                 if isinstance(p, dict):
                     try:
-                        playlists.append(Playlist(
-                            id=int(p.get('id', 0)),
-                            name=str(p.get('name', ''))
-                        ))
+                        rows.add(
+                            int(p.get('id', 0)),
+                            str(p.get('name', ''))
+                        )
                     except (ValueError, TypeError):
                         continue
             
-            return playlists
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar playlists com música {music_id} (SOAP): {error}")
             raise
@@ -458,7 +1251,7 @@ class MusicStreamingClient:
 
     async def _initialize_grpc_clients(self) -> None:
         """Inicializar clientes gRPC"""
-        if self.grpc_clients:
+        if self.grpc_pool:
             return
 
         if not grpc:
@@ -467,19 +1260,30 @@ class MusicStreamingClient:
         try:
             # Tentar importar os proto files compilados
             try:
-                import user_pb2, user_pb2_grpc
-                import music_pb2, music_pb2_grpc
-                import playlist_pb2, playlist_pb2_grpc
-                
-                # Criar canal assíncrono
-                channel = grpc.aio.insecure_channel(self.config.grpc_url)
-                
-                # Criar stubs
-                self.grpc_clients['user'] = user_pb2_grpc.UserServiceStub(channel)
-                self.grpc_clients['music'] = music_pb2_grpc.MusicServiceStub(channel)
-                self.grpc_clients['playlist'] = playlist_pb2_grpc.PlaylistServiceStub(channel)
-                self.grpc_clients['channel'] = channel
-                
+                if not (user_pb2_grpc and music_pb2_grpc and playlist_pb2_grpc and empty_pb2):
+                    raise ImportError("proto files compilados não encontrados")
+                from grpc_pool import GrpcChannelPool, build_channel_options
+
+                # Criar pool de canais assíncronos, cada um com os três stubs
+                self.grpc_pool = GrpcChannelPool(
+                    self.config.grpc_url,
+                    {
+                        'user': user_pb2_grpc.UserServiceStub,
+                        'music': music_pb2_grpc.MusicServiceStub,
+                        'playlist': playlist_pb2_grpc.PlaylistServiceStub,
+                    },
+                    size=self.config.grpc_pool_size,
+                    strategy=self.config.grpc_pool_strategy,
+                    options=build_channel_options(
+                        keepalive_time_ms=self.config.grpc_keepalive_time_ms,
+                        keepalive_timeout_ms=self.config.grpc_keepalive_timeout_ms,
+                        max_message_bytes=self.config.grpc_max_message_bytes,
+                        initial_window_size=self.config.grpc_initial_window_size,
+                    ),
+                )
+                # Mensagem vazia reutilizada pelas RPCs FindAll
+                self._grpc_empty = empty_pb2.Empty()
+
             except ImportError as e:
                 print(f"Proto files não encontrados. Compile com: python -m grpc_tools.protoc -I../../proto --python_out=. --pyi_out=. --grpc_python_out=. ../../proto/*.proto")
                 raise
@@ -488,158 +1292,850 @@ class MusicStreamingClient:
             print(f"Erro ao inicializar clientes gRPC: {error}")
             raise
 
+    async def _grpc_call(self, service: str, method: str, request: Any = None) -> Any:
+        """Executar RPC unária em um canal do pool, propagando o prazo ao servidor
+
+        Sem ``request``, envia a mensagem vazia compartilhada.
+        """
+        if not self.grpc_pool:
+            await self._initialize_grpc_clients()
+        if request is None:
+            request = self._grpc_empty
+
+        async def call(timeout: float) -> Any:
+            with self.grpc_pool.acquire(service) as stub:
+                return await getattr(stub, method)(request, timeout=timeout)
+
+        return await self._with_deadline("grpc", f"{service}.{method}", call)
+
+    @_read_operation("list_all_users", "users", fallback=list)
     async def grpc_list_all_users(self) -> List[User]:
         """gRPC: Listar todos os usuários"""
         try:
-            if not self.grpc_clients.get('user'):
-                await self._initialize_grpc_clients()
-            
-            # Importar Empty do protobuf
-            from google.protobuf.empty_pb2 import Empty
-            import user_pb2
+            response = await self._grpc_call('user', 'FindAll')
             
-            stub = self.grpc_clients['user']
-            response = await stub.FindAll(Empty())
-            
-            users = []
-            for user in response.users:
-                users.append(User(
-                    id=user.id,
-                    name=user.name,
-                    age=user.age
-                ))
-            
-            return users
+            rows = self._new_rows(User)
+            rows.add_objects(response.users)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar usuários (gRPC): {error}")
-            # Retornar lista vazia em caso de erro
-            return []
+            raise
 
+    @_read_operation("list_all_musics", "musics", fallback=list)
     async def grpc_list_all_musics(self) -> List[Music]:
         """gRPC: Listar todas as músicas"""
         try:
-            if not self.grpc_clients.get('music'):
-                await self._initialize_grpc_clients()
-            
-            from google.protobuf.empty_pb2 import Empty
-            import music_pb2
+            response = await self._grpc_call('music', 'FindAll')
             
-            stub = self.grpc_clients['music']
-            response = await stub.FindAll(Empty())
-            
-            musics = []
-            for music in response.musics:
-                musics.append(Music(
-                    id=music.id,
-                    name=music.name,
-                    artist=music.artist
-                ))
-            
-            return musics
+            rows = self._new_rows(Music)
+            rows.add_objects(response.musics)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas (gRPC): {error}")
-            return []
+            raise
 
+    @_read_operation("list_user_playlists", "playlists", "user:{user_id}", fallback=list)
     async def grpc_list_user_playlists(self, user_id: int) -> List[Playlist]:
         """gRPC: Listar playlists de um usuário"""
         try:
-            if not self.grpc_clients.get('user'):
-                await self._initialize_grpc_clients()
-            
-            import user_pb2
-            
-            stub = self.grpc_clients['user']
             request = user_pb2.UserById(id=user_id)
-            response = await stub.FindPlaylists(request)
+            response = await self._grpc_call('user', 'FindPlaylists', request)
             
-            playlists = []
-            for playlist in response.playlists:
-                playlists.append(Playlist(
-                    id=playlist.id,
-                    name=playlist.name
-                ))
-            
-            return playlists
+            rows = self._new_rows(Playlist)
+            rows.add_objects(response.playlists)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar playlists do usuário {user_id} (gRPC): {error}")
-            return []
+            raise
 
+    @_read_operation("list_playlist_musics", "musics", "playlist:{playlist_id}", fallback=list)
     async def grpc_list_playlist_musics(self, playlist_id: int) -> List[Music]:
         """gRPC: Listar músicas de uma playlist"""
         try:
-            if not self.grpc_clients.get('playlist'):
-                await self._initialize_grpc_clients()
-            
-            import playlist_pb2
-            
-            stub = self.grpc_clients['playlist']
             request = playlist_pb2.PlaylistById(id=playlist_id)
-            response = await stub.FindMusics(request)
+            response = await self._grpc_call('playlist', 'FindMusics', request)
             
-            musics = []
-            for music in response.musics:
-                musics.append(Music(
-                    id=music.id,
-                    name=music.name,
-                    artist=music.artist
-                ))
-            
-            return musics
+            rows = self._new_rows(Music)
+            rows.add_objects(response.musics)
+            return rows.result()
         except Exception as error:
             print(f"Erro ao listar músicas da playlist {playlist_id} (gRPC): {error}")
-            return []
+            raise
 
+    @_read_operation("list_playlists_by_music", "playlists", "music:{music_id}", fallback=list, routable=False)
     async def grpc_list_playlists_by_music(self, music_id: int) -> List[Playlist]:
-        """gRPC: Listar playlists que contêm uma música"""
-        try:
-            # Método não implementado no serviço gRPC de música
-            # Retornar lista vazia por enquanto
-            print(f"Método grpc_list_playlists_by_music não implementado no servidor gRPC")
+        """gRPC: Listar playlists que contêm uma música
+
+        O serviço gRPC não tem busca reversa. Com ``playlist_index_reads``, a
+        resposta vem do índice música → playlists montado via gRPC (no primeiro
+        uso, se ainda não houver índice); sem ele, retorna lista vazia.
+        """
+        if not self.config.playlist_index_reads:
+            print("Método grpc_list_playlists_by_music não implementado no servidor gRPC (use playlist_index_reads)")
             return []
+        try:
+            index = self.playlist_index
+            if index is None or not index.ready:
+                await self._flights.do(
+                    ("playlist_index", "build"), lambda: self.build_playlist_index(protocol="grpc")
+                )
+            elif index.protocol != "grpc":
+                raise RuntimeError(f"Índice de playlists montado via {index.protocol}, não gRPC")
+            return await self._indexed_playlists_by_music(music_id)
         except Exception as error:
             print(f"Erro ao listar playlists com música {music_id} (gRPC): {error}")
-            return []
+            raise
+
+    # ==================== gRPC: escrita ====================
+
+    @staticmethod
+    def _present(**fields: Any) -> Dict[str, Any]:
+        """Somente os campos informados (campos ``optional`` das requisições de atualização)"""
+        return {name: value for name, value in fields.items() if value is not None}
+
+    @_mutation("users")
+    async def grpc_create_user(self, name: str, age: int) -> User:
+        """gRPC: Criar usuário"""
+        try:
+            request = user_pb2.CreateUserRequest(name=name, age=age)
+            response = await self._grpc_call('user', 'Create', request)
+            return User(response.id, response.name, response.age)
+        except Exception as error:
+            print(f"Erro ao criar usuário (gRPC): {error}")
+            raise
+
+    @_mutation("users")
+    async def grpc_update_user(self, user_id: int, name: Optional[str] = None, age: Optional[int] = None) -> User:
+        """gRPC: Atualizar usuário (somente os campos informados)"""
+        try:
+            request = user_pb2.UpdateUserRequest(id=user_id, **self._present(name=name, age=age))
+            response = await self._grpc_call('user', 'Update', request)
+            return User(response.id, response.name, response.age)
+        except Exception as error:
+            print(f"Erro ao atualizar usuário {user_id} (gRPC): {error}")
+            raise
+
+    @_mutation("users", "user:{user_id}")
+    async def grpc_delete_user(self, user_id: int) -> bool:
+        """gRPC: Remover usuário"""
+        try:
+            response = await self._grpc_call('user', 'Delete', user_pb2.UserById(id=user_id))
+            return response.success
+        except Exception as error:
+            print(f"Erro ao remover usuário {user_id} (gRPC): {error}")
+            raise
+
+    @_mutation("user:{user_id}")
+    async def grpc_add_playlist_to_user(self, user_id: int, playlist_id: int) -> bool:
+        """gRPC: Associar playlist a um usuário"""
+        try:
+            request = user_pb2.AddPlaylistToUserRequest(userId=user_id, playlistId=playlist_id)
+            response = await self._grpc_call('user', 'AddPlaylist', request)
+            return response.success
+        except Exception as error:
+            print(f"Erro ao associar playlist {playlist_id} ao usuário {user_id} (gRPC): {error}")
+            raise
+
+    @_mutation("user:{user_id}")
+    async def grpc_remove_playlist_from_user(self, user_id: int, playlist_id: int) -> bool:
+        """gRPC: Desassociar playlist de um usuário"""
+        try:
+            request = user_pb2.RemovePlaylistFromUserRequest(userId=user_id, playlistId=playlist_id)
+            response = await self._grpc_call('user', 'RemovePlaylist', request)
+            return response.success
+        except Exception as error:
+            print(f"Erro ao desassociar playlist {playlist_id} do usuário {user_id} (gRPC): {error}")
+            raise
+
+    @_mutation("musics")
+    async def grpc_create_music(self, name: str, artist: str) -> Music:
+        """gRPC: Criar música"""
+        try:
+            request = music_pb2.CreateMusicRequest(name=name, artist=artist)
+            response = await self._grpc_call('music', 'Create', request)
+            return Music(response.id, response.name, response.artist)
+        except Exception as error:
+            print(f"Erro ao criar música (gRPC): {error}")
+            raise
+
+    @_mutation("musics")
+    async def grpc_update_music(self, music_id: int, name: Optional[str] = None, artist: Optional[str] = None) -> Music:
+        """gRPC: Atualizar música (somente os campos informados)"""
+        try:
+            request = music_pb2.UpdateMusicRequest(id=music_id, **self._present(name=name, artist=artist))
+            response = await self._grpc_call('music', 'Update', request)
+            return Music(response.id, response.name, response.artist)
+        except Exception as error:
+            print(f"Erro ao atualizar música {music_id} (gRPC): {error}")
+            raise
+
+    @_mutation("musics", "music:{music_id}")
+    async def grpc_delete_music(self, music_id: int) -> bool:
+        """gRPC: Remover música"""
+        try:
+            response = await self._grpc_call('music', 'Delete', music_pb2.MusicById(id=music_id))
+            return response.success
+        except Exception as error:
+            print(f"Erro ao remover música {music_id} (gRPC): {error}")
+            raise
+
+    @_mutation("playlists")
+    async def grpc_create_playlist(self, name: str) -> Playlist:
+        """gRPC: Criar playlist"""
+        try:
+            response = await self._grpc_call('playlist', 'Create', playlist_pb2.CreatePlaylistRequest(name=name))
+            return Playlist(response.id, response.name)
+        except Exception as error:
+            print(f"Erro ao criar playlist (gRPC): {error}")
+            raise
+
+    @_mutation("playlists")
+    async def grpc_update_playlist(self, playlist_id: int, name: Optional[str] = None) -> Playlist:
+        """gRPC: Atualizar playlist (somente os campos informados)"""
+        try:
+            request = playlist_pb2.UpdatePlaylistRequest(id=playlist_id, **self._present(name=name))
+            response = await self._grpc_call('playlist', 'Update', request)
+            return Playlist(response.id, response.name)
+        except Exception as error:
+            print(f"Erro ao atualizar playlist {playlist_id} (gRPC): {error}")
+            raise
+
+    @_mutation("playlists", "playlist:{playlist_id}")
+    async def grpc_delete_playlist(self, playlist_id: int) -> bool:
+        """gRPC: Remover playlist"""
+        try:
+            response = await self._grpc_call('playlist', 'Delete', playlist_pb2.PlaylistById(id=playlist_id))
+            return response.success
+        except Exception as error:
+            print(f"Erro ao remover playlist {playlist_id} (gRPC): {error}")
+            raise
+
+    @_mutation("playlist:{playlist_id}", "music:{music_id}")
+    async def grpc_add_music_to_playlist(self, playlist_id: int, music_id: int) -> bool:
+        """gRPC: Adicionar música a uma playlist"""
+        try:
+            request = playlist_pb2.AddMusicToPlaylistRequest(playlistId=playlist_id, musicId=music_id)
+            response = await self._grpc_call('playlist', 'AddMusic', request)
+            return response.success
+        except Exception as error:
+            print(f"Erro ao adicionar música {music_id} à playlist {playlist_id} (gRPC): {error}")
+            raise
+
+    @_mutation("playlist:{playlist_id}", "music:{music_id}")
+    async def grpc_remove_music_from_playlist(self, playlist_id: int, music_id: int) -> bool:
+        """gRPC: Remover música de uma playlist"""
+        try:
+            request = playlist_pb2.RemoveMusicFromPlaylistRequest(playlistId=playlist_id, musicId=music_id)
+            response = await self._grpc_call('playlist', 'RemoveMusic', request)
+            return response.success
+        except Exception as error:
+            print(f"Erro ao remover música {music_id} da playlist {playlist_id} (gRPC): {error}")
+            raise
+
+    # ==================== Operações em lote ====================
+
+    async def list_playlists_for_users(
+        self, user_ids: Sequence[int], protocol: str = "rest", concurrency: Optional[int] = None
+    ) -> List[BulkResult]:
+        """Listar as playlists de vários usuários (um BulkResult por id, na ordem dos ids)"""
+        return await self._bulk("playlists_for_users", user_ids, protocol, concurrency)
+
+    async def list_musics_for_playlists(
+        self, playlist_ids: Sequence[int], protocol: str = "rest", concurrency: Optional[int] = None
+    ) -> List[BulkResult]:
+        """Listar as músicas de várias playlists (um BulkResult por id, na ordem dos ids)"""
+        return await self._bulk("musics_for_playlists", playlist_ids, protocol, concurrency)
+
+    async def list_playlists_for_musics(
+        self, music_ids: Sequence[int], protocol: str = "rest", concurrency: Optional[int] = None
+    ) -> List[BulkResult]:
+        """Listar as playlists que contêm cada uma de várias músicas"""
+        return await self._bulk("playlists_for_musics", music_ids, protocol, concurrency)
+
+    def _bulk_concurrency(self, protocol: str) -> int:
+        """Chamadas simultâneas padrão de um lote no protocolo"""
+        if self.config.bulk_concurrency:
+            return self.config.bulk_concurrency
+        if protocol == "auto":
+            # O roteador escolhe por chamada; limitar pelo pool HTTP
+            return self.config.rest_pool_size
+        if protocol == "graphql" and self.config.graphql_batching:
+            # Buscas simultâneas viram poucos documentos com aliases
+            return self.config.graphql_max_batch_size * 4
+        if protocol == "grpc":
+            # Streams HTTP/2 concorrentes distribuídos entre os canais do pool
+            return self.config.grpc_pool_size * 50
+        return getattr(self.config, f"{protocol}_pool_size")
+
+    async def _bulk(
+        self, operation: str, ids: Sequence[int], protocol: str, concurrency: Optional[int]
+    ) -> List[BulkResult]:
+        """Executar o método por id do protocolo para todos os ids"""
+        methods = _BULK_METHODS[operation]
+        if protocol not in methods:
+            raise ValueError(f"Protocolo inválido: {protocol} (use {', '.join(methods)})")
+        method = getattr(self, methods[protocol])
+        token = _strict_errors.set(True)
+        try:
+            return await fan_out(list(ids), method, concurrency or self._bulk_concurrency(protocol))
+        finally:
+            _strict_errors.reset(token)
+
+    # ==================== Índice música → playlists ====================
+
+    async def build_playlist_index(self, protocol: Optional[str] = None) -> PlaylistIndex:
+        """Montar o índice invertido música → playlists
+
+        Lista as playlists e busca as músicas de todas em paralelo. Com
+        ``playlist_index_reads``, ``*_list_playlists_by_music`` do protocolo
+        usado aqui passa a ser respondido localmente; as escritas do cliente
+        marcam o que precisa ser buscado de novo antes da próxima consulta, e
+        depois de ``playlist_index_ttl`` o índice é refeito por completo.
+        """
+        if self.playlist_index is None:
+            self.playlist_index = PlaylistIndex()
+        await self.refresh_playlist_index(full=True, protocol=protocol)
+        return self.playlist_index
+
+    async def refresh_playlist_index(self, full: bool = False, protocol: Optional[str] = None) -> int:
+        """Atualizar o índice e retornar quantas playlists tiveram as músicas buscadas
+
+        Sem ``full``, só busca as playlists novas ou desatualizadas; a
+        listagem completa só é refeita se alguma escrita a tiver pedido. O
+        protocolo padrão é o da última atualização completa.
+        """
+        index = self.playlist_index
+        if index is None:
+            raise RuntimeError("Índice de playlists não montado (use build_playlist_index)")
+        protocol = protocol or index.protocol or self.config.playlist_index_protocol
+        with response_cache.bypass():
+            if full or index.needs_listing:
+                playlists = [playlist async for playlist in self.iter_all_playlists(protocol)]
+                playlist_ids = index.sync_playlists(playlists, full)
+            else:
+                playlist_ids = sorted(index.stale)
+            results = await self._bulk("musics_for_playlists", playlist_ids, protocol, None)
+        for result in results:
+            if result.ok:
+                index.set_musics(result.id, [music.id for music in result.value])
+            else:
+                index.stale.add(result.id)
+        if full:
+            index.protocol = protocol
+            index.refreshed_at = time.monotonic()
+        index.refreshes += 1
+        return len(playlist_ids)
+
+    async def _indexed_playlists_by_music(self, music_id: int) -> Any:
+        """Responder pelo índice, atualizando antes o que as escritas marcaram
+
+        Vencido o ``playlist_index_ttl``, o índice é refeito por completo antes
+        da resposta (escritas de outros clientes só aparecem assim).
+        """
+        index = self.playlist_index
+        if index.expired(self.config.playlist_index_ttl):
+            await self._flights.do(("playlist_index", "full"), lambda: self.refresh_playlist_index(full=True))
+        elif index.dirty:
+            await self._flights.do(("playlist_index",), self.refresh_playlist_index)
+        self.metrics.index_hits += 1
+        rows = self._new_rows(Playlist)
+        for playlist in index.playlists_by_music(music_id):
+            rows.add(playlist.id, playlist.name)
+        return rows.result()
+
+    # ==================== Grafo da biblioteca ====================
+
+    async def build_library_graph(self, protocol: Optional[str] = None) -> LibraryGraph:
+        """Montar o grafo da biblioteca com uma varredura paralela
+
+        Depois de montado, ``*_list_user_playlists``, ``*_list_playlist_musics``
+        e ``*_list_playlists_by_music`` de todos os protocolos são respondidos
+        da memória; as escritas do cliente marcam os nós a buscar de novo antes
+        da próxima consulta.
+        """
+        if self.library_graph is None:
+            self.library_graph = LibraryGraph()
+        await self.sync_library_graph(full=True, protocol=protocol)
+        return self.library_graph
+
+    async def sync_library_graph(self, full: bool = False, protocol: Optional[str] = None) -> GraphDiff:
+        """Sincronizar o grafo com o servidor e retornar as diferenças aplicadas
+
+        Com ``full``, relista tudo e busca de novo as arestas de todos os
+        usuários e playlists; sem ``full``, busca só os nós novos ou marcados
+        por escritas (e só relista se alguma escrita tiver pedido).
+        """
+        graph = self.library_graph
+        if graph is None:
+            raise RuntimeError("Grafo da biblioteca não montado (use build_library_graph)")
+        protocol = protocol or self.config.library_graph_protocol
+        users = musics = playlists = None
+        with response_cache.bypass():
+            if full or graph.needs_listing:
+                users, musics, playlists = await asyncio.gather(
+                    *(self._collect_all(row_type, protocol) for row_type in (User, Music, Playlist))
+                )
+                if full:
+                    user_ids = [user.id for user in users]
+                    playlist_ids = [playlist.id for playlist in playlists]
+                else:
+                    user_ids, playlist_ids = graph.stale_ids(
+                        (user.id for user in users), (playlist.id for playlist in playlists)
+                    )
+            else:
+                user_ids, playlist_ids = sorted(graph.stale_users), sorted(graph.stale_playlists)
+            user_results, playlist_results = await asyncio.gather(
+                self._bulk("playlists_for_users", user_ids, protocol, None),
+                self._bulk("musics_for_playlists", playlist_ids, protocol, None),
+            )
+
+        diff = graph.apply(
+            users, musics, playlists,
+            {result.id: [row.id for row in result.value] for result in user_results if result.ok},
+            {result.id: [row.id for row in result.value] for result in playlist_results if result.ok},
+        )
+        # Falhas ficam marcadas para a próxima sincronização
+        graph.stale_users.update(result.id for result in user_results if not result.ok)
+        graph.stale_playlists.update(result.id for result in playlist_results if not result.ok)
+        return diff
+
+    def start_library_sync(self, interval: Optional[float] = None) -> None:
+        """Sincronizar o grafo completo periodicamente em segundo plano"""
+        if self.library_graph is None:
+            raise RuntimeError("Grafo da biblioteca não montado (use build_library_graph)")
+        if self._library_sync_task is None or self._library_sync_task.done():
+            self._library_sync_task = asyncio.ensure_future(
+                self._library_sync_loop(interval or self.config.library_sync_interval)
+            )
+
+    async def stop_library_sync(self) -> None:
+        """Parar a sincronização em segundo plano"""
+        task, self._library_sync_task = self._library_sync_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _library_sync_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync_library_graph(full=True)
+            except Exception as error:
+                print(f"Erro ao sincronizar o grafo da biblioteca: {error}")
+
+    async def _collect_all(self, row_type: type, protocol: str) -> List[Any]:
+        return [row async for row in self._iter_all(row_type, protocol)]
+
+    async def _graph_read(self, operation: str, ident: int) -> Any:
+        """Responder pelo grafo, sincronizando antes os nós marcados por escritas"""
+        graph = self.library_graph
+        if graph.dirty:
+            await self._flights.do(("library_graph",), self.sync_library_graph)
+        self.metrics.graph_hits += 1
+        row_type, query = _GRAPH_READS[operation]
+        rows = self._new_rows(row_type)
+        rows.add_objects(getattr(graph, query)(ident))
+        return rows.result()
+
+    # ==================== Roteamento por latência ====================
+
+    async def list_all_users(self) -> List[User]:
+        """Listar usuários pelo protocolo mais rápido no momento"""
+        return await self._route("list_all_users")
+
+    async def list_all_musics(self) -> List[Music]:
+        """Listar músicas pelo protocolo mais rápido no momento"""
+        return await self._route("list_all_musics")
+
+    async def list_user_playlists(self, user_id: int) -> List[Playlist]:
+        """Listar playlists de um usuário pelo protocolo mais rápido no momento"""
+        return await self._route("list_user_playlists", user_id)
+
+    async def list_playlist_musics(self, playlist_id: int) -> List[Music]:
+        """Listar músicas de uma playlist pelo protocolo mais rápido no momento"""
+        return await self._route("list_playlist_musics", playlist_id)
+
+    async def list_playlists_by_music(self, music_id: int) -> List[Playlist]:
+        """Listar playlists que contêm uma música pelo protocolo mais rápido no momento"""
+        return await self._route("list_playlists_by_music", music_id)
+
+    async def _route(self, operation: str, *args: Any) -> Any:
+        """Executar a operação no protocolo escolhido pelo roteador
+
+        Em caso de erro, tenta o próximo protocolo da ordem (até
+        ``router_max_attempts`` no total), salvo se o prazo já tiver esgotado.
+        Com ``hedging``, o segundo protocolo também é acionado quando o
+        primeiro passa do percentil ``hedge_percentile`` da sua latência.
+        """
+        routes = _ROUTES[operation]
+        order = self.router.choose(operation, list(routes))
+        if not order:
+            raise ValueError(f"Nenhum protocolo disponível para {operation}")
+        attempts = order[:max(1, self.config.router_max_attempts)]
+        calls = [functools.partial(getattr(self, routes[protocol]), *args) for protocol in attempts]
+        token = _strict_errors.set(True)
+        try:
+            index = 0
+            while True:
+                try:
+                    if index == 0 and len(calls) > 1:
+                        return await self._hedged(operation, attempts[0], calls[0], calls[1])
+                    return await calls[index]()
+                except DeadlineExceededError:
+                    raise
+                except _HedgeFailed as failed:
+                    # As duas primeiras tentativas já foram usadas pelo hedge
+                    index = 1
+                    error = failed.error
+                except Exception as exc:
+                    error = exc
+                left = deadlines.remaining()
+                index += 1
+                if index >= len(calls) or (left is not None and left <= 0):
+                    raise error
+        finally:
+            _strict_errors.reset(token)
+
+    async def _hedged(
+        self,
+        operation: str,
+        protocol: str,
+        primary: Callable[[], Awaitable[Any]],
+        secondary: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Executar ``primary`` com hedge em ``secondary`` após o percentil observado"""
+        delay = None
+        if self.hedge_budget is not None:
+            delay = self.router.percentile(
+                operation, protocol, self.config.hedge_percentile, self.config.hedge_min_samples
+            )
+        if delay is None:
+            return await primary()
+
+        fired = False
+
+        async def second() -> Any:
+            nonlocal fired
+            fired = True
+            self.metrics.hedges_fired += 1
+            return await secondary()
+
+        self.hedge_budget.deposit()
+        try:
+            value, won = await hedge(primary, second, delay, self.hedge_budget)
+        except DeadlineExceededError:
+            raise
+        except Exception as error:
+            if fired:
+                raise _HedgeFailed(error) from error
+            raise
+        if won:
+            self.metrics.hedges_won += 1
+        return value
+
+    # ==================== Iteração incremental ====================
+
+    def iter_all_users(self, protocol: str = "rest") -> AsyncIterator[User]:
+        """Iterar todos os usuários (incremental só em INCREMENTAL_PROTOCOLS)"""
+        return self._iter_all(User, protocol)
+
+    def iter_all_musics(self, protocol: str = "rest") -> AsyncIterator[Music]:
+        """Iterar todas as músicas (incremental só em INCREMENTAL_PROTOCOLS)"""
+        return self._iter_all(Music, protocol)
+
+    def iter_all_playlists(self, protocol: str = "rest") -> AsyncIterator[Playlist]:
+        """Iterar todas as playlists (incremental só em INCREMENTAL_PROTOCOLS)"""
+        return self._iter_all(Playlist, protocol)
+
+    def _iter_all(self, row_type: type, protocol: str) -> AsyncIterator[Any]:
+        """Escolher o iterador do protocolo
+
+        Nenhum dos servidores pagina as listagens. Em REST, GraphQL e SOAP os
+        iteradores lêem a resposta única em blocos e entregam cada linha assim
+        que ela termina de chegar, sem montar a lista completa. O gRPC não é
+        incremental: os serviços só têm RPCs unárias, a resposta inteira fica
+        em memória (proporcional ao catálogo) e o iterador apenas evita montar
+        a mensagem de lista.
+        """
+        if protocol not in STREAM_PROTOCOLS:
+            raise ValueError(f"Protocolo inválido: {protocol} (use {', '.join(STREAM_PROTOCOLS)})")
+        return getattr(self, f"_{protocol}_iter_all")(row_type, _LISTINGS[row_type])
+
+    @contextmanager
+    def _stream_timeouts(self, protocol: str, operation: str) -> Iterator[None]:
+        """Converter timeouts do transporte durante a leitura em DeadlineExceededError"""
+        try:
+            yield
+        except DeadlineExceededError:
+            raise
+        except Exception as error:
+            if self._is_timeout(protocol, error):
+                raise DeadlineExceededError(f"Timeout em {protocol}:{operation}", protocol, operation) from error
+            raise
+
+    @contextmanager
+    def _stream_guard(self, protocol: str, operation: str) -> Iterator[None]:
+        """Disjuntor e conversão de timeouts em volta de uma leitura em streaming
+
+        Como ``_with_deadline``: com ``circuit_breakers``, a leitura passa
+        antes pelo disjuntor e o resultado (inclusive falhas no meio do corpo)
+        é registrado nele; uma iteração abandonada só devolve a vaga.
+        """
+        breaker = self._breaker(protocol, operation)
+        if breaker is None:
+            with self._stream_timeouts(protocol, operation):
+                yield
+            return
+
+        timeout = self._call_timeout(protocol, operation)
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            self.metrics.breaker_rejected += 1
+            raise
+        start = time.perf_counter()
+        try:
+            with self._stream_timeouts(protocol, operation):
+                yield
+        except BaseException as error:
+            self._breaker_outcome(breaker, protocol, timeout, start, error)
+            raise
+        self._breaker_outcome(breaker, protocol, timeout, start, None)
+
+    async def _deadline_chunks(self, protocol: str, operation: str, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Repassar blocos do corpo, verificando o prazo global a cada bloco"""
+        async for chunk in chunks:
+            self._call_timeout(protocol, operation)
+            yield chunk
+
+    def _http_stream_timeout(self, timeout: float) -> aiohttp.ClientTimeout:
+        """Timeout aiohttp para leitura em streaming: por leitura, total só se houver prazo"""
+        return aiohttp.ClientTimeout(total=deadlines.remaining(), sock_connect=timeout, sock_read=timeout)
+
+    async def _rest_iter_all(self, row_type: type, listing: _Listing) -> AsyncIterator[Any]:
+        """REST: linhas do array JSON via ijson"""
+        path = listing.rest_path
+        session = self._get_rest_session()
+        get = itemgetter(*row_type.__dataclass_fields__)
+        with self._stream_guard("rest", path):
+            timeout = self._call_timeout("rest", path)
+            async with session.get(
+                f"{self.config.rest_base_url}{path}", timeout=self._http_stream_timeout(timeout)
+            ) as response:
+                response.raise_for_status()
+                chunks = self._deadline_chunks("rest", path, response.content.iter_chunked(_STREAM_CHUNK_SIZE))
+                async for item in streaming.iter_json_items(chunks, "item"):
+                    yield row_type(*get(item))
+
+    async def _graphql_iter_all(self, row_type: type, listing: _Listing) -> AsyncIterator[Any]:
+        """GraphQL: linhas de ``data.<campo>`` via ijson, com erros lançados ao fim"""
+        fields = tuple(row_type.__dataclass_fields__)
+        payload = {"query": f"query {{ {listing.field} {{ {' '.join(fields)} }} }}", "variables": {}}
+        session = self._get_graphql_session()
+        get = itemgetter(*fields)
+        with self._stream_guard("graphql", listing.field):
+            timeout = self._call_timeout("graphql", listing.field)
+            async with session.post(
+                self.config.graphql_url, json=payload, timeout=self._http_stream_timeout(timeout)
+            ) as response:
+                response.raise_for_status()
+                chunks = self._deadline_chunks(
+                    "graphql", listing.field, response.content.iter_chunked(_STREAM_CHUNK_SIZE)
+                )
+                async for item in streaming.iter_json_items(chunks, f"data.{listing.field}.item", "errors.item"):
+                    yield row_type(*get(item))
+
+    async def _soap_iter_all(self, row_type: type, listing: _Listing) -> AsyncIterator[Any]:
+        """SOAP: envelope do caminho rápido e XMLPullParser sobre o corpo em streaming
+
+        Usa sempre as operações pré-compiladas de ``soap_fast``; o zeep
+        precisa do documento inteiro e não serve para iteração.
+        """
+        operation = soap_fast.OPERATIONS[(listing.service, "FindAll")]
+        decoder = soap_fast.StreamDecoder(operation)
+        session = self._get_soap_session()
+        with self._stream_guard("soap", operation.action):
+            timeout = self._call_timeout("soap", operation.action)
+            async with session.post(
+                self._soap_service_url(listing.service),
+                data=operation.build_request(),
+                headers=soap_fast.request_headers(operation),
+                timeout=self._http_stream_timeout(timeout),
+            ) as response:
+                if response.status == 500:
+                    soap_fast.raise_for_fault(await response.read())
+                response.raise_for_status()
+                chunks = self._deadline_chunks(
+                    "soap", operation.action, response.content.iter_chunked(_STREAM_CHUNK_SIZE)
+                )
+                async for chunk in chunks:
+                    for values in decoder.feed(chunk):
+                        yield row_type(*values)
+                for values in decoder.close():
+                    yield row_type(*values)
+
+    async def _grpc_iter_all(self, row_type: type, listing: _Listing) -> AsyncIterator[Any]:
+        """gRPC: resposta unária recebida em bytes e decodificada elemento a elemento
+
+        Não é incremental: os serviços não têm RPC com streaming, então a
+        resposta inteira é recebida (e mantida) antes da primeira linha. Só a
+        mensagem de lista deixa de ser desserializada por completo.
+        """
+        if not self.grpc_pool:
+            await self._initialize_grpc_clients()
+        name = row_type.__name__
+        path = f"/{listing.service}.{name}Service/FindAll"
+        field_number = getattr(listing.proto, f"{name}List").DESCRIPTOR.fields_by_name[listing.field].number
+        message_type = getattr(listing.proto, name)
+
+        async def call(timeout: float) -> bytes:
+            with self.grpc_pool.acquire_raw(path, empty_pb2.Empty.SerializeToString) as method:
+                return await method(self._grpc_empty, timeout=timeout)
+
+        payload = await self._with_deadline("grpc", f"{listing.service}.FindAll", call)
+        get = attrgetter(*row_type.__dataclass_fields__)
+        for message in streaming.iter_repeated_messages(payload, field_number, message_type):
+            yield row_type(*get(message))
 
     # ==================== UTILITÁRIOS ====================
 
-    async def health_check(self) -> Dict[str, bool]:
-        """Verificar saúde de cada tecnologia"""
+    async def probe(self, timeout: Optional[float] = None) -> Dict[str, ProbeResult]:
+        """Sondar os quatro protocolos em paralelo com requisições leves
+
+        REST: HEAD na raiz; GraphQL: ``{ __typename }``; SOAP: GET do WSDL;
+        gRPC: canais do pool prontos. As sondagens não passam pelos
+        disjuntores nem pelo cache; os resultados marcam o protocolo como fora
+        do ar (ou não) no roteador e alimentam os disjuntores.
+        """
+        probes = [
+            ("rest", self._probe_rest),
+            ("graphql", self._probe_graphql),
+            ("soap", self._probe_soap),
+            ("grpc", self._probe_grpc),
+        ]
+
+        async def run(protocol: str, check: Callable[[float], Awaitable[None]]) -> ProbeResult:
+            start = time.perf_counter()
+            try:
+                limit = self._call_timeout(protocol, "probe")
+                await asyncio.wait_for(check(limit), limit)
+                result = ProbeResult(protocol, True, time.perf_counter() - start, None)
+            except Exception as error:
+                result = ProbeResult(protocol, False, time.perf_counter() - start, repr(error))
+            self._record_probe(result)
+            return result
+
+        async def run_probes() -> List[ProbeResult]:
+            return await asyncio.gather(*(run(protocol, check) for protocol, check in probes))
+
+        results = await run_with_deadline(run_probes(), timeout, "probe")
+        return {result.protocol: result for result in results}
+
+    def start_probing(self, interval: Optional[float] = None) -> PeriodicProber:
+        """Sondar os protocolos periodicamente em segundo plano (até ``stop_probing``/``close``)"""
+        if self.prober is None or not self.prober.running:
+            self.prober = PeriodicProber(self.probe, interval or self.config.probe_interval)
+            self.prober.start()
+        return self.prober
+
+    async def stop_probing(self) -> None:
+        """Parar as sondagens em segundo plano"""
+        if self.prober is not None:
+            await self.prober.stop()
+
+    def _record_probe(self, result: ProbeResult) -> None:
+        """Repassar o resultado da sondagem ao roteador e aos disjuntores do protocolo"""
+        self.router.set_down(result.protocol, not result.ok)
+        if self.config.circuit_breakers and not self.config.breaker_per_operation:
+            self._breaker(result.protocol, "probe")
+        prefix = f"{result.protocol}:"
+        for name, breaker in self.breakers.items():
+            if name == result.protocol or name.startswith(prefix):
+                breaker.record_probe(result.ok)
+
+    async def _probe_rest(self, timeout: float) -> None:
+        session = self._get_rest_session()
+        async with session.head(f"{self.config.rest_base_url}/", timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            # Qualquer resposta abaixo de 500 (inclusive 404) mostra o servidor no ar
+            if response.status >= 500:
+                response.raise_for_status()
+
+    async def _probe_graphql(self, timeout: float) -> None:
+        session = self._get_graphql_session()
+        async with session.post(
+            self.config.graphql_url, json={"query": "{ __typename }"}, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            body = await response.json()
+            if "data" not in body:
+                raise Exception(f"GraphQL error: {body.get('errors')}")
+
+    async def _probe_soap(self, timeout: float) -> None:
+        session = self._get_soap_session()
+        async with session.get(self.config.soap_user_wsdl_url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            await response.read()
+
+    async def _probe_grpc(self, timeout: float) -> None:
+        if not self.grpc_pool:
+            await self._initialize_grpc_clients()
+        await self.grpc_pool.ready()
+
+    async def health_check(self, timeout: Optional[float] = None, probe: bool = False) -> Dict[str, bool]:
+        """Verificar saúde de cada tecnologia
+
+        Com ``timeout``, o prazo total é dividido entre as verificações, que
+        são canceladas ao esgotar sua parcela. Com ``probe``, usa as
+        sondagens leves e simultâneas de ``probe`` em vez de listar usuários.
+        """
+        if probe:
+            try:
+                return {protocol: result.ok for protocol, result in (await self.probe(timeout)).items()}
+            except DeadlineExceededError:
+                return {protocol: False for protocol in STREAM_PROTOCOLS}
+
         results = {
             "rest": False,
             "graphql": False,
             "soap": False,
             "grpc": False
         }
+        checks = [
+            ("rest", self.rest_list_all_users),
+            ("graphql", self.graphql_list_all_users),
+            ("soap", self.soap_list_all_users),
+            ("grpc", self.grpc_list_all_users),
+        ]
 
-        # Verificar REST
-        try:
-            await self.rest_list_all_users()
-            results["rest"] = True
-        except:
-            results["rest"] = False
+        async def run_checks() -> None:
+            for index, (technology, check) in enumerate(checks):
+                try:
+                    await run_with_deadline(
+                        check(), deadlines.share(len(checks) - index), f"health_check:{technology}"
+                    )
+                    results[technology] = True
+                except Exception:
+                    results[technology] = False
 
-        # Verificar GraphQL
-        try:
-            await self.graphql_list_all_users()
-            results["graphql"] = True
-        except:
-            results["graphql"] = False
+        # As verificações precisam ir ao servidor, nunca ao cache
+        with response_cache.bypass():
+            try:
+                await run_with_deadline(run_checks(), timeout, "health_check")
+            except DeadlineExceededError:
+                pass
 
-        # Verificar SOAP
-        try:
-            await self.soap_list_all_users()
-            results["soap"] = True
-        except:
-            results["soap"] = False
+        return results
 
-        # Verificar gRPC
-        try:
-            await self.grpc_list_all_users()
-            results["grpc"] = True
-        except:
-            results["grpc"] = False
 
-        return results
+# Métodos roteáveis de cada operação, por protocolo: {operação: {protocolo: método}}
+_ROUTES: Dict[str, Dict[str, str]] = {}
+for _name, _member in vars(MusicStreamingClient).items():
+    _spec = getattr(_member, "read_spec", None)
+    if _spec is not None and _spec.routable:
+        _ROUTES.setdefault(_spec.operation, {})[_spec.protocol] = _name
 
 
 def create_music_client(config: Optional[ClientConfig] = None) -> MusicStreamingClient:
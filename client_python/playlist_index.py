@@ -0,0 +1,126 @@
+"""
+Índice invertido música → playlists mantido no cliente
+Montado a partir da listagem de playlists e das músicas de cada uma;
+responde às buscas reversas localmente e é atualizado por diferença
+(só as playlists novas ou marcadas como desatualizadas são buscadas de novo)
+"""
+
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+class PlaylistIndex:
+    """Playlists por música, com as músicas de cada playlist
+
+    Escritas do cliente chegam por ``invalidate`` (mesmas etiquetas do cache
+    de respostas): ``playlist:N`` marca a playlist N para nova busca,
+    ``music:N`` retira a música N do índice e marca as playlists que a
+    continham, e ``playlists``/``musics`` pedem uma nova listagem das playlists.
+    Escritas feitas por outros clientes só aparecem na próxima atualização
+    completa; ``expired`` indica quando ela está vencida.
+    """
+
+    def __init__(self) -> None:
+        self._playlists: Dict[int, Any] = {}
+        self._musics_of: Dict[int, Tuple[int, ...]] = {}
+        self._playlists_of: Dict[int, List[int]] = {}  # ids de playlist ordenados
+        self.stale: Set[int] = set()
+        self.needs_listing = True
+        self.refreshes = 0
+        self.protocol: Optional[str] = None  # protocolo da última atualização completa
+        self.refreshed_at = 0.0  # time.monotonic() da última atualização completa
+
+    def __len__(self) -> int:
+        return len(self._playlists)
+
+    @property
+    def ready(self) -> bool:
+        """Índice montado ao menos uma vez"""
+        return self.refreshes > 0
+
+    @property
+    def dirty(self) -> bool:
+        """Há playlists a buscar de novo ou listagem pendente"""
+        return self.needs_listing or bool(self.stale)
+
+    def expired(self, ttl: Optional[float]) -> bool:
+        """A última atualização completa tem mais de ``ttl`` segundos (``None``: nunca expira)"""
+        return ttl is not None and time.monotonic() - self.refreshed_at >= ttl
+
+    def playlist_ids_for(self, music_id: int) -> Sequence[int]:
+        """Ids das playlists que contêm a música (ordenados)"""
+        return self._playlists_of.get(music_id, ())
+
+    def playlists_by_music(self, music_id: int) -> List[Any]:
+        """Playlists que contêm a música"""
+        playlists = self._playlists
+        return [playlists[playlist_id] for playlist_id in self._playlists_of.get(music_id, ())]
+
+    def musics_of(self, playlist_id: int) -> Tuple[int, ...]:
+        """Ids das músicas da playlist"""
+        return self._musics_of.get(playlist_id, ())
+
+    def sync_playlists(self, playlists: Iterable[Any], full: bool = False) -> List[int]:
+        """Aplicar uma listagem completa das playlists
+
+        Remove as que sumiram, atualiza os objetos das demais e retorna os ids
+        cujas músicas precisam ser buscadas: novas e desatualizadas (ou todas,
+        com ``full``).
+        """
+        listed = {playlist.id: playlist for playlist in playlists}
+        for playlist_id in [known for known in self._playlists if known not in listed]:
+            self.remove_playlist(playlist_id)
+        self._playlists.update(listed)
+        self.needs_listing = False
+        if full:
+            return sorted(listed)
+        return sorted(playlist_id for playlist_id in listed if playlist_id in self.stale or playlist_id not in self._musics_of)
+
+    def set_musics(self, playlist_id: int, music_ids: Iterable[int]) -> None:
+        """Substituir as músicas da playlist, ajustando só as entradas que mudaram"""
+        new = tuple(sorted(set(music_ids)))
+        old = self._musics_of.get(playlist_id, ())
+        if new != old:
+            old_set, new_set = set(old), set(new)
+            for music_id in old_set - new_set:
+                self._unlink(music_id, playlist_id)
+            for music_id in new_set - old_set:
+                insort(self._playlists_of.setdefault(music_id, []), playlist_id)
+            self._musics_of[playlist_id] = new
+        self.stale.discard(playlist_id)
+
+    def remove_playlist(self, playlist_id: int) -> None:
+        """Retirar a playlist do índice"""
+        for music_id in self._musics_of.pop(playlist_id, ()):
+            self._unlink(music_id, playlist_id)
+        self._playlists.pop(playlist_id, None)
+        self.stale.discard(playlist_id)
+
+    def remove_music(self, music_id: int) -> None:
+        """Retirar a música do índice, marcando as playlists que a continham"""
+        for playlist_id in self._playlists_of.pop(music_id, ()):
+            self._musics_of[playlist_id] = tuple(
+                other for other in self._musics_of.get(playlist_id, ()) if other != music_id
+            )
+            self.stale.add(playlist_id)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Marcar o que uma escrita pode ter alterado"""
+        for tag in tags:
+            if tag in ("playlists", "musics"):
+                self.needs_listing = True
+            elif tag.startswith("playlist:"):
+                self.stale.add(int(tag[len("playlist:"):]))
+            elif tag.startswith("music:"):
+                self.remove_music(int(tag[len("music:"):]))
+
+    def _unlink(self, music_id: int, playlist_id: int) -> None:
+        ids = self._playlists_of.get(music_id)
+        if not ids:
+            return
+        position = bisect_left(ids, playlist_id)
+        if position < len(ids) and ids[position] == playlist_id:
+            del ids[position]
+        if not ids:
+            del self._playlists_of[music_id]
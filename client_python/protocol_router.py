@@ -0,0 +1,191 @@
+"""
+Roteador de protocolos adaptativo por latência
+Mantém, por operação e protocolo, médias móveis exponenciais (EWMA) de
+latência e taxa de erro e ordena os protocolos do mais rápido ao mais lento,
+deixando os instáveis por último
+"""
+
+import random
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+class ProtocolStats:
+    """Médias móveis de uma operação em um protocolo"""
+
+    __slots__ = ("latency", "error_rate", "samples", "last_at", "recent")
+
+    def __init__(self, window: int = 100) -> None:
+        self.latency = 0.0  # segundos (EWMA das chamadas bem-sucedidas)
+        self.error_rate = 0.0  # EWMA de 0 (sucesso) / 1 (erro)
+        self.samples = 0
+        self.last_at = 0.0
+        self.recent: deque = deque(maxlen=window)  # últimas latências, para percentis
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "latency_ms": self.latency * 1000,
+            "error_rate": self.error_rate,
+            "samples": self.samples,
+        }
+
+
+class ProtocolRouter:
+    """Escolha do protocolo de cada operação a partir das médias observadas
+
+    Ordem de preferência retornada por ``choose``:
+    1. protocolo fixado para a operação (``pin``), sozinho;
+    2. protocolos ainda sem amostras suficientes ou instáveis cujo período de
+       espera já passou (uma tentativa para reavaliá-los);
+    3. protocolos saudáveis, da menor para a maior latência (com chance
+       ``explore_ratio`` de promover outro saudável, para manter as médias vivas);
+    4. protocolos instáveis, da menor para a maior taxa de erro;
+    5. protocolos marcados como fora do ar (``set_down``, ex.: por sondagem).
+
+    Com ``routes`` (operação → protocolos que a atendem), ``pin`` recusa
+    protocolos sem rota para a operação. Em todo caso, um protocolo fixado
+    que não esteja entre os candidatos de ``choose`` é ignorado.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        error_threshold: float = 0.5,
+        min_samples: int = 3,
+        explore_ratio: float = 0.05,
+        cooldown: float = 5.0,
+        window: int = 100,
+        pins: Optional[Dict[str, str]] = None,
+        routes: Optional[Mapping[str, Iterable[str]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha do EWMA deve estar em (0, 1]")
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.min_samples = min_samples
+        self.explore_ratio = explore_ratio
+        self.cooldown = cooldown
+        self.window = window
+        self.routes = {operation: frozenset(protocols) for operation, protocols in (routes or {}).items()}
+        self.pins: Dict[str, str] = {}
+        for operation, protocol in (pins or {}).items():
+            self.pin(operation, protocol)
+        self._clock = clock
+        self._rng = rng
+        self._stats: Dict[Tuple[str, str], ProtocolStats] = {}
+        self._down: Set[str] = set()
+
+    def pin(self, operation: str, protocol: str) -> None:
+        """Fixar o protocolo de uma operação"""
+        if self.routes and protocol not in self.routes.get(operation, ()):
+            available = ", ".join(sorted(self.routes.get(operation, ()))) or "nenhum"
+            raise ValueError(f"Protocolo {protocol} não atende {operation} (disponíveis: {available})")
+        self.pins[operation] = protocol
+
+    def unpin(self, operation: str) -> None:
+        """Voltar a escolher o protocolo da operação pelas médias"""
+        self.pins.pop(operation, None)
+
+    def set_down(self, protocol: str, down: bool = True) -> None:
+        """Marcar (ou desmarcar) o protocolo como fora do ar em todas as operações"""
+        if down:
+            self._down.add(protocol)
+        else:
+            self._down.discard(protocol)
+
+    def is_down(self, protocol: str) -> bool:
+        return protocol in self._down
+
+    def stats(self, operation: str, protocol: str) -> ProtocolStats:
+        """Médias da operação no protocolo (criadas vazias se ainda não houver)"""
+        key = (operation, protocol)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = ProtocolStats(self.window)
+        return stats
+
+    def record(self, operation: str, protocol: str, latency: float, ok: bool) -> None:
+        """Registrar o resultado de uma chamada"""
+        stats = self.stats(operation, protocol)
+        alpha = self.alpha
+        if stats.samples == 0:
+            stats.error_rate = 0.0 if ok else 1.0
+            if ok:
+                stats.latency = latency
+        else:
+            stats.error_rate += alpha * ((0.0 if ok else 1.0) - stats.error_rate)
+            if ok:
+                stats.latency = latency if stats.latency == 0.0 else stats.latency + alpha * (latency - stats.latency)
+        if ok:
+            stats.recent.append(latency)
+        stats.samples += 1
+        stats.last_at = self._clock()
+
+    def observe(self, operation: str, protocol: str, latency: float) -> None:
+        """Registrar só a duração de uma chamada interrompida (limite inferior da latência)
+
+        Chamadas canceladas (hedge perdido, prazo) não contam como erro nem
+        entram na média, mas omiti-las deixaria os percentis otimistas.
+        """
+        self.stats(operation, protocol).recent.append(latency)
+
+    def percentile(self, operation: str, protocol: str, fraction: float, min_samples: int = 1) -> Optional[float]:
+        """Percentil das latências recentes (None com menos de ``min_samples``)"""
+        stats = self._stats.get((operation, protocol))
+        if stats is None or len(stats.recent) < max(1, min_samples):
+            return None
+        ordered = sorted(stats.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def healthy(self, operation: str, protocol: str) -> bool:
+        """Protocolo com taxa de erro abaixo do limite para a operação"""
+        stats = self._stats.get((operation, protocol))
+        return stats is None or stats.error_rate < self.error_threshold
+
+    def choose(self, operation: str, candidates: Sequence[str]) -> List[str]:
+        """Ordenar os protocolos candidatos do preferido ao último recurso"""
+        pinned = self.pins.get(operation)
+        if pinned is not None and pinned in candidates:
+            return [pinned]
+
+        now = self._clock()
+        warm: List[Tuple[float, str]] = []
+        unhealthy: List[Tuple[float, str]] = []
+        trial: List[Tuple[int, str]] = []
+        down: List[str] = []
+        for protocol in candidates:
+            if protocol in self._down:
+                down.append(protocol)
+                continue
+            stats = self._stats.get((operation, protocol))
+            if stats is None or stats.samples < self.min_samples:
+                trial.append((stats.samples if stats else 0, protocol))
+            elif stats.error_rate >= self.error_threshold:
+                if now - stats.last_at >= self.cooldown:
+                    trial.append((stats.samples, protocol))
+                else:
+                    unhealthy.append((stats.error_rate, protocol))
+            else:
+                warm.append((stats.latency, protocol))
+
+        order = [protocol for _, protocol in sorted(trial)]
+        ranked = [protocol for _, protocol in sorted(warm)]
+        if len(ranked) > 1 and self._rng() < self.explore_ratio:
+            index = 1 + int(self._rng() * (len(ranked) - 1))
+            ranked.insert(0, ranked.pop(index))
+        order.extend(ranked)
+        order.extend(protocol for _, protocol in sorted(unhealthy))
+        order.extend(down)
+        return order
+
+    def snapshot(self, operations: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Médias atuais por operação e protocolo"""
+        wanted = set(operations) if operations is not None else None
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (operation, protocol), stats in sorted(self._stats.items()):
+            if wanted is None or operation in wanted:
+                result.setdefault(operation, {})[protocol] = stats.as_dict()
+        return result
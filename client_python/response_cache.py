@@ -0,0 +1,161 @@
+"""
+Cache de respostas do cliente (TTL por operação + LRU limitado)
+Entradas indexadas por operação e argumentos, com etiquetas (ex.: ``"user:1"``)
+usadas para invalidá-las quando o cliente executa mutações
+"""
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Set, Tuple
+
+
+# Retornado por ``get`` quando a chave não está no cache
+MISSING = object()
+
+_bypass: ContextVar[bool] = ContextVar("music_client_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass() -> Iterator[None]:
+    """Ignorar o cache (leitura e escrita) dentro do bloco"""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def bypassed() -> bool:
+    """Verificar se o contexto atual ignora o cache"""
+    return _bypass.get()
+
+
+@dataclass
+class CacheStats:
+    """Contadores do cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "tags")
+
+    def __init__(self, value: Any, expires_at: float, tags: Tuple[str, ...]):
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class ResponseCache:
+    """Cache LRU com expiração por operação e invalidação por etiquetas
+
+    Os valores são devolvidos sem cópia; quem lê não deve modificá-los.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 30.0,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("O cache precisa de pelo menos uma entrada")
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.stats = CacheStats()
+        # Incrementada a cada invalidação; leituras iniciadas antes dela não são gravadas
+        self.generation = 0
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._by_tag: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, operation: str) -> float:
+        """TTL em segundos da operação (0 desativa o cache para ela)"""
+        return self.ttls.get(operation, self.default_ttl)
+
+    def get(self, key: Hashable) -> Any:
+        """Valor da chave ou ``MISSING`` (ausente ou expirado)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return MISSING
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        operation: str,
+        tags: Iterable[str] = (),
+        generation: Optional[int] = None,
+    ) -> None:
+        """Gravar valor com o TTL da operação
+
+        Com ``generation`` (lida antes da chamada ao servidor), o valor é
+        descartado se alguma mutação invalidou o cache nesse meio tempo.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        ttl = self.ttl_for(operation)
+        if ttl <= 0:
+            return
+        if key in self._entries:
+            self._remove(key)
+        tags = tuple(tags)
+        self._entries[key] = _Entry(value, self._clock() + ttl, tags)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """Remover entradas com qualquer uma das etiquetas; retornar quantas"""
+        self.generation += 1
+        removed = 0
+        for tag in tags:
+            for key in self._by_tag.pop(tag, ()):
+                if key in self._entries:
+                    self._remove(key)
+                    removed += 1
+        self.stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """Esvaziar o cache (contadores preservados)"""
+        self.generation += 1
+        self._entries.clear()
+        self._by_tag.clear()
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
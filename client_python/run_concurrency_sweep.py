@@ -0,0 +1,23 @@
+"""
+Compara REST e gRPC com 1, 10, 100 e 1000 usuários virtuais simultâneos
+Uso: python run_concurrency_sweep.py [níveis separados por vírgula] [tecnologias] [processos]
+"""
+import asyncio
+import sys
+
+from load_test import LoadTester
+
+
+async def run_sweep(levels, technologies, processes: int) -> None:
+    tester = LoadTester(processes=processes)
+    try:
+        await tester.run_concurrency_sweep(levels, technologies)
+    finally:
+        await tester.close()
+
+
+if __name__ == "__main__":
+    levels = [int(level) for level in sys.argv[1].split(",")] if len(sys.argv) > 1 else [1, 10, 100, 1000]
+    technologies = sys.argv[2].split(",") if len(sys.argv) > 2 else ["REST", "gRPC"]
+    processes = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    asyncio.run(run_sweep(levels, technologies, processes))
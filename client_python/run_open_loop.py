@@ -0,0 +1,25 @@
+"""
+Teste em malha aberta: requisições agendadas a uma taxa, sem esperar respostas
+Uso: python run_open_loop.py [req/s] [segundos] [fixed|poisson|step] [tecnologias] [processos]
+"""
+import asyncio
+import sys
+
+from load_test import LoadTester, TECHNOLOGIES
+
+
+async def run_open_loop(rate: float, duration: float, pattern: str, technologies, processes: int) -> None:
+    tester = LoadTester(processes=processes)
+    try:
+        await tester.run_open_loop_test(rate, duration, pattern, technologies)
+    finally:
+        await tester.close()
+
+
+if __name__ == "__main__":
+    rate = float(sys.argv[1]) if len(sys.argv) > 1 else 100
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    pattern = sys.argv[3] if len(sys.argv) > 3 else "fixed"
+    technologies = sys.argv[4].split(",") if len(sys.argv) > 4 else list(TECHNOLOGIES)
+    processes = int(sys.argv[5]) if len(sys.argv) > 5 else 1
+    asyncio.run(run_open_loop(rate, duration, pattern, technologies, processes))
@@ -0,0 +1,27 @@
+"""
+Busca de saturação: maior taxa (req/s) de cada operação com p99 dentro do SLO
+Uso: python run_saturation.py [SLO p99 em ms] [tecnologias] [req/s inicial] [segundos por degrau] [processos]
+"""
+import asyncio
+import sys
+
+from load_test import LoadTester, TECHNOLOGIES
+
+
+async def run_saturation(slo_p99: float, technologies, start_rate: float, step_duration: float, processes: int) -> None:
+    tester = LoadTester(processes=processes)
+    try:
+        await tester.run_saturation_search(
+            slo_p99, technologies=technologies, start_rate=start_rate, step_duration=step_duration
+        )
+    finally:
+        await tester.close()
+
+
+if __name__ == "__main__":
+    slo_p99 = float(sys.argv[1]) if len(sys.argv) > 1 else 100
+    technologies = sys.argv[2].split(",") if len(sys.argv) > 2 else list(TECHNOLOGIES)
+    start_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 10
+    step_duration = float(sys.argv[4]) if len(sys.argv) > 4 else 5
+    processes = int(sys.argv[5]) if len(sys.argv) > 5 else 1
+    asyncio.run(run_saturation(slo_p99, technologies, start_rate, step_duration, processes))
@@ -0,0 +1,64 @@
+"""
+Coalescência de requisições idênticas em andamento (single-flight)
+Chamadas concorrentes com a mesma chave compartilham uma única execução e
+recebem o mesmo resultado ou o mesmo erro
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Grupo de execuções em andamento indexadas por chave
+
+    A execução roda em uma tarefa própria: o cancelamento de um chamador não
+    afeta os demais, e ela só é cancelada quando todos desistem.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Verificar se já há execução em andamento para a chave"""
+        return key in self._flights
+
+    def waiters(self, key: Hashable) -> int:
+        """Chamadores aguardando a execução da chave (0 se não houver)"""
+        flight = self._flights.get(key)
+        return flight.waiters if flight else 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Executar ``factory()`` ou aguardar a execução em andamento da mesma chave"""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Ninguém mais espera: cancelar e não deixar novos chamadores entrarem
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -0,0 +1,183 @@
+"""
+Caminho rápido SOAP para as operações conhecidas do servidor Go
+Usa envelopes pré-serializados e decodifica a resposta com lxml.iterparse,
+criando os dataclasses em uma única passada (sem o modelo genérico do zeep)
+"""
+
+import io
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from lxml import etree
+from zeep.exceptions import Fault
+
+
+SOAP_ENV_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+
+_ENVELOPE = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    f'<soap:Envelope xmlns:soap="{SOAP_ENV_NS}"><soap:Body>%s</soap:Body></soap:Envelope>'
+)
+
+
+@dataclass(frozen=True)
+class SoapOperation:
+    """Operação SOAP pré-compilada"""
+    service: str
+    action: str
+    envelope: bytes
+    row_tag: str
+    fields: Tuple[Tuple[str, Callable[[Optional[str]], Any]], ...]
+    has_id: bool = False
+
+    def build_request(self, ident: Optional[int] = None) -> bytes:
+        """Montar o envelope da requisição"""
+        if self.has_id:
+            return self.envelope % int(ident)
+        return self.envelope
+
+
+def _operation(service: str, action: str, request: str, row_tag: str, fields, has_id: bool = False) -> SoapOperation:
+    ns = f"http://music.soap.manager/{service}"
+    body = f'<{request} xmlns="{ns}"><id>%d</id></{request}>' if has_id else f'<{request} xmlns="{ns}"/>'
+    return SoapOperation(
+        service=service,
+        action=action,
+        envelope=(_ENVELOPE % body).encode(),
+        row_tag=row_tag,
+        fields=fields,
+        has_id=has_id,
+    )
+
+
+def _int(text: Optional[str]) -> int:
+    return int(text) if text else 0
+
+
+def _str(text: Optional[str]) -> str:
+    return text or ""
+
+
+_USER_FIELDS = (("id", _int), ("name", _str), ("age", _int))
+_MUSIC_FIELDS = (("id", _int), ("name", _str), ("artist", _str))
+_PLAYLIST_FIELDS = (("id", _int), ("name", _str))
+
+OPERATIONS = {
+    ("user", "FindAll"): _operation("user", "FindAll", "FindAllUsersRequest", "users", _USER_FIELDS),
+    ("user", "FindPlaylists"): _operation(
+        "user", "FindPlaylists", "FindPlaylistsOfUserRequest", "playlists", _PLAYLIST_FIELDS, has_id=True
+    ),
+    ("music", "FindAll"): _operation("music", "FindAll", "FindAllMusicRequest", "musics", _MUSIC_FIELDS),
+    ("playlist", "FindAll"): _operation(
+        "playlist", "FindAll", "FindAllPlaylistsRequest", "playlists", _PLAYLIST_FIELDS
+    ),
+    ("playlist", "FindMusics"): _operation(
+        "playlist", "FindMusics", "FindMusicsInPlaylistRequest", "musics", _MUSIC_FIELDS, has_id=True
+    ),
+}
+
+
+def request_headers(operation: SoapOperation) -> dict:
+    """Cabeçalhos HTTP da requisição SOAP"""
+    return {"Content-Type": "text/xml; charset=utf-8", "SOAPAction": f'"{operation.action}"'}
+
+
+def raise_for_fault(content: bytes) -> None:
+    """Lançar Fault se o corpo contiver um <soap:Fault>"""
+    try:
+        root = etree.fromstring(content)
+    except etree.XMLSyntaxError:
+        return
+    fault = root.find(f".//{{{SOAP_ENV_NS}}}Fault")
+    if fault is not None:
+        raise Fault(fault.findtext("faultstring") or "SOAP Fault", code=fault.findtext("faultcode"))
+
+
+def _row_values(elem: Any, operation: SoapOperation) -> Optional[Tuple[Any, ...]]:
+    """Converter um elemento de linha em tupla (None se algum campo for inválido)"""
+    values = dict.fromkeys(name for name, _ in operation.fields)
+    for child in elem:
+        tag = child.tag
+        local = tag[tag.rfind("}") + 1:]
+        if local in values:
+            values[local] = child.text
+    try:
+        return tuple([convert(values[name]) for name, convert in operation.fields])
+    except (ValueError, TypeError):
+        return None
+
+
+def _release(elem: Any) -> None:
+    """Descartar o elemento já convertido e os irmãos anteriores"""
+    elem.clear()
+    parent = elem.getparent()
+    while elem.getprevious() is not None:
+        del parent[0]
+
+
+def _raise_fault(elem: Any) -> None:
+    raise Fault(elem.findtext("faultstring") or "SOAP Fault", code=elem.findtext("faultcode"))
+
+
+def iter_values(source: Any, operation: SoapOperation) -> Iterator[Tuple[Any, ...]]:
+    """Decodificar linhas da resposta incrementalmente, como tuplas de valores
+
+    ``source`` pode ser ``bytes`` ou um objeto de arquivo. Cada elemento de
+    linha é descartado logo após a conversão, mantendo a memória constante.
+    Linhas com campos inválidos são ignoradas, como no caminho zeep.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    fault_tag = f"{{{SOAP_ENV_NS}}}Fault"
+    for _, elem in etree.iterparse(source, events=("end",), tag=("{*}" + operation.row_tag, fault_tag)):
+        if elem.tag == fault_tag:
+            _raise_fault(elem)
+        row = _row_values(elem, operation)
+        _release(elem)
+        if row is not None:
+            yield row
+
+
+class StreamDecoder:
+    """Decodificador alimentado por blocos (corpo HTTP em streaming)
+
+    Mesma conversão de ``iter_values``, mas recebe os bytes aos poucos via
+    ``feed``; a memória fica limitada a um bloco mais a linha em construção.
+    """
+
+    def __init__(self, operation: SoapOperation):
+        self.operation = operation
+        self._fault_tag = f"{{{SOAP_ENV_NS}}}Fault"
+        self._parser = etree.XMLPullParser(events=("end",), tag=("{*}" + operation.row_tag, self._fault_tag))
+
+    def feed(self, chunk: bytes) -> Iterator[Tuple[Any, ...]]:
+        """Alimentar um bloco e produzir as linhas completadas por ele"""
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> Iterator[Tuple[Any, ...]]:
+        """Finalizar o documento e produzir as linhas restantes"""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> Iterator[Tuple[Any, ...]]:
+        for _, elem in self._parser.read_events():
+            if elem.tag == self._fault_tag:
+                _raise_fault(elem)
+            row = _row_values(elem, self.operation)
+            _release(elem)
+            if row is not None:
+                yield row
+
+
+def iter_rows(source: Any, operation: SoapOperation, factory: Callable[..., Any]) -> Iterator[Any]:
+    """Decodificar linhas da resposta chamando ``factory`` por linha"""
+    for values in iter_values(source, operation):
+        yield factory(*values)
+
+
+def decode_into(source: Any, operation: SoapOperation, add: Callable[..., None]) -> None:
+    """Decodificar a resposta entregando cada linha a ``add`` (ex.: contêiner colunar)"""
+    for values in iter_values(source, operation):
+        add(*values)
@@ -0,0 +1,101 @@
+"""
+Decodificação incremental das respostas de listagem
+JSON (REST/GraphQL) via ijson e mensagens protobuf (gRPC) lidas campo a campo,
+entregando uma linha por vez sem materializar a resposta inteira
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Iterator, Optional, Tuple
+
+import ijson
+from ijson.utils import coroutine
+
+_backend = ijson.get_backend(ijson.backend)
+
+
+@coroutine
+def _route_events(target: Any, errors_target: Any, errors_root: str) -> Any:
+    """Encaminhar os eventos sob ``errors_root`` a ``errors_target`` e os demais a ``target``"""
+    nested = errors_root + "."
+    while True:
+        event = yield
+        prefix = event[0]
+        if prefix == errors_root or prefix.startswith(nested):
+            errors_target.send(event)
+        else:
+            target.send(event)
+
+
+async def iter_json_items(
+    chunks: AsyncIterable[bytes],
+    prefix: str,
+    errors_prefix: Optional[str] = None,
+) -> AsyncIterator[Any]:
+    """Produzir os itens JSON sob ``prefix`` à medida que os bytes chegam
+
+    Com ``errors_prefix``, os itens de erro (ex.: ``errors.item`` do GraphQL)
+    são coletados do mesmo fluxo de eventos (uma única passada do
+    analisador) e lançados ao fim do documento. A memória fica limitada a
+    um bloco da resposta mais os itens ainda não consumidos.
+    """
+    items = ijson.sendable_list()
+    target = _backend.items_basecoro(items, prefix)
+    errors = ijson.sendable_list()
+    if errors_prefix:
+        errors_target = _backend.items_basecoro(errors, errors_prefix)
+        target = _route_events(target, errors_target, errors_prefix.split(".", 1)[0])
+    parser = _backend.basic_parse_basecoro(_backend.parse_basecoro(target), use_float=True)
+
+    async for chunk in chunks:
+        parser.send(chunk)
+        for item in items:
+            yield item
+        del items[:]
+
+    parser.close()
+    for item in items:
+        yield item
+    if errors:
+        first = errors[0]
+        message = first.get("message") if isinstance(first, dict) else first
+        raise Exception(f"GraphQL error: {message}")
+
+
+def _read_varint(data: memoryview, pos: int) -> Tuple[int, int]:
+    """Ler varint protobuf a partir de ``pos``; retornar (valor, nova posição)"""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def iter_repeated_messages(payload: bytes, field_number: int, message_type: Any) -> Iterator[Any]:
+    """Decodificar, um por vez, os elementos de um campo repetido de mensagens
+
+    Percorre o formato de fio da mensagem externa sem desserializá-la inteira:
+    cada elemento é convertido com ``message_type.FromString`` e pode ser
+    descartado antes do próximo. Outros campos são ignorados.
+    """
+    data = memoryview(payload)
+    end = len(data)
+    pos = 0
+    while pos < end:
+        key, pos = _read_varint(data, pos)
+        wire_type = key & 0x7
+        if wire_type == 2:
+            length, pos = _read_varint(data, pos)
+            if key >> 3 == field_number:
+                yield message_type.FromString(data[pos:pos + length])
+            pos += length
+        elif wire_type == 0:
+            _, pos = _read_varint(data, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"Tipo de fio protobuf não suportado: {wire_type}")
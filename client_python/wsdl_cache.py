@@ -0,0 +1,137 @@
+"""
+Cache persistente de WSDL/schemas para o cliente SOAP
+Evita baixar os WSDLs a cada novo processo
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Union
+
+from zeep.cache import Base
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "music_streaming_client" / "wsdl"
+
+
+class WsdlCacheMissError(RuntimeError):
+    """WSDL ausente do cache em modo offline"""
+
+
+class WsdlCache(Base):
+    """Cache em disco de documentos WSDL/XSD, indexado por URL e hash do conteúdo
+
+    Cada documento é gravado uma única vez como ``<sha256>.xml``; o arquivo
+    ``index.json`` associa cada URL ao hash atual e ao instante da última
+    validação. Entradas mais antigas que ``ttl`` são revalidadas baixando o
+    documento de novo: com ``fetch``, pelo próprio cache, que devolve a cópia
+    antiga se o download falhar (a URL fica em ``stale`` até a próxima
+    revalidação bem-sucedida); sem ``fetch``, pelo transporte do zeep, quando
+    ``get`` retorna ``None``. Em modo offline o cache nunca expira e uma
+    ausência é um erro.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = 3600,
+        offline: bool = False,
+        fetch: Optional[Callable[[str], bytes]] = None,
+    ):
+        """Inicializar cache no diretório informado"""
+        self.path = Path(path) if path else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.offline = offline
+        self.fetch = fetch
+        self.stale: Set[str] = set()  # URLs servidas com a cópia antiga após falha na revalidação
+        self.stale_hits = 0
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    # ==================== Interface zeep ====================
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Obter documento do cache (None força download/revalidação)"""
+        with self._lock:
+            entry = self._read_index().get(url)
+        content = self._read_blob(entry["sha256"]) if entry else None
+
+        if content is None:
+            if self.offline:
+                raise WsdlCacheMissError(f"WSDL não encontrado no cache (modo offline): {url}")
+            return None
+
+        if self.offline or self.ttl is None:
+            return content
+        if time.time() - entry["validated_at"] < self.ttl:
+            return content
+        if self.fetch is None:
+            return None
+        try:
+            fresh = self.fetch(url)
+        except Exception:
+            # Servidor indisponível: seguir com a cópia antiga e tentar de novo na próxima vez
+            with self._lock:
+                self.stale.add(url)
+                self.stale_hits += 1
+            return content
+        self.add(url, fresh)
+        return fresh
+
+    def add(self, url: str, content: bytes) -> None:
+        """Gravar documento baixado e marcar a URL como validada"""
+        digest = hashlib.sha256(content).hexdigest()
+        blob = self.path / f"{digest}.xml"
+        if not blob.exists():
+            self._atomic_write(blob, content)
+
+        with self._lock:
+            index = self._read_index()
+            index[url] = {"sha256": digest, "validated_at": time.time()}
+            self._atomic_write(self.path / self.INDEX_FILE, json.dumps(index, indent=2).encode())
+            self.stale.discard(url)
+
+    # ==================== Utilitários ====================
+
+    def clear(self) -> None:
+        """Remover todos os documentos do cache"""
+        with self._lock:
+            for item in self.path.iterdir():
+                if item.suffix in (".xml", ".json"):
+                    item.unlink()
+
+    def _read_index(self) -> Dict[str, Dict]:
+        """Ler índice URL -> hash"""
+        try:
+            with open(self.path / self.INDEX_FILE, "rb") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        """Ler documento pelo hash, descartando arquivos corrompidos"""
+        try:
+            content = (self.path / f"{digest}.xml").read_bytes()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(content).hexdigest() != digest:
+            return None
+        return content
+
+    def _atomic_write(self, target: Path, content: bytes) -> None:
+        """Gravar arquivo de forma atômica (seguro entre processos)"""
+        fd, tmp = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(content)
+            os.replace(tmp, target)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise